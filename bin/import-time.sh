@@ -0,0 +1,34 @@
+#!/bin/bash
+
+# Root directory
+cd "$( dirname "$( realpath "$0" )" )/../src" || exit 1
+
+# Parameters
+module="${1:-main}"   # the module to import, main by default
+count="${2:-25}"      # the number of the slowest modules to show
+
+# Main
+report="$( python3 -X importtime -c "import $module" 2>&1 >/dev/null )" || {
+  echo "$report"
+  exit 1
+}
+
+printf "%10s %10s  %s\n" "cumul. ms" "self ms" "module"
+
+echo "$report" \
+  | grep '^import time: *[0-9]' \
+  | awk -F '|' '{
+      sub(/^import time: */, "", $1)
+      name = $3
+      sub(/^ /, "", name)
+      printf "%10.1f %10.1f  %s\n", $2 / 1000, $1 / 1000, name
+    }' \
+  | sort -rn \
+  | head -n "$count"
+
+total="$( echo "$report" | tail -n 1 | awk -F '|' '{ print $2 / 1000 }' )"
+
+printf "\n"
+printf "total\t%s ms\n" "$total"
+
+exit 0
@@ -38,7 +38,8 @@ G.color_nodes_by(
             if G.nodes[v]["s"] == STATE_OPENED
             else "#57db5f" if G.nodes[v]["s"] == STATE_CLOSED else None
         )
-    )
+    ),
+    depends=lambda: observing,
 )
 G.label_nodes_by(prop="h")
 G.label_edges_by(prop="w")
@@ -5,4 +5,11 @@ All components
 from .loader import Loader
 from .runner import Runner
 from .sender import Sender
+from .encoder import Encoder
+from .compact_layout import CompactLayout
+from .frame_delta import FrameDelta
 from .logger import logger
+from .result_cache import ResultCache
+from .worker_pool import WorkerPool
+from .admission import Admission
+from .job_store import JobStore
@@ -0,0 +1,102 @@
+"""
+The admission component
+"""
+
+import math
+import threading
+
+
+class Admission:
+    """
+    Admission limits the number of the requests which run the algorithms at the
+    same time. At most `concurrency` requests run, at most `queue_size` requests
+    wait for a free slot (at most `timeout` seconds) and the other requests are
+    rejected right away - they should be answered by 429 Too Many Requests with
+    the Retry-After header (see get_retry_after).
+
+    Without the admission, a burst of requests piles up threads waiting for the
+    workers and all of them time out together.
+    """
+
+    def _take(self):
+        """
+        Takes a slot, see `acquire`. Returns False if the request is rejected.
+        """
+        with self._condition:
+            if self._running < self._concurrency:
+                self._running += 1
+                return True
+
+            if self._waiting >= self._queue_size:
+                return False
+
+            self._waiting += 1
+
+            try:
+                if not self._condition.wait_for(
+                    lambda: self._running < self._concurrency, self._timeout
+                ):
+                    return False
+
+                self._running += 1
+                return True
+
+            finally:
+                self._waiting -= 1
+
+    def acquire(self):
+        """
+        Takes a slot for the request. Blocks while the request is queued.
+
+        returns:
+          - release (callable|None): frees the slot - only the first call has an
+            effect, so it can be called by every code path which ends the
+            request. None if the request must be rejected (the queue is full or
+            the wait timed out).
+        """
+        if not self._take():
+            return None
+
+        released = [False]
+
+        def release():
+            with self._condition:
+                if not released[0]:
+                    released[0] = True
+                    self._running -= 1
+                    self._condition.notify()
+
+        return release
+
+    def get_retry_after(self):
+        """
+        Returns the number of seconds after which a rejected request should be
+        retried - the time it takes to run the queued requests
+
+        returns:
+          - seconds (int): the value of the Retry-After header
+        """
+        with self._condition:
+            rounds = (self._waiting + self._concurrency) / self._concurrency
+
+        return max(1, math.ceil(rounds * self._run_time))
+
+    def __init__(self, concurrency, queue_size, timeout, run_time):
+        """
+        Creates a new instance of Admission
+
+        parameters:
+          - concurrency (int): the maximum number of the running requests
+          - queue_size (int): the maximum number of the waiting requests
+          - timeout (float): the maximum time a request waits in seconds
+          - run_time (float): the expected time of a run in seconds, used by
+            get_retry_after
+        """
+        self._concurrency = concurrency
+        self._queue_size = queue_size
+        self._timeout = timeout
+        self._run_time = run_time
+
+        self._condition = threading.Condition()
+        self._running = 0
+        self._waiting = 0
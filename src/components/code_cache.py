@@ -0,0 +1,118 @@
+"""
+The code cache component
+"""
+
+import marshal
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class CodeCache:
+    """
+    A bounded cache of the prepared code of the algorithms. The same code is
+    submitted over and over again (the examples, the regression jobs, ...), so
+    the loader does not have to prepare and compile it every time.
+
+    The entries are keyed by the hash of the submitted code (see CodeCache.key)
+    and hold the prepared wrapper source and its compiled code object (None
+    until the code is compiled). When the cache is full, the least recently used
+    entry is evicted.
+
+    Every process has its own cache. The entries can be exported (see `dump`)
+    and loaded to the cache of another process (see `load`) - the code objects
+    are marshalled. The code is only ever sent from the server to the workers,
+    never back (see Loader.precompile). The cache of the server is shared by the
+    threads serving the requests, so the entries are accessed under a lock.
+    """
+
+    @staticmethod
+    def key(code):
+        """
+        Returns the key of the submitted code
+
+        parameters:
+          - code (str): the code submitted by the user
+
+        returns:
+          - key (str): the hex digest of the code
+        """
+        return hashlib.blake2b(code.encode("utf8"), digest_size=16).hexdigest()
+
+    def get(self, key):
+        """
+        Returns the entry with the specified key and marks it as recently used
+
+        parameters:
+          - key (str): the key of the submitted code
+
+        returns:
+          - entry (tuple|None): the prepared source and the compiled code (or
+            None), None if the code is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def put(self, key, source, code=None):
+        """
+        Caches the prepared source and the compiled code
+
+        parameters:
+          - key (str): the key of the submitted code
+          - source (str): the prepared wrapper source
+          - code (code): the compiled code of the source or None
+        """
+        with self._lock:
+            self._entries[key] = (source, code)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._size:
+                self._entries.popitem(last=False)
+
+    def dump(self, key):
+        """
+        Returns the entry in a form which can be sent to another process (None
+        if the entry is missing or not compiled)
+
+        parameters:
+          - key (str): the key of the submitted code
+
+        returns:
+          - dumped (tuple|None): the key, the source and the marshalled code
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None or entry[1] is None:
+            return None
+
+        return key, entry[0], marshal.dumps(entry[1])
+
+    def load(self, dumped):
+        """
+        Caches the entry returned by `dump` (in another process)
+
+        parameters:
+          - dumped (tuple): the key, the source and the marshalled code
+        """
+        key, source, code = dumped
+        self.put(key, source, marshal.loads(code))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __init__(self, size):
+        """
+        Creates a new instance of CodeCache
+
+        parameters:
+          - size (int): the maximum number of the entries
+        """
+        self._size = size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
@@ -0,0 +1,147 @@
+"""
+The compact layout component
+"""
+
+from engine.color import Color
+
+
+class CompactLayout:
+    """
+    The compact layout of the frames. The frames of a response repeat the same
+    nodes, edges and colors over and over again - in the compact layout they are
+    stored once per response in the following tables:
+      - ids: the node identifiers
+      - edges: the edges as pairs of indices into `ids`
+      - colors: the colors (long hex or the color returned by the algorithm)
+
+    The components of the frames then refer to the tables by indices:
+      - nodes: the list of indices into `ids`
+      - edges: the list of indices into `edges`
+      - node_* styles: the list of the styles in the order of `nodes`
+      - edge_* styles: the list of the styles in the order of `edges`
+      - *_colors styles: the indices into `colors` (null stays null)
+
+    The layout is negotiated by the Accept header, see MIMETYPE.
+    """
+
+    MIMETYPE = "application/vnd.syga.compact+json"
+
+    def _index(self, table, lookup, item, key):
+        """
+        Returns the index of the item in the table. The item is appended to the
+        table if it is not there yet.
+        """
+        index = lookup.get(key)
+
+        if index is None:
+            index = len(table)
+
+            lookup[key] = index
+            table.append(item)
+
+        return index
+
+    def _node(self, node):
+        """
+        Returns the index of the node identifier. The type is a part of the key,
+        so that for example 1 and True are not mixed up.
+        """
+        return self._index(self._ids, self._id_lookup, node, (type(node), node))
+
+    def _edge(self, u, v):
+        """
+        Returns the index of the edge
+        """
+        edge = [self._node(u), self._node(v)]
+        return self._index(self._edges, self._edge_lookup, edge, tuple(edge))
+
+    def _color(self, color):
+        """
+        Returns the index of the color (None stays None)
+        """
+        if color is None:
+            return None
+
+        if not isinstance(color, str):
+            color = Color.create(color).to_hex()  # Color or rgba tuple (list)
+
+        return self._index(self._colors, self._color_lookup, color, color)
+
+    def _style(self, name, style, nodes, edges):
+        """
+        Turns the style of a property into a list in the order of the nodes or
+        the edges of the component
+        """
+        if style is None:
+            return None
+
+        if name.startswith("node_"):
+            values = [style.get(v) for v in nodes]
+        elif name.startswith("edge_"):
+            values = [style.get(u, {}).get(v) for u, v in edges]
+        else:
+            return style
+
+        if name.endswith("_colors"):
+            return [self._color(value) for value in values]
+
+        return values
+
+    def _component(self, component):
+        """
+        Returns the compact layout of the style of a component
+        """
+        if component is None or "nodes" not in component:
+            return component
+
+        nodes = component["nodes"]
+        edges = component["edges"]
+
+        return {
+            "type": component["type"],
+            "nodes": [self._node(v) for v in nodes],
+            "edges": [self._edge(u, v) for u, v in edges],
+            "style": {
+                name: self._style(name, style, nodes, edges)
+                for name, style in component["style"].items()
+            },
+        }
+
+    def add_frame(self, frame):
+        """
+        Returns the compact layout of the frame. The tables are extended by the
+        nodes, edges and colors of the frame.
+
+        parameters:
+          - frame (Frame): the frame
+
+        returns:
+          - frame (dict): the frame referring to the tables
+        """
+        return {
+            "lineno": frame.lineno,
+            "console_logs": frame.console_logs,
+            "components": [self._component(comp) for comp in frame.components],
+        }
+
+    def get_tables(self):
+        """
+        Returns the tables which the frames added so far refer to.
+
+        returns:
+          - tables (dict): table name to table
+        """
+        return {"ids": self._ids, "edges": self._edges, "colors": self._colors}
+
+    def __init__(self):
+        """
+        Creates a new instance of CompactLayout with empty tables
+        """
+        self._ids = []
+        self._id_lookup = {}
+
+        self._edges = []
+        self._edge_lookup = {}
+
+        self._colors = []
+        self._color_lookup = {}
@@ -0,0 +1,148 @@
+"""
+The encoder component
+"""
+
+import json
+import math
+from array import array
+from engine.color import Color
+from engine.node_shape import NodeShape
+from engine.edge_shape import EdgeShape
+from engine.ticker.frame import Frame
+from engine.ticker.tick import Tick
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - the json module is used without it
+    orjson = None
+
+
+class Encoder:
+    """
+    Encoder turns the frames (and the debug ticks) into JSON in a single pass.
+    The custom types are converted only when the encoder reaches them:
+      - Frame, Tick --> dict
+      - Color --> long hex
+      - NodeShape, EdgeShape --> shape name
+      - array --> list (the columns of the transformed states, see TransformedColumn)
+
+    The frames are NOT modified. orjson is used if it is installed, the json
+    module otherwise. The json module is also used for the values orjson cannot
+    encode (for example integers larger than 64 bits). Both produce compact UTF-8
+    JSON and encode NaN and the infinities as null - they are not valid JSON.
+    """
+
+    @staticmethod
+    def default(obj):
+        """
+        Converts the object which is not JSON serializable by default.
+
+        raises:
+          - TypeError when the object cannot be converted
+
+        parameters:
+          - obj (any): the object reached by the encoder
+
+        returns:
+          - converted (any): JSON serializable value
+        """
+        if isinstance(obj, Color):
+            return obj.to_hex()
+
+        if isinstance(obj, (NodeShape, EdgeShape)):
+            return obj.shape
+
+        if isinstance(obj, (Frame, Tick)):
+            return dict(obj)
+
+        if isinstance(obj, array):
+            return obj.tolist()
+
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    @staticmethod
+    def encode(obj):
+        """
+        Encodes the object to JSON.
+
+        raises:
+          - TypeError when the object cannot be encoded
+
+        parameters:
+          - obj (any): the object to encode, may contain the custom types
+
+        returns:
+          - encoded (str): the JSON
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    obj, default=Encoder.default, option=orjson.OPT_NON_STR_KEYS
+                ).decode("utf8")
+            except TypeError:
+                pass  # Let the json module try (or raise the proper exception)
+
+        try:
+            return Encoder._dumps(obj)
+        except ValueError as e:
+            if "Out of range float" not in str(e):
+                raise
+
+        return Encoder._dumps(Encoder._finite(obj))
+
+    @staticmethod
+    def _dumps(obj):
+        """
+        Encodes the object by the json module, the same way as orjson does
+
+        raises:
+          - ValueError if the object contains NaN or an infinity
+        """
+        return json.dumps(
+            obj,
+            default=Encoder.default,
+            allow_nan=False,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+    @staticmethod
+    def _finite(obj):
+        """
+        Returns a copy of the object where NaN and the infinities are replaced by
+        None. The custom types are converted on the way.
+        """
+        if isinstance(obj, float):
+            return obj if math.isfinite(obj) else None
+
+        if isinstance(obj, dict):
+            return {key: Encoder._finite(value) for key, value in obj.items()}
+
+        if isinstance(obj, (list, tuple)):
+            return [Encoder._finite(value) for value in obj]
+
+        if isinstance(obj, (str, int, type(None))):
+            return obj
+
+        return Encoder._finite(Encoder.default(obj))
+
+    @staticmethod
+    def encode_dict(obj, encoded):
+        """
+        Encodes the dict and appends the members which have been encoded already,
+        so that big values do not have to be encoded again.
+
+        parameters:
+          - obj (dict): the members to encode
+          - encoded (dict): the members encoded by `encode`, name to JSON
+
+        returns:
+          - encoded (str): the JSON of the dict with all the members
+        """
+        head = Encoder.encode(obj)[:-1]
+        members = [f"{Encoder.encode(key)}:{value}" for key, value in encoded.items()]
+
+        if head != "{":
+            members.insert(0, head[1:])
+
+        return "{" + ",".join(members) + "}"
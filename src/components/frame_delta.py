@@ -0,0 +1,121 @@
+"""
+The frame delta component
+"""
+
+from engine.ticker.frame import Frame
+
+# Marks a missing key - None cannot be used, it is a valid style
+_MISSING = object()
+
+
+class FrameDelta:
+    """
+    Encodes the frames as deltas - only the first frame and every
+    KEYFRAME_INTERVAL-th frame (a keyframe) carry the whole components, so that
+    the frontend can seek. Every other frame carries only the changes of the
+    components since the previous frame:
+
+      - keyframe: {"keyframe": true, "lineno", "console_logs", "components"}
+      - delta: {"keyframe": false, "lineno", "console_logs", "set", "unset"}
+
+    `set` is a list of [path, value] pairs and `unset` is a list of paths of the
+    removed keys. A path is a list of keys starting with the index of the
+    component - arrays are indexed by numbers and objects by their keys as they
+    are (e.g. an int node id), while the same keys are strings in the JSON
+    objects, so the frontend has to look up the string form of such key. Lists
+    are replaced as a whole unless they have the same length and only a few items
+    changed.
+
+    Works with the regular frames as well as with the compact layout (see
+    CompactLayout).
+    """
+
+    KEYFRAME_INTERVAL = 50
+
+    @staticmethod
+    def _same(prev, curr):
+        """
+        Returns True if the two values are the same - True and 1 are different
+        styles, even though they are equal
+        """
+        return prev is curr or (type(prev) is type(curr) and prev == curr)
+
+    @staticmethod
+    def _diff(prev, curr, path, changed, removed):
+        """
+        Appends the changes between the previous and the current value to the
+        lists `changed` and `removed`.
+        """
+        if isinstance(prev, dict) and isinstance(curr, dict):
+            for key, value in curr.items():
+                old = prev.get(key, _MISSING)
+
+                if old is _MISSING:
+                    changed.append([path + [key], value])
+                else:
+                    FrameDelta._diff(old, value, path + [key], changed, removed)
+
+            removed.extend(path + [key] for key in prev if key not in curr)
+            return
+
+        if FrameDelta._same(prev, curr):
+            return
+
+        if isinstance(prev, list) and isinstance(curr, list) and len(prev) == len(curr):
+            items_changed, items_removed = [], []
+
+            for i, (old, value) in enumerate(zip(prev, curr)):
+                FrameDelta._diff(old, value, path + [i], items_changed, items_removed)
+
+            if len(items_changed) + len(items_removed) <= len(curr) // 2:
+                changed.extend(items_changed)
+                removed.extend(items_removed)
+                return
+
+        changed.append([path, curr])
+
+    def add_frame(self, frame):
+        """
+        Returns the next frame encoded either as a keyframe or as a delta.
+
+        parameters:
+          - frame (Frame|dict): the frame, a dict if in the compact layout
+
+        returns:
+          - frame (dict): the keyframe or the delta
+        """
+        if isinstance(frame, Frame):
+            frame = dict(frame)
+
+        prev = self._prev
+        components = frame["components"]
+
+        self._prev = components
+        self._count += 1
+
+        if (
+            prev is None
+            or (self._count - 1) % self.KEYFRAME_INTERVAL == 0
+            or len(prev) != len(components)
+        ):
+            return {"keyframe": True, **frame}
+
+        changed, removed = [], []
+
+        for i, (old, comp) in enumerate(zip(prev, components)):
+            FrameDelta._diff(old, comp, [i], changed, removed)
+
+        return {
+            "keyframe": False,
+            "lineno": frame["lineno"],
+            "console_logs": frame["console_logs"],
+            "set": changed,
+            "unset": removed,
+        }
+
+    def __init__(self):
+        """
+        Creates a new instance of FrameDelta
+        """
+        self._prev = None
+        self._count = 0
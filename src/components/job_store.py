@@ -0,0 +1,281 @@
+"""
+The job store component
+"""
+
+import os
+import json
+import shutil
+import datetime
+import itertools
+import tempfile
+import threading
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from utils.random_utils import random_name
+from .encoder import Encoder
+from .logger import logger
+from .sender import Sender
+
+
+class JobStore:
+    """
+    The store of the asynchronous runs (jobs). A job is submitted, run in the
+    background by the worker pool (the same pipeline as the synchronous runs,
+    see WorkerPool) and its response is then fetched - whole or just a range of
+    its frames. The pool of the jobs should not be shared with the synchronous
+    runs - the long jobs would take all the workers.
+
+    The job goes through the following states:
+      - queued: waiting for a thread of the store
+      - running: run by the worker pool
+      - finished: the response is stored (`res` says whether the run succeeded)
+
+    The responses are stored on the local disk - the frames one per line, so
+    that a range of frames can be read without decoding the whole response.
+    At most `max_jobs` finished jobs are kept, the oldest ones are removed.
+    """
+
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_FINISHED = "finished"
+
+    def submit(self, config, options):
+        """
+        Submits the job. The job is run as soon as a thread of the store is free.
+
+        parameters:
+          - config (dict): the JSON config of the algorithm
+          - options (dict): the options of the response, see Sender
+
+        returns:
+          - status (dict|None): the status of the new job, see `get`. None if the
+            job was rejected - too many jobs are unfinished.
+        """
+        with self._lock:
+            if self._pending >= self._max_pending:
+                return None
+
+            job_id = random_name()
+            self._pending += 1
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "status": self.STATUS_QUEUED,
+                "submitted": datetime.datetime.now().isoformat(),
+                "finished": None,
+                "res": None,
+                "frame_count": None,
+                "options": options,
+            }
+
+        self._executor.submit(self._run, job_id, config, options)
+
+        return self.get(job_id)
+
+    def _update(self, job_id, **changes):
+        """
+        Updates the status of the job
+        """
+        with self._lock:
+            self._jobs[job_id].update(changes)
+
+    def _run(self, job_id, config, options):
+        """
+        Runs the job and stores its response. The job is finished (and no longer
+        counted as pending) even if its response cannot be stored - it is then an
+        error without a result.
+        """
+        self._update(job_id, status=self.STATUS_RUNNING)
+
+        try:
+            response = self._pool.run(config, options, timeout=self._timeout)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("job: Exception", {"exception": traceback.format_exc()})
+            response = Sender(None).send_error(e)
+
+        res, frame_count = "error", 0
+
+        try:
+            res, frame_count = self._store(job_id, response)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("job: Exception", {"exception": traceback.format_exc()})
+            res, frame_count = self._store(job_id, Sender(None).send_error(e))
+        finally:
+            self._finish(job_id, res, frame_count)
+
+    def _finish(self, job_id, res, frame_count):
+        """
+        Marks the job as finished and removes the oldest finished jobs over the
+        limit
+        """
+        with self._lock:
+            self._pending -= 1
+            self._jobs[job_id].update(
+                status=self.STATUS_FINISHED,
+                finished=datetime.datetime.now().isoformat(),
+                res=res,
+                frame_count=frame_count,
+            )
+            self._finished.append(job_id)
+
+            removed = self._finished[: -self._max_jobs]
+            del self._finished[: -self._max_jobs]
+
+            for removed_id in removed:
+                del self._jobs[removed_id]
+
+        for removed_id in removed:
+            for path in self._paths(removed_id):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass  # The response of the job was never stored
+
+    def _paths(self, job_id):
+        """
+        Returns the paths of the files with the response of the job - the members
+        without the frames and the frames, one per line
+        """
+        return (
+            os.path.join(self._directory, "{}.json".format(job_id)),
+            os.path.join(self._directory, "{}.frames".format(job_id)),
+        )
+
+    def _store(self, job_id, response):
+        """
+        Stores the response of the job
+
+        returns:
+          - res (str): the result of the run (success, mixed or error)
+          - frame_count (int): the number of the frames
+        """
+        members = json.loads(response)
+        frames = members.pop("frames", None) or []
+        members_path, frames_path = self._paths(job_id)
+
+        with open(frames_path, "w", encoding="utf8") as f:
+            for frame in frames:
+                f.write(Encoder.encode(frame))
+                f.write("\n")
+
+        with open(members_path, "w", encoding="utf8") as f:
+            f.write(Encoder.encode(members))
+
+        return members.get("res"), len(frames)
+
+    def get(self, job_id):
+        """
+        Returns the status of the job
+
+        parameters:
+          - job_id (str): the ID returned by `submit`
+
+        returns:
+          - status (dict|None): job_id, status, submitted, finished (timestamps),
+            res and frame_count (None until the job is finished). None if the
+            job does not exist.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+
+            if job is None:
+                return None
+
+            return {key: value for key, value in job.items() if key != "options"}
+
+    def get_options(self, job_id):
+        """
+        Returns the options of the response of the job (None if the job does not
+        exist)
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+
+            return None if job is None else job["options"]
+
+    def get_result(self, job_id, start=None, stop=None):
+        """
+        Returns the response of the finished job. If a range of the frames is
+        specified, only these frames are included - the range is then stored in
+        the member `frame_range` and the number of all the frames in the member
+        `frame_count`.
+
+        When the frames are sent as deltas (see FrameDelta), the range should
+        start at a keyframe.
+
+        parameters:
+          - job_id (str): the ID returned by `submit`
+          - start (int): the index of the first frame (0 if omitted)
+          - stop (int): the index after the last frame (all frames if omitted)
+
+        returns:
+          - response (str|None): the encoded JSON response, None if the job does
+            not exist (or has just been removed) or is not finished
+        """
+        job = self.get(job_id)
+
+        if job is None or job["status"] != self.STATUS_FINISHED:
+            return None
+
+        members_path, frames_path = self._paths(job_id)
+
+        try:
+            with open(members_path, "r", encoding="utf8") as f:
+                members = json.loads(f.read())
+
+            if start is not None or stop is not None:
+                start = start or 0
+                stop = job["frame_count"] if stop is None else stop
+
+                members["frame_range"] = [start, stop]
+                members["frame_count"] = job["frame_count"]
+
+            with open(frames_path, "r", encoding="utf8") as f:
+                frames = [
+                    line.rstrip("\n") for line in itertools.islice(f, start, stop)
+                ]
+
+        except FileNotFoundError:
+            return None  # Removed since the status was read
+
+        return Encoder.encode_dict(members, {"frames": "[" + ",".join(frames) + "]"})
+
+    def close(self):
+        """
+        Waits for the running jobs and removes all the stored responses
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def __init__(self, pool, max_jobs, max_pending, threads, timeout=None):
+        """
+        Creates a new instance of JobStore. The responses are stored in a new
+        temporary directory.
+
+        raises:
+          - ValueError: if `max_jobs` is less than 1
+
+        parameters:
+          - pool (WorkerPool): the pool which runs the jobs
+          - max_jobs (int): the maximum number of the finished jobs kept (at
+            least 1)
+          - max_pending (int): the maximum number of the unfinished jobs
+          - threads (int): the number of the jobs run at the same time
+          - timeout (float): the time limit of a job in seconds, the time limit of
+            the pool if omitted
+        """
+        if max_jobs < 1:
+            raise ValueError("At least one finished job must be kept")
+
+        self._pool = pool
+        self._max_jobs = max_jobs
+        self._max_pending = max_pending
+        self._timeout = timeout
+
+        self._directory = tempfile.mkdtemp(prefix="syga-jobs-")
+        self._executor = ThreadPoolExecutor(max_workers=threads)
+
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()
+        self._finished = []
+        self._pending = 0
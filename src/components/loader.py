@@ -3,12 +3,22 @@ Loader component
 """
 
 import json
-from environment import SECRET_PASSWORD
+from environment import (
+    SECRET_PASSWORD,
+    LOADER_MODE,
+    CODE_CACHE_SIZE,
+    PRECOMPILE_MAX_SIZE,
+    MAX_TICKS,
+    MAX_FRAMES,
+    MAX_BYTES,
+)
 from utils.path import path_from_root
 from utils.code import detect_indentation, add_indentation
 from utils.random_utils import random_name
 from exceptions import LoaderException
+from .code_cache import CodeCache
 from .logger import logger
+from .module_finder import ModuleFinder
 
 
 class Loader:
@@ -19,8 +29,23 @@ class Loader:
       - Prepare the unique module names for the user specified algorithm
       - Prepare the code specified by the user (add function definition, ...)
       - Create the module which holds the user specified algorithm
+
+    The module is created in one of the following modes:
+      - memory: the code is compiled under a synthetic file name and imported
+        from memory (see ModuleFinder)
+      - disk: the code is written to src/__algs/<uid>.py
     """
 
+    MODE_MEMORY = "memory"
+    MODE_DISK = "disk"
+
+    # The name of the wrapper function - the same for all the algorithms, so
+    # that the prepared code does not depend on the module (see CodeCache)
+    WRAPPER_NAME = "algorithm"
+
+    # The prepared code of the algorithms run by this process
+    code_cache = CodeCache(CODE_CACHE_SIZE)
+
     def set_input(self, cfg):
         """
         Sets the raw user JSON config input
@@ -29,6 +54,28 @@ class Loader:
 
         return self
 
+    def _get_positive_int(self, name, default):
+        """
+        Returns the value of the config property which must be a positive integer
+        (or the default value if the property is missing)
+
+        raises:
+         - LoaderException: if the value is not a positive integer
+        """
+        if name not in self._cfg:
+            return default
+
+        value = self._cfg[name]
+
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise LoaderException(
+                "Invalid value of `{}` property - must be a positive integer".format(
+                    name
+                )
+            )
+
+        return value
+
     def parse_cfg(self):
         """
         Parses the input config JSON
@@ -52,6 +99,29 @@ class Loader:
                 else:
                     raise LoaderException("Invalid value of `secret` property")
 
+            if "sampling" in self._cfg:
+                # The engine imports the components - import it here
+                # pylint: disable-next=import-outside-toplevel
+                from engine.engine import Engine
+
+                if self._cfg["sampling"] not in Engine.SAMPLING_POLICIES:
+                    raise LoaderException("Invalid value of `sampling` property")
+
+                self.sampling = self._cfg["sampling"]
+
+            self.sampling_budget = self._get_positive_int("sampling_budget", None)
+
+            # The budgets can only be lowered, see environment.py
+            self.max_ticks = min(
+                self._get_positive_int("max_ticks", MAX_TICKS), MAX_TICKS
+            )
+            self.max_frames = min(
+                self._get_positive_int("max_frames", MAX_FRAMES), MAX_FRAMES
+            )
+            self.max_bytes = min(
+                self._get_positive_int("max_bytes", MAX_BYTES), MAX_BYTES
+            )
+
             logger.info("Parsing cfg: success")
 
             return self
@@ -64,60 +134,156 @@ class Loader:
             logger.error("Parsing cfg: error")
             raise LoaderException("Error parsing cfg")
 
+    @classmethod
+    def _wrap(cls, code):
+        """
+        Returns the wrapper source of the submitted code (see prepare_code)
+
+        raises:
+         - LoaderException: if the indentation of the code is inconsistent
+        """
+        try:
+            indentation = detect_indentation(code)
+
+            # If there is no indentation (no if, for, while blocks), use 2
+            if indentation == 0:
+                indentation = 2
+
+            code += '\nprint("That\'s all, folks!")'
+
+            return "def {}(engine, print):\n{}".format(
+                cls.WRAPPER_NAME, add_indentation(code, indentation)
+            )
+
+        except IndentationError:
+            raise LoaderException("Indentation error")
+
+    @staticmethod
+    def _memory_path(key):
+        """
+        Returns the synthetic file name of the module with the code in the memory
+        mode
+        """
+        return "<algorithm {}>".format(key)
+
+    @classmethod
+    def precompile(cls, cfg):
+        """
+        Prepares and compiles the code of the config in this process and returns
+        it in the form which can be loaded to the code cache of a worker process
+        (see CodeCache.dump), so that the worker does not compile it again. The
+        code is compiled from the submitted source under its own key - the worker
+        never sends any code back.
+
+        None is returned in the disk mode, if the code is longer than
+        PRECOMPILE_MAX_SIZE and if the compilation fails for any reason - the
+        worker then compiles the code itself (within the limits of the worker) and
+        reports the error when loading it.
+
+        parameters:
+          - cfg (dict): the raw user JSON config input
+
+        returns:
+          - dumped (tuple|None): the code, see CodeCache.load
+        """
+        code = cfg.get("code") if isinstance(cfg, dict) else None
+
+        if LOADER_MODE != cls.MODE_MEMORY or not isinstance(code, str) or not code:
+            return None
+
+        if len(code) > PRECOMPILE_MAX_SIZE:
+            return None
+
+        key = CodeCache.key(code)
+        cached = cls.code_cache.get(key)
+
+        if cached is None or cached[1] is None:
+            try:
+                source = cls._wrap(code)
+                compiled = compile(source, cls._memory_path(key), "exec")
+            except Exception:  # pylint: disable=broad-except
+                return None
+
+            cls.code_cache.put(key, source, compiled)
+
+        return cls.code_cache.dump(key)
+
     def generate_name(self):
         """
         Generates the unique name of the module. If running in admin mode (by
         providing correct secret in the config JSON, an uid can be specified.
         Otherwise a random 32 bytes [0-9a-f] will be generated and prefixed with
         an underscore (_) and used as the unique name.
+
+        In the memory mode, the synthetic file name of the module is given by the
+        code, so that the compiled code can be cached (see CodeCache).
         """
+        self._key = CodeCache.key(self._cfg["code"])
+
         if self._admin_access and "uid" in self._cfg:
             self.unique_id = self._cfg["uid"]
         else:
             self.unique_id = "_{}".format(random_name())
 
         self.module_name = "{}.{}".format("__algs", self.unique_id)
-        self.module_path = "{}.py".format(path_from_root("__algs", self.unique_id))
+
+        if self._mode == self.MODE_DISK:
+            self.module_path = "{}.py".format(path_from_root("__algs", self.unique_id))
+        else:
+            self.module_path = self._memory_path(self._key)
 
         return self
 
     def prepare_code(self):
         """
         Prepares the user specified code to be run be the runner component.
-        Wraps the code inside of a unique method which receives these arguments:
+        Wraps the code inside of a method (WRAPPER_NAME) which receives these
+        arguments:
          - engine: the engine component
          - print: the overloaded print function which dumps the output to a list
            stored in the engine
 
+        The code prepared (and compiled) before is taken from the code cache.
+
         raises:
          - LoaderException: if the indentation of the code is inconsistent
         """
-        try:
-            code = self._cfg["code"]
-            indentation = detect_indentation(code)
-
-            # If there is no indentation (no if, for, while blocks), use 2
-            if indentation == 0:
-                indentation = 2
+        cached = self.code_cache.get(self._key)
 
-            code += '\nprint("That\'s all, folks!")'
+        if cached is not None:
+            self._code, self._compiled = cached
+            return self
 
-            self._code = "def {}(engine, print):\n{}".format(
-                self.unique_id, add_indentation(code, indentation)
-            )
+        self._code = self._wrap(self._cfg["code"])
+        self._compiled = None
 
-            return self
+        self.code_cache.put(self._key, self._code)
 
-        except IndentationError:
-            raise LoaderException("Indentation error")
+        return self
 
     def create_module(self):
         """
         Creates the module which holds the user specified code
 
         raises:
-         - LoaderException: if it is impossible to write to the designated file
+         - LoaderException: if it is impossible to write to the designated file or
+           the code cannot be compiled (in the memory mode)
         """
+        if self._mode == self.MODE_MEMORY:
+            if self._compiled is None:
+                try:
+                    self._compiled = compile(self._code, self.module_path, "exec")
+                except (SyntaxError, ValueError) as e:
+                    logger.error("Creating module: error", {"module": self.module_name})
+                    raise LoaderException(e)
+
+                self.code_cache.put(self._key, self._code, self._compiled)
+
+            ModuleFinder.get().add(self.module_name, self._compiled, self._code)
+            logger.info("Creating module: success", {"module": self.module_name})
+
+            return self
+
         try:
             with open(self.module_path, "w", encoding="utf8") as f:
                 f.write(self._code)
@@ -130,6 +296,17 @@ class Loader:
             logger.error("Creating module: error", {"module": self.module_name})
             raise LoaderException()
 
+    def unload(self):
+        """
+        Removes the module created by the loader from sys.modules (and from the
+        memory in the memory mode), so that a reused worker does not keep it.
+        Calling this method more than once has no effect.
+        """
+        if self.module_name is not None:
+            ModuleFinder.get().remove(self.module_name)
+
+        return self
+
     def load(self):
         """
         Prepares the module which can be run by the runner component from the user
@@ -142,18 +319,33 @@ class Loader:
 
         return self
 
-    def __init__(self):
+    def __init__(self, mode=None):
         """
         Creates a new instance of Loader
 
         parameters:
-         - cfg (str): the JSON config input
+         - mode (str): `memory` or `disk`, LOADER_MODE if omitted
         """
+        self._mode = LOADER_MODE if mode is None else mode
+
         self.unique_id = None
         self.module_name = None
+        # The file of the module - the synthetic file name in the memory mode
         self.module_path = None
 
+        # The tick sampling policy, see Engine.SAMPLING_POLICIES (None keeps the
+        # default policy of the engine)
+        self.sampling = None
+        self.sampling_budget = None
+
+        # The budgets of the run, see BudgetException
+        self.max_ticks = MAX_TICKS
+        self.max_frames = MAX_FRAMES
+        self.max_bytes = MAX_BYTES
+
         self._cfg = None
+        self._key = None
         self._code = None
+        self._compiled = None
 
         self._admin_access = False
@@ -0,0 +1,102 @@
+"""
+The module finder component
+"""
+
+import sys
+import linecache
+import importlib.abc
+import importlib.util
+
+
+class ModuleFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """
+    Imports the modules of the visualized algorithms from memory. The loader
+    component compiles the code of the algorithm under a synthetic file name and
+    adds the code object to the finder - the module is then imported by the
+    regular import system (importlib.import_module), but nothing is read from or
+    written to the disk.
+
+    The source code is registered in linecache under the synthetic file name, so
+    that the tracebacks and the tracer can still show the lines.
+
+    Only one instance is needed, see ModuleFinder.get.
+    """
+
+    _instance = None
+
+    @staticmethod
+    def get():
+        """
+        Returns the finder installed in sys.meta_path. The finder is installed on
+        the first call.
+
+        returns:
+          - finder (ModuleFinder)
+        """
+        if ModuleFinder._instance is None:
+            ModuleFinder._instance = ModuleFinder()
+            sys.meta_path.insert(0, ModuleFinder._instance)
+
+        return ModuleFinder._instance
+
+    def add(self, name, code, source):
+        """
+        Adds the module which can be imported then.
+
+        parameters:
+          - name (str): the full name of the module
+          - code (code): the code of the module compiled by `compile`
+          - source (str): the source code of the module
+        """
+        self._codes[name] = code
+
+        linecache.cache[code.co_filename] = (
+            len(source),
+            None,
+            source.splitlines(True),
+            code.co_filename,
+        )
+
+    def remove(self, name):
+        """
+        Removes the module - from the finder, from linecache and from sys.modules
+        if it has been imported. Removing a missing module has no effect.
+
+        parameters:
+          - name (str): the full name of the module
+        """
+        code = self._codes.pop(name, None)
+
+        if code is not None:
+            linecache.cache.pop(code.co_filename, None)
+
+        sys.modules.pop(name, None)
+
+    def find_spec(self, fullname, path, target=None):  # pylint: disable=unused-argument
+        """
+        Returns the spec of the module if it has been added to the finder
+        """
+        if fullname not in self._codes:
+            return None
+
+        return importlib.util.spec_from_loader(
+            fullname, self, origin=self._codes[fullname].co_filename
+        )
+
+    def create_module(self, spec):
+        """
+        Returns None - the default module object is created
+        """
+        return None
+
+    def exec_module(self, module):
+        """
+        Executes the compiled code in the namespace of the module
+        """
+        exec(self._codes[module.__name__], module.__dict__)  # pylint: disable=exec-used
+
+    def __init__(self):
+        """
+        Creates a new instance of ModuleFinder. Use ModuleFinder.get instead.
+        """
+        self._codes = {}
@@ -0,0 +1,169 @@
+"""
+The result cache component
+"""
+
+import os
+import json
+import hashlib
+import networkx
+from utils.path import path_from_root
+from .logger import logger
+
+
+class ResultCache:
+    """
+    A cache of the encoded responses of the deterministic runs (see
+    Engine.mark_nondeterministic) stored on the local disk. The same config run
+    by the same engine produces the same frames, so the response can be sent
+    without running the algorithm at all.
+
+    The responses are keyed by the hash of
+      - the config and the options of the response (see Sender)
+      - the version of the engine - the hash of its source code and the version
+        of networkx, so that a new deployment does not send stale responses
+      - the hash seed of the process - the iteration order of the sets of
+        strings depends on it
+
+    Every response is stored in its own file. When the size of the files exceeds
+    the limit, the least recently used responses (by the modification time,
+    which is updated on every hit) are removed.
+    """
+
+    @staticmethod
+    def _get_version():
+        """
+        Returns the version of the engine - the hash of all the source files of
+        the app and the version of networkx
+        """
+        digest = hashlib.blake2b(networkx.__version__.encode("utf8"), digest_size=16)
+        root = path_from_root()
+
+        for directory, dirs, files in sorted(os.walk(root)):
+            dirs[:] = sorted(d for d in dirs if d not in ("tests", "__algs"))
+
+            for name in sorted(files):
+                if name.endswith(".py"):
+                    with open(os.path.join(directory, name), "rb") as f:
+                        digest.update(f.read())
+
+        return digest.hexdigest()
+
+    def key(self, config, options):
+        """
+        Returns the key of the response
+
+        parameters:
+          - config (dict): the JSON config of the algorithm
+          - options (dict): the options of the response
+
+        returns:
+          - key (str): the hex digest
+        """
+        data = json.dumps(
+            {
+                "config": config,
+                "options": options,
+                "version": self._version,
+                "seed": hash("syga"),
+            },
+            sort_keys=True,
+            default=str,
+        )
+
+        return hashlib.blake2b(data.encode("utf8"), digest_size=16).hexdigest()
+
+    def _path(self, key):
+        """
+        Returns the path of the file with the response
+        """
+        return os.path.join(self._directory, "{}.json".format(key))
+
+    def get(self, key):
+        """
+        Returns the cached response and marks it as recently used
+
+        parameters:
+          - key (str): the key of the response, see `key`
+
+        returns:
+          - response (bytes|None): the encoded response, None if not cached
+        """
+        path = self._path(key)
+
+        try:
+            with open(path, "rb") as f:
+                response = f.read()
+
+            os.utime(path)
+        except OSError:
+            return None
+
+        logger.info("Result cache hit", {"key": key})
+
+        return response
+
+    def put(self, key, response):
+        """
+        Caches the response and removes the least recently used responses if the
+        cache is too big. Errors of the disk are logged, not raised - the cache
+        is just an optimization.
+
+        parameters:
+          - key (str): the key of the response, see `key`
+          - response (bytes): the encoded response
+        """
+        if len(response) > self._max_bytes:
+            return
+
+        path = self._path(key)
+        temp = "{}.{}.tmp".format(path, os.getpid())
+
+        try:
+            with open(temp, "wb") as f:
+                f.write(response)
+
+            os.replace(temp, path)
+            self._evict()
+        except OSError:
+            logger.error("Result cache error", {"key": key})
+
+    def _evict(self):
+        """
+        Removes the least recently used responses until the size of the cache
+        fits the limit
+        """
+        entries = []
+        size = 0
+
+        with os.scandir(self._directory) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    size += stat.st_size
+
+        for _, entry_size, path in sorted(entries):
+            if size <= self._max_bytes:
+                break
+
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # Removed by another process
+
+            size -= entry_size
+
+    def __init__(self, directory, max_bytes):
+        """
+        Creates a new instance of ResultCache
+
+        parameters:
+          - directory (str): the directory of the cached responses (created if
+            it does not exist)
+          - max_bytes (int): the maximum size of the cached responses in bytes
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._version = self._get_version()
@@ -2,19 +2,20 @@
 The runner component
 """
 
+import types
 import importlib
-import hunter
 from environment import DEBUG_MODE
 from engine.engine import Engine
 from exceptions import RunnerException, AlgorithmException
 from .logger import logger
 from .loader import Loader
+from .tracer import Tracer
 
 
 class Runner:
     """
     Runner component receives the module which was prepared by the loader
-    component, imports it and prepares the code trackers (Hunter). A new instance
+    component, imports it and prepares the code tracer (see Tracer). A new instance
     of engine is then created and passed to the algorithm as an argument of the
     wrapper function
     """
@@ -39,30 +40,42 @@ class Runner:
     def run(self):
         """
         Runs the user provided algorithm by running the module created by the
-        loader component and initiates line tracing by the hunter library
+        loader component and initiates line tracing by the tracer
 
         raises:
           - RunnerException: if an error occurres while importing the module
           - AlgorithmException: if an error is raised while running the algorithm
         """
         module_name = self._loader.module_name
-        fun_name = self._loader.unique_id
+        fun_name = Loader.WRAPPER_NAME
 
         self.import_module()
 
-        q1 = hunter.Q(
-            module=module_name, kind="line", action=self._engine.line_callback
+        fun = getattr(self._module, fun_name)
+
+        # The algorithm runs with the builtins of the engine, so that the engine
+        # can detect the nondeterministic behavior (see Engine.get_builtins). The
+        # functions defined by the algorithm inherit them.
+        fun = types.FunctionType(
+            fun.__code__,
+            {**vars(self._module), "__builtins__": self._engine.get_builtins()},
+            fun.__name__,
         )
-        # In case of infinitely running code.
-        # The number has no science behind it. Just picked a number that seemed reasonable
-        q2 = hunter.Q(calls_gt=5000, action=hunter.Stop)
-        hunter.trace(q1 | q2)
 
-        fun = getattr(self._module, fun_name)
+        tracer = Tracer.create(self._engine.line_callback)
+        self._engine.set_tracer(tracer)
+        self._engine.set_max_ticks(self._loader.max_ticks)
+
+        if self._loader.sampling is not None:
+            self._engine.set_sampling(
+                self._loader.sampling, self._loader.sampling_budget
+            )
 
         logger.debug("Running <<<", {"module": module_name})
 
         self._engine.stopwatch.start()
+        self._engine.watch_random_state()
+        tracer.start(fun)
 
         try:
             fun(self._engine, self._engine.print)
@@ -74,6 +87,7 @@ class Runner:
             logger.debug(">>> error")
             raise AlgorithmException(e)
         finally:
+            tracer.stop()
             self._engine.stopwatch.stop()
 
     def make_frames(self):
@@ -82,6 +96,13 @@ class Runner:
         """
         return self._engine.make_frames()
 
+    def iter_frames(self):
+        """
+        Engine computes the visualization frames. The frames are yielded one by
+        one as soon as they are computed.
+        """
+        return self._engine.iter_frames()
+
     def get_ticks(self):
         """
         Returns all ticks generated by the ticker until this moment. This method
@@ -108,6 +129,36 @@ class Runner:
 
         return self._engine.get_logs()
 
+    def get_truncation(self):
+        """
+        Returns the reason why the ticks of the run were truncated, see
+        Engine.set_max_ticks
+
+        returns:
+          - truncation (BudgetException|None): the exceeded budget or None
+        """
+        return self._engine.get_truncation()
+
+    def get_frame_budget(self):
+        """
+        Returns the budgets of the frames sent, see Loader
+
+        returns:
+          - max_frames (int): the maximum number of frames
+          - max_bytes (int): the maximum size of the encoded frames in bytes
+        """
+        return self._loader.max_frames, self._loader.max_bytes
+
+    def is_deterministic(self):
+        """
+        Returns True if the run of the algorithm was deterministic, see
+        Engine.mark_nondeterministic
+
+        returns:
+          - deterministic (bool): whether the result of the run can be cached
+        """
+        return self._engine.is_deterministic()
+
     def get_elapsed_time(self):
         """
         Returns the amount of time elapsed during the execution of the visualized
@@ -6,10 +6,11 @@ import datetime
 import traceback
 import json
 from environment import DEBUG_MODE
-from engine.color import Color
-from engine.node_shape import NodeShape
-from engine.edge_shape import EdgeShape
 from engine.stopwatch import Stopwatch
+from exceptions import BudgetException
+from .compact_layout import CompactLayout
+from .encoder import Encoder
+from .frame_delta import FrameDelta
 from .logger import logger
 from .runner import Runner
 
@@ -17,31 +18,87 @@ from .runner import Runner
 class Sender:
     """
     Sender is used to send the result of the algorithm run. Provided frames are
-    parsed before to make sure they can be JSON encoded
+    encoded to JSON by the Encoder
+
+    If the run reached one of its budgets (see BudgetException), the frames sent
+    so far are a valid, but partial visualization - it is sent as a mixed
+    response (see send_mixed) with the flag `truncated`.
     """
 
-    def _parse_custom_types(self, obj):
+    @staticmethod
+    def _log_response(res, alg_time, parse_time, elapsed):
         """
-        Recursively turns all instances of Color into RGB tuples
+        Logs the result and the elapsed times of the response
         """
-        if isinstance(obj, NodeShape):
-            return obj.shape
+        logger.info("Sending {} response".format(res), {"res": res})
+        logger.info(
+            "Algorithm run in {:.6f} seconds".format(alg_time), {"time": alg_time}
+        )
+        logger.info(
+            "Response prepared in {:.6f} seconds".format(parse_time),
+            {"time": parse_time},
+        )
+        logger.info("Everything took {:.6f} seconds".format(elapsed), {"time": elapsed})
+
+    def _frames(self):
+        """
+        Yields the frames to send - in the compact layout and as deltas if the
+        options of the sender say so
+        """
+        for frame in self._runner.iter_frames():
+            if self._layout is not None:
+                frame = self._layout.add_frame(frame)
+
+            if self._delta is not None:
+                frame = self._delta.add_frame(frame)
 
-        if isinstance(obj, EdgeShape):
-            return obj.shape
+            yield frame
 
-        if isinstance(obj, Color):
-            return obj.to_hex()
+    def _encoded_frames(self):
+        """
+        Yields the encoded frames until the budget of the frames or of the bytes
+        is reached (see Runner.get_frame_budget). The frames are truncated at the
+        last frame which fits the budget.
+        """
+        max_frames, max_bytes = self._runner.get_frame_budget()
+        size = 0
 
-        if isinstance(obj, list):
-            for i in range(len(obj)):  # pylint: disable=consider-using-enumerate
-                obj[i] = self._parse_custom_types(obj[i])
+        for i, frame in enumerate(self._frames()):
+            if i >= max_frames:
+                self._truncate("{} frames".format(max_frames))
+                return
+
+            encoded = Encoder.encode(frame)
+            size += 1 + (
+                len(encoded) if encoded.isascii() else len(encoded.encode("utf8"))
+            )
 
-        elif isinstance(obj, dict):
-            for key, value in obj.items():
-                obj[key] = self._parse_custom_types(value)
+            if size > max_bytes:
+                self._truncate("{} bytes".format(max_bytes))
+                return
 
-        return obj
+            yield encoded
+
+    def _truncate(self, budget):
+        """
+        Marks the frames as truncated because of the specified budget (unless
+        they have been truncated already)
+        """
+        if self._truncation is None:
+            self._truncation = BudgetException(
+                "The visualization was truncated - the frames exceeded "
+                "the budget of {}".format(budget)
+            )
+
+    def _encode_tables(self):
+        """
+        Returns the encoded tables of the compact layout as a member of the
+        response (or no member if the compact layout is not used)
+        """
+        if self._layout is None:
+            return {}
+
+        return {"tables": Encoder.encode(self._layout.get_tables())}
 
     def _send_response(self, res, err=None):
         """
@@ -58,47 +115,43 @@ class Sender:
             # Get ticks only in debug mode
             ticks = None
             if DEBUG_MODE:
-                ticks = [dict(tick) for tick in self._runner.get_ticks()]
-
-            # Get all frames as dicts
-            frames = [dict(frame) for frame in self._runner.make_frames()]
+                ticks = self._runner.get_ticks()
 
             # Get engine logs only in debug mode
             # engine_logs = None
             # if DEBUG_MODE:
             #   engine_logs = self._runner.get_logs()
 
-            self._parse_custom_types(frames)
+            # The frames and ticks are encoded in a single pass, see Encoder
+            frames = "[" + ",".join(self._encoded_frames()) + "]"
+            ticks = Encoder.encode(ticks)
+
+            if self._truncation is not None and res == "success":
+                res, err = "mixed", self._truncation
 
             # Get elapsed times
             alg_time = self._runner.get_elapsed_time()
             parse_time = stopwatch.stop().elapsed
             elapsed = alg_time + parse_time
 
-            logger.info("Sending {} response".format(res), {"res": res})
-            logger.info(
-                "Algorithm run in {:.6f} seconds".format(alg_time), {"time": alg_time}
-            )
-            logger.info(
-                "Response prepared in {:.6f} seconds".format(parse_time),
-                {"time": parse_time},
-            )
-            logger.info(
-                "Everything took {:.6f} seconds".format(elapsed), {"time": elapsed}
-            )
+            self._log_response(res, alg_time, parse_time, elapsed)
 
-            return json.dumps(
+            return Encoder.encode_dict(
                 {
                     "timestamp": datetime.datetime.now().isoformat(),
                     "res": res,
                     "err": None if err is None else str(err),
+                    "truncated": self._truncation is not None,
                     "alg_time": alg_time,
                     "parse_time": parse_time,
                     "elapsed": elapsed,
+                },
+                {
                     "frames": frames,
+                    **self._encode_tables(),
                     "ticks": ticks,
-                    "engine_logs": None,  # temporarily disabled
-                }
+                    "engine_logs": "null",  # temporarily disabled
+                },
             )
 
         except Exception as sender_exception:  # pylint: disable=broad-except
@@ -130,7 +183,8 @@ class Sender:
 
     def send_mixed(self, err):
         """
-        Sends a mixed response
+        Sends a mixed response - the frames with an error, for example a partial
+        visualization (see BudgetException)
 
         parameters:
           - err (Exception): The exception raised during preparation or execution
@@ -139,12 +193,85 @@ class Sender:
 
     def send_success(self):
         """
-        Sends a success response
+        Sends a success response. If the visualization was truncated, a mixed
+        response is sent instead (see send_mixed).
         """
         return self._send_response("success")
 
-    def __init__(self, runner: Runner | None):
+    def stream_success(self):
+        """
+        Streams a success response. The response is the same JSON document as the
+        one sent by `send_success`, but it is yielded in parts as soon as they are
+        ready - the timestamp and the algorithm time first, then the frames one by
+        one as they are computed and the rest of the fields at the end.
+
+        If the frames cannot be computed, the error is sent in the trailing fields
+        `res` and `err` (the frames sent so far are kept). So is the truncation of
+        the visualization.
+
+        returns:
+          - chunks (generator<str>): the parts of the JSON response
+        """
+        stopwatch = Stopwatch().start()
+        alg_time = self._runner.get_elapsed_time()
+
+        res, err, ticks = "success", None, "null"
+
+        head = Encoder.encode_dict(
+            {"timestamp": datetime.datetime.now().isoformat(), "alg_time": alg_time},
+            {},
+        )
+        yield head[:-1] + ',"frames":['
+
+        try:
+            for i, frame in enumerate(self._encoded_frames()):
+                yield ("," if i else "") + frame
+
+            # Get ticks only in debug mode
+            if DEBUG_MODE:
+                ticks = Encoder.encode(self._runner.get_ticks())
+
+        except Exception as sender_exception:  # pylint: disable=broad-except
+            logger.error("Error in sender", {"error": traceback.format_exc()})
+            res, err = "error", str(sender_exception)
+
+        if self._truncation is not None and res == "success":
+            res, err = "mixed", str(self._truncation)
+
+        parse_time = stopwatch.stop().elapsed
+        elapsed = alg_time + parse_time
+
+        self._log_response(res, alg_time, parse_time, elapsed)
+
+        tail = Encoder.encode_dict(
+            {
+                "res": res,
+                "err": err,
+                "truncated": self._truncation is not None,
+                "parse_time": parse_time,
+                "elapsed": elapsed,
+            },
+            {
+                **self._encode_tables(),
+                "ticks": ticks,
+                "engine_logs": "null",  # temporarily disabled
+            },
+        )
+        yield "]," + tail[1:]
+
+    def __init__(self, runner: Runner | None, compact=False, delta=False):
         """
         Creates a new instance of Sender
+
+        parameters:
+          - runner (Runner|None): the runner of the algorithm (None for errors)
+          - compact (bool): whether to send the frames in the compact layout, see
+            CompactLayout
+          - delta (bool): whether to send the frames as deltas, see FrameDelta
         """
         self._runner = runner
+        self._layout = CompactLayout() if compact else None
+        self._delta = FrameDelta() if delta else None
+
+        # The exceeded budget, see BudgetException
+        self._truncation = None if runner is None else runner.get_truncation()
@@ -0,0 +1,287 @@
+"""
+The tracer component
+"""
+
+import sys
+import linecache
+import hunter
+from environment import TRACER_BACKEND
+from exceptions import RunnerException
+from .logger import logger
+
+# In case of infinitely running code.
+# The number has no science behind it. Just picked a number that seemed reasonable
+# What counts as a call depends on the backend, see Tracer
+MAX_TRACED_CALLS = 5000
+
+
+class TraceEvent:
+    """
+    A minimal line event passed to the line callback by the tracers which do not
+    produce events of their own. It mimics the attributes of the hunter Event
+    which are used by the engine:
+      - lineno: the number of the line
+      - fullsource: the source code of the line
+    """
+
+    @property
+    def fullsource(self):
+        """
+        Returns the source code of the line. The line is read lazily - it is only
+        needed in the debug mode.
+        """
+        return linecache.getline(self._filename, self.lineno)
+
+    def __init__(self, filename, lineno):
+        """
+        Creates a new instance of TraceEvent.
+
+        parameters:
+          - filename (str): the name of the file the line belongs to
+          - lineno (int): the number of the line
+        """
+        self._filename = filename
+        self.lineno = lineno
+
+
+class Tracer:
+    """
+    A tracer calls the line callback for every line executed in the code of the
+    visualized algorithm. This class is used as an abstract base for all tracer
+    backends:
+      - HunterTracer: traces using the hunter library, available everywhere
+      - MonitoringTracer: traces using sys.monitoring (PEP 669), Python 3.12+
+
+    The backend is picked by Tracer.create according to TRACER_BACKEND.
+
+    The tracing stops after MAX_TRACED_CALLS calls. The backends count the calls
+    differently:
+      - HunterTracer counts the calls of all Python functions - networkx and the
+        engine included
+      - MonitoringTracer counts the calls of the functions of the algorithm only
+
+    The same algorithm is therefore traced longer by MonitoringTracer - the
+    calls of the libraries do not use up the limit.
+    """
+
+    BACKEND_AUTO = "auto"
+    BACKEND_HUNTER = "hunter"
+    BACKEND_MONITORING = "monitoring"
+
+    @staticmethod
+    def create(callback, backend=None):
+        """
+        Creates a tracer using the specified backend. If the backend is `auto`,
+        sys.monitoring is used if available and hunter otherwise.
+
+        raises:
+          - RunnerException: if the backend is unknown or unavailable
+
+        parameters:
+          - callback (callable): called with the line event for every line
+          - backend (str): the name of the backend, TRACER_BACKEND if omitted
+
+        returns:
+          - tracer (Tracer)
+        """
+        if backend is None:
+            backend = TRACER_BACKEND
+
+        if backend == Tracer.BACKEND_AUTO:
+            backend = (
+                Tracer.BACKEND_MONITORING
+                if MonitoringTracer.is_available()
+                else Tracer.BACKEND_HUNTER
+            )
+
+        if backend == Tracer.BACKEND_HUNTER:
+            return HunterTracer(callback)
+
+        if backend == Tracer.BACKEND_MONITORING:
+            if not MonitoringTracer.is_available():
+                raise RunnerException("sys.monitoring is not available")
+
+            return MonitoringTracer(callback)
+
+        raise RunnerException("Unknown tracer backend: {}".format(backend))
+
+    def start(self, fun):
+        """
+        Starts tracing the lines of the specified function and of all the
+        functions defined within it.
+
+        parameters:
+          - fun (function): the wrapper function of the visualized algorithm
+        """
+        raise NotImplementedError()
+
+    def stop(self):
+        """
+        Stops tracing. Calling this method more than once has no effect.
+        """
+        raise NotImplementedError()
+
+    def __init__(self, callback):
+        """
+        Creates a new instance of Tracer.
+
+        parameters:
+          - callback (callable): called with the line event for every line
+        """
+        self._callback = callback
+
+
+class HunterTracer(Tracer):
+    """
+    Traces the lines using the hunter library. Hunter evaluates the predicate
+    for every event in every module, therefore this backend is slower than
+    MonitoringTracer. It is used as a fallback.
+    """
+
+    def start(self, fun):
+        """
+        Starts tracing the lines of the file which defines the function - the
+        module of the algorithm may have been created in memory (see Loader).
+        """
+        q1 = hunter.Q(
+            filename=fun.__code__.co_filename, kind="line", action=self._callback
+        )
+        q2 = hunter.Q(calls_gt=MAX_TRACED_CALLS, action=hunter.Stop)
+
+        self._tracer = hunter.trace(q1 | q2)
+
+    def stop(self):
+        """
+        Stops tracing.
+        """
+        if self._tracer is not None:
+            self._tracer.stop()
+            self._tracer = None
+
+    def __init__(self, callback):
+        """
+        Creates a new instance of HunterTracer.
+        """
+        super().__init__(callback)
+
+        self._tracer = None
+
+
+class MonitoringTracer(Tracer):
+    """
+    Traces the lines using sys.monitoring (PEP 669). The LINE events are enabled
+    only for the code object of the wrapper function and the code objects nested
+    in it (functions, lambdas, ...) - the code of all other modules (networkx,
+    the engine, ...) runs without any tracing overhead.
+
+    The number of calls of the traced functions is limited by MAX_TRACED_CALLS.
+    When the limit is exceeded, the tracing stops. Unlike HunterTracer, only the
+    calls of the traced functions are counted (see Tracer).
+    """
+
+    TOOL_NAME = "syga"
+
+    @staticmethod
+    def is_available():
+        """
+        Returns True if sys.monitoring is available (Python 3.12+)
+        """
+        return hasattr(sys, "monitoring")
+
+    @staticmethod
+    def _collect_code(code):
+        """
+        Returns the specified code object and all the code objects nested in it.
+
+        parameters:
+          - code (code): the code object
+
+        returns:
+          - codes (list<code>)
+        """
+        codes = [code]
+
+        for const in code.co_consts:
+            if isinstance(const, type(code)):
+                codes.extend(MonitoringTracer._collect_code(const))
+
+        return codes
+
+    def _line(self, code, lineno):
+        """
+        The LINE event callback. Same as hunter, the tracing stops if the line
+        callback raises an exception - the algorithm itself keeps running.
+        """
+        try:
+            self._callback(TraceEvent(code.co_filename, lineno))
+        except Exception:  # pylint: disable=broad-except
+            logger.error("Line callback failed, tracing stopped", {"line": lineno})
+            self.stop()
+
+    def _py_start(self, code, offset):  # pylint: disable=unused-argument
+        """
+        The PY_START event callback - counts the calls of the traced functions.
+        """
+        self._calls += 1
+
+        if self._calls > MAX_TRACED_CALLS:
+            self.stop()
+
+    def start(self, fun):
+        """
+        Starts tracing the lines of the wrapper function and of the functions
+        nested in it.
+
+        raises:
+          - RunnerException: if no sys.monitoring tool ID is free
+        """
+        monitoring = sys.monitoring
+        events = monitoring.events
+
+        for tool_id in (monitoring.DEBUGGER_ID, monitoring.PROFILER_ID):
+            if monitoring.get_tool(tool_id) is None:
+                break
+        else:
+            raise RunnerException("No free sys.monitoring tool ID")
+
+        monitoring.use_tool_id(tool_id, self.TOOL_NAME)
+        monitoring.register_callback(tool_id, events.LINE, self._line)
+        monitoring.register_callback(tool_id, events.PY_START, self._py_start)
+
+        self._tool_id = tool_id
+        self._codes = self._collect_code(fun.__code__)
+
+        for code in self._codes:
+            monitoring.set_local_events(tool_id, code, events.LINE | events.PY_START)
+
+        logger.debug("Tracing with sys.monitoring", {"tool": tool_id})
+
+    def stop(self):
+        """
+        Stops tracing and frees the sys.monitoring tool ID.
+        """
+        if self._tool_id is None:
+            return
+
+        monitoring = sys.monitoring
+        events = monitoring.events
+
+        for code in self._codes:
+            monitoring.set_local_events(self._tool_id, code, events.NO_EVENTS)
+
+        monitoring.register_callback(self._tool_id, events.LINE, None)
+        monitoring.register_callback(self._tool_id, events.PY_START, None)
+        monitoring.free_tool_id(self._tool_id)
+
+        self._tool_id = None
+        self._codes = []
+
+    def __init__(self, callback):
+        """
+        Creates a new instance of MonitoringTracer.
+        """
+        super().__init__(callback)
+
+        self._tool_id = None
+        self._codes = []
+        self._calls = 0
@@ -0,0 +1,565 @@
+"""
+The worker pool component
+"""
+
+import re
+import queue
+import resource
+import threading
+import time
+import traceback
+import multiprocess
+from exceptions import AlgorithmException, PoolBusyException
+from .logger import logger
+from .loader import Loader
+from .runner import Runner
+from .sender import Sender
+
+# The errors sent when the worker process exceeded the time or the memory limit
+TIME_LIMIT_MESSAGE = (
+    "Your code exceeded the allowed time limit to execute. "
+    "You have probably have some infinite loop or similar."
+)
+TERMINATED_MESSAGE = (
+    "Your code execution was terminated midway. "
+    "You most likely exceeded the memory limit."
+)
+
+# The default representation of an object (`<... at 0x7f...>`) holds its address,
+# which differs from run to run
+ADDRESS_PATTERN = re.compile(rb" at 0x[0-9a-fA-F]+")
+
+
+def _is_memory_error(error):
+    """
+    Returns True if the error is a MemoryError or wraps one (AlgorithmException,
+    RunnerException, ...)
+    """
+    return isinstance(error, MemoryError) or any(
+        isinstance(arg, MemoryError) for arg in getattr(error, "args", ())
+    )
+
+
+def _run_algorithm(loader, runner, config):
+    """
+    Loads and runs the algorithm specified by the config.
+
+    parameters:
+      - loader (Loader): a new loader
+      - runner (Runner): a new runner using the loader
+      - config (dict): the JSON config of the algorithm
+
+    returns:
+      - error (Exception|None): the exception raised by the loader or the runner
+    """
+    try:
+        loader.set_input(config)
+
+        # Prepare the module
+        loader.load()
+
+        # Run the module
+        runner.run()
+
+        logger.info("result: OK")
+        return None
+
+    except AlgorithmException as e:
+        logger.error(
+            "result: AlgorithmException", {"exception": traceback.format_exc()}
+        )
+        return e
+
+    except Exception as e:  # pylint: disable=broad-except
+        logger.error("result: Exception", {"exception": traceback.format_exc()})
+        return e
+
+
+def _send_response(conn, runner, error, stream, options):
+    """
+    Computes the frames and sends the encoded JSON response of the run (or the
+    error) followed by the empty chunk, see _work.
+
+    returns:
+      - recycle (bool): True if the frames exceeded the memory limit
+      - addresses (bool): True if the response holds an address of an object
+    """
+    recycle = False
+    addresses = False
+
+    try:
+        if error is not None:
+            conn.send_bytes(Sender(None).send_error(error).encode("utf8"))
+        elif stream:
+            for chunk in Sender(runner, **options).stream_success():
+                chunk = chunk.encode("utf8")
+                addresses = addresses or ADDRESS_PATTERN.search(chunk) is not None
+                conn.send_bytes(chunk)
+        else:
+            response = Sender(runner, **options).send_success().encode("utf8")
+            addresses = ADDRESS_PATTERN.search(response) is not None
+            conn.send_bytes(response)
+
+    except MemoryError as e:
+        if not stream:
+            conn.send_bytes(Sender(None).send_error(e).encode("utf8"))
+        recycle = True
+
+    conn.send_bytes(b"")
+
+    return recycle, addresses
+
+
+def _serve(conn, request):
+    """
+    Runs the algorithm of the request and sends the response, see _work
+
+    parameters:
+      - conn (Connection): the worker end of the pipe
+      - request (tuple): the config, the compiled code, whether to stream the
+        response and the options of Sender
+
+    returns:
+      - recycle (bool): True if the worker must be recycled
+    """
+    config, compiled, stream, options = request
+
+    if compiled is not None:
+        Loader.code_cache.load(compiled)
+
+    loader = Loader()
+    runner = Runner(loader)
+
+    error = _run_algorithm(loader, runner, config)
+    conn.send(None)
+
+    recycle, addresses = _send_response(conn, runner, error, stream, options)
+    recycle = recycle or _is_memory_error(error)
+
+    # The frames are computed by now - the stylizers could use the random
+    # generators too
+    deterministic = (
+        error is None and not recycle and not addresses and runner.is_deterministic()
+    )
+
+    # Release the ticks before the worker waits for the next config
+    del runner
+
+    conn.send((recycle, deterministic))
+
+    # The worker is reused - do not keep the module of the algorithm
+    loader.unload()
+
+    return recycle
+
+
+def _work(conn, max_memory_mb):
+    """
+    The main loop of a worker process. Receives the configs of the algorithms
+    (and the code compiled by the parent process, whether to stream the response
+    and the options of Sender) through the pipe. For every config, the worker
+      1. loads the compiled code to its code cache (see Loader.precompile) and
+         runs the algorithm and sends None once the run is over
+      2. computes the frames and sends the encoded JSON response as bytes - in
+         one chunk or, if streamed, in many chunks (see Sender.stream_success).
+         The chunks are followed by an empty chunk.
+      3. sends whether the worker must be recycled and whether the response can
+         be cached - nothing nondeterministic was detected in the run (see
+         Engine.is_deterministic) nor in the response (see ADDRESS_PATTERN)
+
+    The frames are computed here, so that neither the runner nor the ticks have
+    to be pickled and sent to the parent process.
+
+    The worker exits when it receives None, when the pipe is closed or after an
+    algorithm exceeded the memory limit.
+
+    parameters:
+      - conn (Connection): the worker end of the pipe
+      - max_memory_mb (int): the memory limit of the worker in MB
+    """
+    limit = max_memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+
+        if request is None or _serve(conn, request):
+            return
+
+
+class Worker:
+    """
+    A worker is a pre-forked process which runs the algorithms one after another.
+    The process is forked by the fork server (see WorkerPool) and inherits all the
+    modules imported by it (networkx, the engine, ...), so nothing has to be
+    imported when an algorithm is run.
+    """
+
+    def _start(self, config, stream, options, timeout):
+        """
+        Sends the config (and its code compiled by this process, see
+        Loader.precompile) to the worker process and waits until the algorithm
+        has been run.
+
+        raises:
+          - Exception: if the time limit was exceeded or the process died
+        """
+        self.runs += 1
+        self.pending = True
+        self.deterministic = False
+        self._conn.send((config, Loader.precompile(config), stream, options or {}))
+
+        self._deadline = time.monotonic() + timeout
+        self._wait()
+
+        try:
+            self._conn.recv()
+        except EOFError:
+            self.stop()
+            raise Exception(TERMINATED_MESSAGE)  # pylint: disable=raise-missing-from
+
+    def _wait(self):
+        """
+        Waits until the worker process sends the next message, at most until the
+        deadline of the run (see `run`). The process is stopped if it sends
+        nothing in time.
+
+        raises:
+          - Exception: if the time limit was exceeded
+        """
+        if not self._conn.poll(max(0, self._deadline - time.monotonic())):
+            self.stop()
+            raise Exception(TIME_LIMIT_MESSAGE)
+
+    def _receive(self):
+        """
+        Receives the chunks of the response until the empty chunk and then whether
+        the worker must be recycled. Every message must arrive before the
+        deadline of the run, otherwise the process is stopped. Whether the run was
+        deterministic is stored in `deterministic`.
+
+        raises:
+          - Exception: if the time limit was exceeded or the process died
+
+        returns:
+          - chunks (generator<bytes>): the chunks of the encoded JSON response
+        """
+        try:
+            while True:
+                self._wait()
+                chunk = self._conn.recv_bytes()
+
+                if not chunk:
+                    break
+
+                yield chunk
+
+            self._wait()
+            recycle, deterministic = self._conn.recv()
+        except EOFError:
+            self.stop()
+            raise Exception(TERMINATED_MESSAGE)  # pylint: disable=raise-missing-from
+
+        self.pending = False
+        self.deterministic = deterministic
+
+        if recycle:
+            self.stop()
+
+    def run(self, config, timeout, options=None):
+        """
+        Runs the algorithm specified by the config in the worker process. The run
+        of the algorithm and the computation of the whole response are limited
+        by the timeout together - the worker which takes too long to compute
+        the frames is stopped as well. The chunks which the worker has already
+        sent are received even after the deadline.
+
+        raises:
+          - Exception: if the time limit was exceeded or the process died
+
+        parameters:
+          - config (dict): the JSON config of the algorithm
+          - timeout (float): the time limit in seconds
+          - options (dict): the options of the response, see Sender
+
+        returns:
+          - response (bytes): the encoded JSON response, see Sender
+        """
+        self._start(config, False, options, timeout)
+
+        return b"".join(self._receive())
+
+    def stream(self, config, timeout, options=None):
+        """
+        The same as `run`, but the response is streamed - the chunks are yielded
+        as soon as the worker process computes them (see Sender.stream_success).
+        The worker is still busy (pending) until all the chunks have been received.
+
+        raises:
+          - Exception: if the time limit was exceeded or the process died
+
+        parameters:
+          - config (dict): the JSON config of the algorithm
+          - timeout (float): the time limit in seconds
+          - options (dict): the options of the response, see Sender
+
+        returns:
+          - chunks (generator<bytes>): the chunks of the encoded JSON response
+        """
+        self._start(config, True, options, timeout)
+
+        yield from self._receive()
+
+    def is_alive(self):
+        """
+        Returns True if the worker process is running
+        """
+        return self._process.is_alive()
+
+    def stop(self):
+        """
+        Stops the worker process. Calling this method more than once has no effect.
+        """
+        if self._process.is_alive():
+            self._process.terminate()
+
+        self._process.join()
+        self._conn.close()
+
+    def __init__(self, max_memory_mb, context):
+        """
+        Creates a new instance of Worker and starts the worker process.
+
+        parameters:
+          - max_memory_mb (int): the memory limit of the worker in MB
+          - context (BaseContext): the multiprocess context which starts the process
+        """
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(target=_work, args=(child_conn, max_memory_mb))
+        self._process.daemon = True
+        self._process.start()
+        child_conn.close()
+
+        self.runs = 0
+        self.pending = False
+        self.deterministic = False
+        self._deadline = None
+
+
+class WorkerPool:
+    """
+    A pool of pre-forked workers. Every algorithm is run by an idle worker taken
+    from the queue of idle workers. When the run is over, the worker is put back
+    to the queue. A worker is replaced by a fresh one when
+      - it has run `max_runs` algorithms
+      - an algorithm exceeded the time limit or the memory limit
+
+    The algorithms of different users share nothing but the modules of a reused
+    worker - an algorithm can monkeypatch networkx or the engine for the next one.
+    Unless the code is trusted, `max_runs` should be 1: every worker runs one
+    algorithm only, like a process forked for the request, but it is forked in
+    advance.
+
+    The workers are forked by the fork server - a single-threaded process which
+    imports the `preload` modules once - so that the threads of the server are
+    never forked. The replaced workers are stopped and the fresh workers started
+    by a dedicated thread, not by the requests.
+
+    If the pool has a result cache and a run opts in, the responses of the
+    deterministic runs are cached and the cached responses are sent without
+    taking a worker at all. The detection of the nondeterminism is best effort,
+    so the caching is opt-in per run. Only the first run of a worker is cached -
+    a reused worker could have been tampered with by the previous algorithm.
+    """
+
+    def _get_cached(self, config, options, cache):
+        """
+        Returns the key of the response and the cached response (None if the
+        response is not cached). The key is None if there is no result cache or
+        the run has not opted in.
+        """
+        if self._result_cache is None or not cache:
+            return None, None
+
+        key = self._result_cache.key(config, options)
+
+        return key, self._result_cache.get(key)
+
+    def _release(self, worker):
+        """
+        Puts the worker back to the queue of idle workers. The worker is replaced
+        if it has run too many algorithms, has died or has not sent the whole
+        response (for example a streamed response which has not been read).
+        """
+        if worker.is_alive() and not worker.pending and worker.runs < self._max_runs:
+            self._idle.put(worker)
+        else:
+            self._retired.put(worker)
+
+    def _spawn(self):
+        """
+        The main loop of the spawner thread. Replaces the retired workers by fresh
+        ones.
+        """
+        while True:
+            worker = self._retired.get()
+            logger.info("Recycling worker", {"runs": worker.runs})
+
+            try:
+                worker.stop()
+                self._idle.put(Worker(self._max_memory_mb, self._context))
+            except Exception:  # pylint: disable=broad-except
+                logger.error("spawn: Exception", {"exception": traceback.format_exc()})
+                self._retired.put(worker)
+                time.sleep(1)
+
+    def _take(self):
+        """
+        Takes an idle worker. Blocks until a worker is available, but at most
+        `wait_timeout` seconds.
+
+        raises:
+          - PoolBusyException: if no worker became available in time
+        """
+        try:
+            return self._idle.get(timeout=self._wait_timeout)
+        except queue.Empty:
+            raise PoolBusyException(  # pylint: disable=raise-missing-from
+                "The server is busy. Please try again later."
+            )
+
+    def _put_cached(self, key, worker, response):
+        """
+        Caches the response if the run was deterministic and was the first run of
+        the worker
+        """
+        if key is not None and worker.deterministic and worker.runs == 1:
+            self._result_cache.put(key, response)
+
+    def run(self, config, options=None, timeout=None, cache=False):
+        """
+        Runs the algorithm specified by the config in an idle worker. Blocks until
+        a worker is available.
+
+        raises:
+          - PoolBusyException: if no worker became available in time
+          - Exception: if the time limit or the memory limit was exceeded
+
+        parameters:
+          - config (dict): the JSON config of the algorithm
+          - options (dict): the options of the response, see Sender
+          - timeout (float): the time limit of the run in seconds, the time limit
+            of the pool if omitted
+          - cache (bool): whether the response can be taken from and put to the
+            result cache
+
+        returns:
+          - response (bytes): the encoded JSON response, see Sender
+        """
+        key, response = self._get_cached(
+            config, {**(options or {}), "stream": False}, cache
+        )
+
+        if response is not None:
+            return response
+
+        worker = self._take()
+
+        try:
+            response = worker.run(config, timeout or self._max_execution_time, options)
+
+        finally:
+            self._release(worker)
+
+        self._put_cached(key, worker, response)
+
+        return response
+
+    def stream(self, config, options=None, cache=False):
+        """
+        The same as `run`, but the response is streamed (see Worker.stream). The
+        worker is taken when the first chunk is requested and put back when the
+        generator is exhausted or closed.
+
+        raises:
+          - PoolBusyException: if no worker became available in time
+          - Exception: if the time limit or the memory limit was exceeded
+
+        parameters:
+          - config (dict): the JSON config of the algorithm
+          - options (dict): the options of the response, see Sender
+          - cache (bool): whether the response can be taken from and put to the
+            result cache
+
+        returns:
+          - chunks (generator<bytes>): the chunks of the encoded JSON response
+        """
+        key, response = self._get_cached(
+            config, {**(options or {}), "stream": True}, cache
+        )
+
+        if response is not None:
+            yield response
+            return
+
+        worker = self._take()
+        chunks = []
+
+        try:
+            for chunk in worker.stream(config, self._max_execution_time, options):
+                if key is not None:
+                    chunks.append(chunk)
+
+                yield chunk
+
+        finally:
+            self._release(worker)
+
+        self._put_cached(key, worker, b"".join(chunks))
+
+    def __init__(
+        self,
+        *,
+        size,
+        max_runs,
+        max_memory_mb,
+        max_execution_time,
+        result_cache=None,
+        wait_timeout=None,
+        preload=("__main__", "components"),
+    ):
+        """
+        Creates a new instance of WorkerPool, starts the fork server and all the
+        workers.
+
+        parameters:
+          - size (int): the number of workers
+          - max_runs (int): the number of runs after which a worker is replaced
+          - max_memory_mb (int): the memory limit of every worker in MB
+          - max_execution_time (float): the time limit of every run in seconds
+          - result_cache (ResultCache): the cache of the responses (optional)
+          - wait_timeout (float): the maximum time a run waits for an idle worker
+            in seconds (no limit if omitted)
+          - preload (list<str>): the modules imported by the fork server
+        """
+        self._result_cache = result_cache
+        self._max_runs = max_runs
+        self._max_memory_mb = max_memory_mb
+        self._max_execution_time = max_execution_time
+        self._wait_timeout = wait_timeout
+
+        self._context = multiprocess.get_context("forkserver")
+        self._context.set_forkserver_preload(list(preload))
+
+        self._idle = queue.Queue()
+        self._retired = queue.Queue()
+
+        for _ in range(size):
+            self._idle.put(Worker(max_memory_mb, self._context))
+
+        threading.Thread(target=self._spawn, daemon=True).start()
+
+        logger.info("Worker pool started", {"size": size})
@@ -3,14 +3,17 @@ Helper module for colors
 """
 
 import re
-from colour import COLOR_NAME_TO_RGB
-from webcolors import CSS3_NAMES_TO_HEX
+import functools
 from exceptions import ColorException
 
 
 # Normalized rgba format is tuple of floats - float error must be considered
 FLOAT_ERROR = 0.000005
 
+# The maximum number of the color strings whose parsed instances of Color are
+# interned, see Color.create
+COLOR_CACHE_SIZE = 1024
+
 
 # Matches color in hex format
 HEX_REGEX_STR = r"^#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})$"
@@ -41,16 +44,18 @@ HEX_REGEX = re.compile(HEX_REGEX_STR)
 RGBA_REGEX = re.compile(RGBA_REGEX_STR)
 
 
-# Map from color name to normalized rgba tuple
-# Initialized at the end of the script after Color class definition
-COLOR_NAME_TO_RGBA = {}
+# Map from color name to normalized rgba tuple (COLOR_NAME_TO_RGBA) and the list
+# of the color names (COLOR_NAMES) are loaded lazily, see _color_name_to_rgba
 
 
 class Color:
     """
-    Used to represent a RGBA color
+    Used to represent a RGBA color. The color is stored packed into a single
+    32-bit integer (8 bits per part) and the instances are immutable.
     """
 
+    __slots__ = ("_packed",)
+
     @staticmethod
     def is_keyword(color):
         """
@@ -62,7 +67,7 @@ class Color:
         returns:
           - is_keyword (bool)
         """
-        return isinstance(color, str) and color.lower() in COLOR_NAME_TO_RGBA
+        return isinstance(color, str) and color.lower() in _color_name_to_rgba()
 
     @staticmethod
     def is_hex(color):
@@ -125,10 +130,12 @@ class Color:
         returns:
           - is_color (bool)
         """
+        if isinstance(color, str):
+            return _intern_color_string(color) is not None
+
         return (
             isinstance(color, Color)
             or color is None
-            or color == "default"
             or Color.is_keyword(color)
             or Color.is_hex(color)
             or Color.is_rgba(color)
@@ -158,7 +165,7 @@ class Color:
         returns:
           - rgba (tuple): normalized rgba tuple (r, g, b, a)
         """
-        return COLOR_NAME_TO_RGBA[color.lower()]
+        return _color_name_to_rgba()[color.lower()]
 
     @staticmethod
     def normalize_hex(color):
@@ -267,6 +274,75 @@ class Color:
 
         raise ColorException("Invalid color: {}".format(color))
 
+    @staticmethod
+    def create(color):
+        """
+        Returns an instance of Color for the specified color. The colors specified
+        by a string are parsed once only - the same (shared) instance is returned
+        for the same string, see COLOR_CACHE_SIZE. Instances of Color are returned
+        as they are.
+
+        raises:
+          - ColorException when no format matched
+
+        parameters:
+          - color (any): color in any recognized format
+
+        returns:
+          - color (Color): the color
+        """
+        if isinstance(color, Color):
+            return color
+
+        if isinstance(color, str):
+            interned = _intern_color_string(color)
+
+            if interned is None:
+                raise ColorException("Invalid color: {}".format(color))
+
+            return interned
+
+        return Color(color)
+
+    @staticmethod
+    def pack(rgba):
+        """
+        Packs the normalized rgba tuple into a 32-bit integer - one byte per part
+        in the order r, g, b, a (None stays None)
+
+        parameters:
+          - rgba (tuple|None): normalized rgba tuple (r, g, b, a)
+
+        returns:
+          - packed (int|None): the packed color, 0xRRGGBBAA
+        """
+        if rgba is None:
+            return None
+
+        packed = 0
+
+        for part in rgba:
+            packed = (packed << 8) | min(max(round(part * 255), 0), 255)
+
+        return packed
+
+    @property
+    def packed(self):
+        """
+        The color packed into a 32-bit integer, see Color.pack
+        """
+        return self._packed
+
+    @property
+    def rgba(self):
+        """
+        The normalized rgba tuple (r, g, b, a) unpacked from the packed color
+        """
+        if self._packed is None:
+            return None
+
+        return tuple((self._packed >> shift & 0xFF) / 255 for shift in (24, 16, 8, 0))
+
     def to_hex(self):
         """
         Converts the color to long hex format.
@@ -274,30 +350,28 @@ class Color:
         returns:
           - hex_color (str): the color in long hex format
         """
-        if self.rgba is None:
+        if self._packed is None:
             return None  # Default color will be determined by the Frontend
 
-        return "#{}".format("".join("%02x" % round(part * 255) for part in self.rgba))
+        return "#%08x" % self._packed
 
     def __eq__(self, color):
         """
-        Defines equality of two colors
+        Defines equality of two colors - the packed colors are compared
         """
-        if not Color.is_color(color):
-            return False
-
-        color = Color(color)
+        if not isinstance(color, Color):
+            if not Color.is_color(color):
+                return False
 
-        if self.rgba is None or color.rgba is None:
-            return self.rgba is None and color.rgba is None
+            color = Color.create(color)
 
-        return all(abs(x - y) <= FLOAT_ERROR for x, y in zip(self.rgba, color.rgba))
+        return self._packed == color._packed
 
     def __hash__(self):
         """
-        Defines the hash function - hash the normalized rgba tuple
+        Defines the hash function - hash the packed color
         """
-        return hash(self.rgba)
+        return hash(self._packed)
 
     def __str__(self):
         """
@@ -326,15 +400,71 @@ class Color:
         parameters:
           - color (any): color in any known format, will be normalized to rgba
         """
-        self.rgba = Color.normalize_color(color)
+        if isinstance(color, Color):
+            self._packed = color.packed
+        else:
+            self._packed = Color.pack(Color.normalize_color(color))
+
+
+@functools.lru_cache(maxsize=COLOR_CACHE_SIZE)
+def _intern_color_string(color):
+    """
+    Parses the color string and returns the interned instance of Color. The
+    result of the validation is cached as well - None is returned if the string
+    is not a color.
 
+    parameters:
+      - color (str): color in any recognized string format
 
-for _key, _rgb in COLOR_NAME_TO_RGB.items():
-    _r, _g, _b = _rgb
-    COLOR_NAME_TO_RGBA[_key.lower()] = (_r / 255, _g / 255, _b / 255, 1)
+    returns:
+      - color (Color|None): the shared instance, None if the color is invalid
+    """
+    if not (
+        color == "default"
+        or Color.is_keyword(color)
+        or Color.is_hex(color)
+        or Color.is_rgba(color)
+    ):
+        return None
+
+    return Color(color)
+
+
+@functools.cache
+def _color_name_to_rgba():
+    """
+    Returns the map from color name to normalized rgba tuple. The tables of colour
+    and webcolors are imported and converted on the first call only - most runs
+    never use a color name.
+
+    returns:
+      - color_name_to_rgba (dict): color name to normalized rgba tuple
+    """
+    # pylint: disable=import-outside-toplevel
+    from colour import COLOR_NAME_TO_RGB
+    from webcolors import CSS3_NAMES_TO_HEX
+
+    color_name_to_rgba = {}
+
+    for key, rgb in COLOR_NAME_TO_RGB.items():
+        r, g, b = rgb
+        color_name_to_rgba[key.lower()] = (r / 255, g / 255, b / 255, 1)
+
+    for key, hex_color in CSS3_NAMES_TO_HEX.items():
+        if key not in color_name_to_rgba:
+            color_name_to_rgba[key.lower()] = Color.normalize_hex(hex_color)
+
+    return color_name_to_rgba
+
+
+def __getattr__(name):
+    """
+    Provides COLOR_NAME_TO_RGBA and COLOR_NAMES, which are loaded lazily (PEP 562)
+    """
+    if name == "COLOR_NAME_TO_RGBA":
+        return _color_name_to_rgba()
 
-for _key, _hex in CSS3_NAMES_TO_HEX.items():
-    if _key not in COLOR_NAME_TO_RGBA:
-        COLOR_NAME_TO_RGBA[_key.lower()] = Color.normalize_hex(_hex)
+    if name == "COLOR_NAMES":
+        return list(_color_name_to_rgba().keys())
 
-COLOR_NAMES = list(COLOR_NAME_TO_RGBA.keys())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,11 +2,15 @@
 The engine module
 """
 
+import sys
+import pickle
+import random
+import builtins
 from io import StringIO
 
-import hunter
 from components.logger import logger
-from environment import DEBUG_MODE
+from environment import DEBUG_MODE, MAX_TICKS
+from exceptions import BudgetException
 from utils.path import path_from_root
 from .graph.graph import Graph
 from .graph.di_graph import DiGraph
@@ -40,6 +44,51 @@ class Engine:
     TICK_SOURCE_STYLIZER = 3
     TICK_SOURCE_ALG_END = 4
 
+    # The tick sampling policies decide which 'line' events tick:
+    #   - line: every line
+    #   - mutation: the lines which mutated some visualizer or printed something
+    #   - style: the lines which may have changed the transformed state of some
+    #     visualizer (a mutation or a change of the stylizer dependencies) or
+    #     printed something
+    #   - user: no lines, only the explicit calls of engine.tick() (and the
+    #     stylizers) tick
+    #   - budget: at most `sampling_budget` lines, the lines are thinned out
+    #     more and more as the budget runs out
+    # The ticks from the other sources are never skipped.
+    SAMPLING_LINE = "line"
+    SAMPLING_MUTATION = "mutation"
+    SAMPLING_STYLE = "style"
+    SAMPLING_USER = "user"
+    SAMPLING_BUDGET = "budget"
+
+    SAMPLING_POLICIES = (
+        SAMPLING_LINE,
+        SAMPLING_MUTATION,
+        SAMPLING_STYLE,
+        SAMPLING_USER,
+        SAMPLING_BUDGET,
+    )
+
+    DEFAULT_SAMPLING_BUDGET = 1000
+
+    # The modules which make the algorithm nondeterministic once imported, see
+    # get_builtins (the submodules are included)
+    NONDETERMINISTIC_MODULES = (
+        "random",
+        "time",
+        "datetime",
+        "uuid",
+        "secrets",
+        "os",
+        "numpy.random",
+        # The modules which import or reach the other modules bypassing the
+        # builtins of the algorithm
+        "sys",
+        "gc",
+        "builtins",
+        "importlib",
+    )
+
     Color = Color
     NodeShape = NodeShape
 
@@ -56,13 +105,13 @@ class Engine:
 
     def line_callback(self, src):
         """
-        This method is called for every 'line' event of the Hunter library. The
+        This method is called by the tracer for every 'line' event. The
         initiation of code tracking is a responsibility of the runner component.
 
         Engine will save the number of the current line and call the tick method
 
         parameters:
-          - src (object): the source line
+          - src (object): the line event - hunter Event or TraceEvent
         """
         if DEBUG_MODE:
             line = src.fullsource.replace("\n", "")
@@ -81,15 +130,248 @@ class Engine:
             logger.debug(msg, meta)
 
         try:
-            if not self._can_tick:
+            if not self._can_tick or self._truncation is not None:
                 return  # Skip line callback if ticks are not enabled ATM
 
             self._prev_line = self._curr_line
             self._curr_line = src.lineno - 1
 
-            self.tick(self.TICK_SOURCE_LINE)
+            if self._sample_line():
+                self.tick(self.TICK_SOURCE_LINE)
         except RecursionError:
-            hunter.stop()
+            if self._tracer is not None:
+                self._tracer.stop()
+
+    def set_tracer(self, tracer):
+        """
+        Sets the tracer which calls the line callback. The engine stops the tracer
+        if the line callback runs into a recursion error.
+
+        parameters:
+          - tracer (Tracer): The tracer used by the runner
+        """
+        self._tracer = tracer
+
+    def mark_nondeterministic(self, reason):
+        """
+        Marks the run as nondeterministic - the same code may produce different
+        frames, so the result of the run must not be cached (see ResultCache)
+
+        parameters:
+          - reason (str): What made the run nondeterministic
+        """
+        if self._nondeterminism is None:
+            logger.debug("Nondeterministic run", {"reason": reason})
+            self._nondeterminism = reason
+
+    @staticmethod
+    def _get_random_state():
+        """
+        Returns the state of the global random generators - of `random` and of
+        `numpy.random` (if imported). The generators of networkx use them unless
+        a seed is given.
+        """
+        states = [random.getstate()]
+        numpy_random = sys.modules.get("numpy.random")
+
+        if numpy_random is not None:
+            states.append(numpy_random.get_state(legacy=False))
+
+        return pickle.dumps(states)
+
+    def watch_random_state(self):
+        """
+        Starts watching the global random generators - the run is
+        nondeterministic if they are used afterwards, no matter how the algorithm
+        reached them (see is_deterministic)
+        """
+        self._random_state = self._get_random_state()
+
+    def is_deterministic(self):
+        """
+        Returns True if nothing nondeterministic was detected during the run, see
+        get_builtins and watch_random_state
+        """
+        if (
+            self._random_state is not None
+            and self._get_random_state() != self._random_state
+        ):
+            self.mark_nondeterministic("random state")
+
+        return self._nondeterminism is None
+
+    def _is_nondeterministic_module(self, name, fromlist):
+        """
+        Returns True if importing the module (and the names from it) makes the
+        algorithm nondeterministic
+        """
+        names = [name] + ["{}.{}".format(name, item) for item in fromlist or ()]
+
+        return any(
+            imported == module or imported.startswith(module + ".")
+            for imported in names
+            for module in self.NONDETERMINISTIC_MODULES
+        )
+
+    def get_builtins(self):
+        """
+        Returns the builtins for the code of the visualized algorithm. The
+        builtins detect the nondeterministic behavior (see mark_nondeterministic):
+          - import of a module from NONDETERMINISTIC_MODULES
+          - call of `id` or `hash` - the identities (and the hashes of the
+            strings) differ from run to run
+          - definition of a class hashed by the identity - the iteration order
+            of the sets of its instances differs from run to run
+
+        returns:
+          - builtins (dict): The builtins with the detection
+        """
+
+        def import_module(name, globals_=None, locals_=None, fromlist=(), level=0):
+            if self._is_nondeterministic_module(name, fromlist):
+                self.mark_nondeterministic("import {}".format(name))
+
+            return builtins.__import__(name, globals_, locals_, fromlist, level)
+
+        def identity(obj):
+            self.mark_nondeterministic("id")
+            return builtins.id(obj)
+
+        def hash_(obj):
+            self.mark_nondeterministic("hash")
+            return builtins.hash(obj)
+
+        def build_class(func, name, *bases, **kwargs):
+            cls = builtins.__build_class__(func, name, *bases, **kwargs)
+
+            if cls.__hash__ is object.__hash__:
+                self.mark_nondeterministic("class {}".format(name))
+
+            return cls
+
+        return {
+            **vars(builtins),
+            "__import__": import_module,
+            "__build_class__": build_class,
+            "id": identity,
+            "hash": hash_,
+        }
+
+    def set_max_ticks(self, max_ticks):
+        """
+        Sets the tick budget. Once the engine has recorded `max_ticks` ticks, the
+        visualization is truncated - the tracer is stopped, all the following
+        ticks are ignored and the algorithm runs to its end untraced.
+
+        parameters:
+          - max_ticks (int): The maximum number of recorded ticks
+        """
+        self._max_ticks = max_ticks
+
+    def get_truncation(self):
+        """
+        Returns the reason why the ticks were truncated (None if they were not)
+
+        returns:
+          - truncation (BudgetException|None): The exceeded budget
+        """
+        return self._truncation
+
+    def _truncate(self):
+        """
+        Stops recording the ticks, see `set_max_ticks`
+        """
+        self._truncation = BudgetException(
+            "The visualization was truncated - the algorithm exceeded "
+            "the budget of {} ticks".format(self._max_ticks)
+        )
+
+        if self._tracer is not None:
+            self._tracer.stop()
+
+    def set_sampling(self, policy, budget=None):
+        """
+        Sets the tick sampling policy, see SAMPLING_POLICIES.
+
+        raises:
+          - ValueError when the policy is unknown or the budget is lower than 1
+
+        parameters:
+          - policy (str): The tick sampling policy
+          - budget (int): The maximum number of line ticks of the budget policy,
+            DEFAULT_SAMPLING_BUDGET if omitted
+        """
+        if policy not in self.SAMPLING_POLICIES:
+            raise ValueError(f"Unknown tick sampling policy: {policy}")
+
+        if budget is not None and budget < 1:
+            raise ValueError(f"Invalid tick sampling budget: {budget}")
+
+        # pylint: disable=attribute-defined-outside-init
+        self._sampling = policy
+        self._sampling_budget = (
+            self.DEFAULT_SAMPLING_BUDGET if budget is None else budget
+        )
+        self._sampling_stride = 1
+        self._sampling_threshold = self._sampling_budget // 2
+        self._line_events = 0
+        self._line_ticks = 0
+
+    def _get_versions(self):
+        """
+        Returns the versions of all the components, see Visualizer.get_version
+        """
+        return [comp.get_version() for comp in self._components]
+
+    def _sample_budget(self):
+        """
+        Returns True if the current line event fits the budget. Every
+        `_sampling_stride`-th line is sampled. Once half of the remaining budget
+        is used, the stride is multiplied by 4 - the beginning of the algorithm
+        is sampled densely, the rest more and more sparsely, but the number of
+        line ticks never exceeds the budget.
+        """
+        self._line_events += 1
+
+        if self._line_ticks >= self._sampling_budget:
+            return False
+
+        if self._line_events % self._sampling_stride != 0:
+            return False
+
+        self._line_ticks += 1
+
+        if self._line_ticks >= self._sampling_threshold:
+            self._sampling_stride *= 4
+            self._sampling_threshold += max(
+                (self._sampling_budget - self._sampling_threshold) // 2, 1
+            )
+
+        return True
+
+    def _sample_line(self):
+        """
+        Returns True if the current line event should tick according to the tick
+        sampling policy
+        """
+        policy = self._sampling
+
+        if policy == self.SAMPLING_LINE:
+            return True
+
+        if policy == self.SAMPLING_USER:
+            return False
+
+        if policy == self.SAMPLING_BUDGET:
+            return self._sample_budget()
+
+        if self._console_log.tell() > 0:
+            return True  # The printed text is shown at the line which printed it
+
+        if policy == self.SAMPLING_MUTATION:
+            return self._get_versions() != self._versions
+
+        return any(comp.has_visible_changes() for comp in self._components)
 
     def tick(self, source=None):
         """
@@ -100,8 +382,8 @@ class Engine:
           - source (int): The source of the tick. Valid values are defined as
             constans with prefix TICK_SOURCE_
         """
-        if not self._can_tick:
-            return  # Stop if ticks are not enabled ATM
+        if not self._can_tick or self._truncation is not None:
+            return  # Stop if ticks are not enabled ATM or the budget ran out
 
         try:
             self._can_tick = False
@@ -117,6 +399,7 @@ class Engine:
             components = [
                 (comp, comp.get_transformed_state()) for comp in self._components
             ]
+            self._versions = self._get_versions()
             lineno = (
                 self._prev_line if source == self.TICK_SOURCE_LINE else self._curr_line
             )
@@ -131,6 +414,9 @@ class Engine:
             if console_logs:  # Empty the contents if some logs were made
                 self._console_log = StringIO()
 
+            if self._ticker.next_tick_id >= self._max_ticks:
+                self._truncate()
+
         finally:
             self._can_tick = True
 
@@ -149,10 +435,20 @@ class Engine:
         returns:
           - frames (list): the frames used for visualization
         """
+        return list(self.iter_frames())
+
+    def iter_frames(self):
+        """
+        The same as `make_frames`, but the frames are yielded one by one as soon
+        as they are computed (see Ticker.iter_frames).
+
+        returns:
+          - frames (generator): the frames used for visualization
+        """
         for component in self._components:
             component.interpret_transformed_state()
 
-        return self._ticker.to_frames()
+        yield from self._ticker.iter_frames()
 
     def get_ticks(self):
         """
@@ -165,7 +461,7 @@ class Engine:
         if not DEBUG_MODE:
             raise Exception("This feature is disabled in production mode")
 
-        return self._ticker.ticks
+        return list(self._ticker.restore_ticks())
 
     def get_logs(self):
         """
@@ -229,6 +525,17 @@ class Engine:
         self._curr_line = None
         self._prev_line = None
 
-        self._ticker = Ticker()
+        # The ticks are only needed in the debug mode (see get_ticks)
+        self._ticker = Ticker(keep_ticks=DEBUG_MODE)
+        self._tracer = None
+
+        self._max_ticks = MAX_TICKS
+        self._truncation = None
+
+        self._nondeterminism = None
+        self._random_state = None
+
+        self._versions = []
+        self.set_sampling(self.SAMPLING_LINE)
 
         self.stopwatch = Stopwatch()
@@ -0,0 +1,39 @@
+"""
+Helper module for the fingerprints of styles and frames
+"""
+
+
+def fingerprint(obj):
+    """
+    Returns the structural fingerprint (hash) of a style - a structure of dicts,
+    lists and tuples. Equal structures have equal fingerprints, so the structures
+    with different fingerprints do not have to be compared at all. The order of
+    the keys of a dict does not matter, just like for the equality of dicts.
+
+    Equal fingerprints do NOT imply equal structures - the structures must still
+    be compared then.
+
+    parameters:
+      - obj (any): the structure
+
+    returns:
+      - fingerprint (int): the fingerprint
+    """
+    if isinstance(obj, dict):
+        try:
+            return hash(frozenset(obj.items()))
+        except TypeError:  # Some values are dicts or lists
+            return hash(
+                frozenset((key, fingerprint(value)) for key, value in obj.items())
+            )
+
+    if isinstance(obj, (list, tuple)):
+        try:
+            return hash(tuple(obj))
+        except TypeError:  # Some items are dicts or lists
+            return hash(tuple(map(fingerprint, obj)))
+
+    try:
+        return hash(obj)
+    except TypeError:
+        return 0  # Unhashable value - such structures are always compared
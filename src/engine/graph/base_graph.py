@@ -2,10 +2,15 @@
 The BaseGraph Visualizer module
 """
 
+import functools
+from engine.fingerprint import fingerprint
 from engine.visualizer import Visualizer
+from .graph_tracker import MutationCounter, TrackedDict
 from .graph_colorizer import GraphNodeColorizer, GraphEdgeColorizer
 from .graph_shaper import GraphNodeShaper, GraphEdgeShaper
 from .graph_labeler import GraphEdgeLabeler, GraphNodeLabeler
+from .unique_values import ValueCodes
+from .transformed_column import TransformedColumn
 
 
 class BaseGraph(Visualizer):
@@ -29,6 +34,11 @@ class BaseGraph(Visualizer):
     Stylizer
     """
 
+    # The properties whose stylizers store the codes of the transformed values
+    # (see ValueCodes) in columns (see TransformedColumn)
+    CODED_NODE_PROPERTIES = ("node_colors", "node_shapes")
+    CODED_EDGE_PROPERTIES = ("edge_colors", "edge_shapes")
+
     def get_type(self):
         """
         Returns the type of the graph.
@@ -43,6 +53,96 @@ class BaseGraph(Visualizer):
         if self._engine is not None:
             self._engine.tick(self._engine.TICK_SOURCE_STYLIZER)
 
+    def _init_mutation_tracking(self):
+        """
+        Replaces the dict factories of the networkx graph by factories of
+        TrackedDict, so that every mutation of the graph is counted. This method
+        MUST be called before the networkx constructor.
+        """
+        # pylint: disable=attribute-defined-outside-init
+        self._mutations = MutationCounter()
+        self._transformed_cache = {}
+        self._state_cache = None
+        self._style_cache = {}
+        self._fingerprint_cache = {}
+
+        factory = functools.partial(TrackedDict, counter=self._mutations)
+
+        self.node_dict_factory = factory
+        self.node_attr_dict_factory = factory
+        self.adjlist_outer_dict_factory = factory
+        self.adjlist_inner_dict_factory = factory
+        self.edge_attr_dict_factory = factory
+        self.graph_attr_dict_factory = factory
+
+    def _transform(self, name, stylizer):
+        """
+        Runs the transformation of the specified stylizer. The transformed state
+        of the stylizers which store codes is turned into a column.
+
+        returns:
+          - transformed (dict|array): The transformed state of the stylizer
+        """
+        transformed = stylizer.transform(self)
+
+        if name in self.CODED_NODE_PROPERTIES:
+            return TransformedColumn.from_nodes(transformed)
+
+        if name in self.CODED_EDGE_PROPERTIES:
+            return TransformedColumn.from_edges(transformed, self.edges)
+
+        return transformed
+
+    def _untransform(self, name, transformed, state):
+        """
+        Turns a column stored by `_transform` back into the transformed state of
+        the stylizer. Other transformed states are returned as they are.
+
+        returns:
+          - transformed (dict): The transformed state of the stylizer
+        """
+        if name in self.CODED_NODE_PROPERTIES:
+            return TransformedColumn.to_nodes(transformed, state["nodes"])
+
+        if name in self.CODED_EDGE_PROPERTIES:
+            return TransformedColumn.to_edges(transformed, state["edges"])
+
+        return transformed
+
+    def _transform_stylizer(self, name, stylizer):
+        """
+        Returns the transformed state of the specified stylizer. The transformed
+        state from the previous call is reused if the stylizer declared its
+        dependencies (see StylizerDependencies), the dependencies are unchanged
+        and the graph has not been mutated since. The transformed state of a
+        volatile graph (see MutationCounter) is never reused.
+
+        returns:
+          - transformed (dict): The transformed state of the stylizer
+          - cached (bool): True if the previous transformed state was reused
+        """
+        version = self._mutations.version
+        dependencies = stylizer.dependencies
+
+        if not dependencies.is_known() or self._mutations.volatile:
+            return self._transform(name, stylizer), False
+
+        snapshot = dependencies.snapshot()
+        cached = self._transformed_cache.get(name)
+
+        if (
+            cached is not None
+            and cached[0] is stylizer
+            and cached[1] == version
+            and cached[2] == snapshot
+        ):
+            return cached[3], True
+
+        transformed = self._transform(name, stylizer)
+        self._transformed_cache[name] = (stylizer, version, snapshot, transformed)
+
+        return transformed, False
+
     def get_transformed_state(self):
         """
         Returns the transformed state of the Graph which is composed of
@@ -56,6 +156,9 @@ class BaseGraph(Visualizer):
         Only the properties which have stylizers specified are included in the
         transformed dict.
 
+        If the graph has not been mutated and no stylizer had to be transformed
+        again, the very same state object as in the previous call is returned.
+
         This method MUST be called every time a tick is being generated.
 
         returns:
@@ -65,21 +168,112 @@ class BaseGraph(Visualizer):
             return None
 
         transformed = {}
+        all_cached = True
 
         for name, stylizer in self._stylizers.items():
             if stylizer is not None:
-                transformed[name] = stylizer.transform(self)
+                transformed[name], cached = self._transform_stylizer(name, stylizer)
+                all_cached = all_cached and cached
 
-        return {
-            "nodes": list(self.nodes),
-            "edges": list(self.edges),
+        version = self._mutations.version
+        prev = self._state_cache
+
+        if prev is not None and prev[0] == version:
+            if all_cached and prev[1]["transformed"].keys() == transformed.keys():
+                return prev[1]
+
+            nodes, edges = prev[1]["nodes"], prev[1]["edges"]
+        else:
+            nodes, edges = list(self.nodes), list(self.edges)
+
+        state = {
+            "nodes": nodes,
+            "edges": edges,
             "transformed": transformed,
         }
 
+        # pylint: disable-next=attribute-defined-outside-init
+        self._state_cache = (version, state)
+
+        return state
+
+    def get_version(self):
+        """
+        Returns the version of the graph, see MutationCounter. The version of a
+        volatile graph is a new object on every call - it may have changed.
+        """
+        if self._mutations.volatile:
+            return object()
+
+        return self._mutations.version
+
+    def has_visible_changes(self):
+        """
+        Returns True if the transformed state may differ from the one returned by
+        the last call of `get_transformed_state`. That is the case if the graph
+        has been mutated since (or is volatile, see MutationCounter) or some
+        stylizer would have to be transformed again - its dependencies are unknown
+        or changed, or it has been replaced.
+
+        returns:
+          - changed (bool): False if the previous transformed state is still valid
+        """
+        version = self._mutations.version
+        prev = self._state_cache
+
+        if prev is None or prev[0] != version or self._mutations.volatile:
+            return True
+
+        stylizers = {
+            name: stylizer
+            for name, stylizer in self._stylizers.items()
+            if stylizer is not None
+        }
+
+        if stylizers.keys() != prev[1]["transformed"].keys():
+            return True  # Some stylizer has been set or removed
+
+        return not all(
+            self._is_transformed_cached(name, stylizer, version)
+            for name, stylizer in stylizers.items()
+        )
+
+    def _is_transformed_cached(self, name, stylizer, version):
+        """
+        Returns True if the cached transformed state of the specified stylizer is
+        still valid - the stylizer declared its dependencies, they are unchanged
+        and the graph is still of the specified version (see _transform_stylizer).
+        """
+        dependencies = stylizer.dependencies
+        cached = self._transformed_cache.get(name)
+
+        if not dependencies.is_known() or cached is None:
+            return False
+
+        return (
+            cached[0] is stylizer
+            and cached[1] == version
+            and cached[2] == dependencies.snapshot()
+        )
+
+    def can_compute_style(self):
+        """
+        Returns True if the style of the current transformed state can be computed
+        right away, ie. before the execution of the visualized algorithm has ended.
+        This is the case if every stylizer can compute its style (see the method
+        `can_compute` of the stylizers).
+        """
+        return all(
+            stylizer.can_compute()
+            for stylizer in self._stylizers.values()
+            if stylizer is not None
+        )
+
     def interpret_transformed_state(self):
         """
         Calls the interpret method for every Stylizer. This method MUST be called
-        after all ticks were generated.
+        after all ticks were generated. The stylizers which were interpreted when
+        they were created are not interpreted again.
         """
         for stylizer in self._stylizers.values():
             if stylizer is not None:
@@ -114,7 +308,7 @@ class BaseGraph(Visualizer):
 
         for name, stylizer in self._stylizers.items():
             if stylizer is not None and name in state["transformed"]:
-                style[name] = stylizer.compute(state["transformed"][name])
+                style[name] = self._compute_stylizer(name, stylizer, state)
 
         return {
             "type": self.get_type(),
@@ -123,21 +317,125 @@ class BaseGraph(Visualizer):
             "style": style,
         }
 
+    def _compute_stylizer(self, name, stylizer, state):
+        """
+        Computes the style of the specified stylizer. The style (and its
+        fingerprint) from the previous call is reused if the stylizer, its
+        transformed state and the items (nodes or edges) are the same - the
+        neighbouring frames then share the objects of the unchanged styles.
+
+        returns:
+          - style (dict): The style of the property
+        """
+        transformed = state["transformed"][name]
+        items = state["edges"] if name.startswith("edge_") else state["nodes"]
+        cached = self._style_cache.get(name)
+
+        if self._is_style_cached(cached, stylizer, transformed, items):
+            return cached[3]
+
+        style = stylizer.compute(self._untransform(name, transformed, state))
+        self._style_cache[name] = (stylizer, transformed, items, style)
+
+        return style
+
+    @staticmethod
+    def _is_style_cached(cached, stylizer, transformed, items):
+        """
+        Returns True if the cached style (see _compute_stylizer) was computed by the
+        specified stylizer from the same transformed state and items
+        """
+        if cached is None or cached[0] is not stylizer:
+            return False
+
+        return (cached[1] is transformed or cached[1] == transformed) and (
+            cached[2] is items or cached[2] == items
+        )
+
+    def _get_fingerprint(self, name, value):
+        """
+        Returns the fingerprint of a part of the style (the style of a property
+        or the list of the nodes or the edges). The fingerprint of the last value
+        of every part is cached - unchanged parts are the very same objects.
+        """
+        cached = self._fingerprint_cache.get(name)
+
+        if cached is None or cached[0] is not value:
+            cached = (value, fingerprint(value))
+            self._fingerprint_cache[name] = cached
+
+        return cached[1]
+
+    def get_style_fingerprint(self, style):
+        """
+        Returns the fingerprint of the style computed by `compute_style`. The
+        result is the same as the result of the function `fingerprint`, but the
+        fingerprints of the unchanged parts of the style are reused.
+        """
+        if style is None:
+            return fingerprint(style)
+
+        try:
+            styles = hash(frozenset(style["style"].items()))
+        except TypeError:
+            styles = hash(
+                frozenset(
+                    (name, self._get_fingerprint(name, value))
+                    for name, value in style["style"].items()
+                )
+            )
+
+        return hash(
+            frozenset(
+                (
+                    ("type", fingerprint(style["type"])),
+                    ("nodes", self._get_fingerprint("nodes", style["nodes"])),
+                    ("edges", self._get_fingerprint("edges", style["edges"])),
+                    ("style", styles),
+                )
+            )
+        )
+
+    def _set_stylizer(self, name, stylizer):
+        """
+        Sets the stylizer of the property and creates a tick. Replacing a stylizer
+        set by the algorithm (not a default one) is remembered, see
+        has_replaced_stylizer.
+        """
+        if name in self._custom_stylizers:
+            # pylint: disable-next=attribute-defined-outside-init
+            self._replaced_stylizer = True
+
+        self._custom_stylizers.add(name)
+        self._stylizers[name] = stylizer
+
+        self._engine_tick()
+
+    def has_replaced_stylizer(self):
+        """
+        Returns True if a stylizer set by the algorithm has been replaced. The
+        style of the states transformed so far then depends on the last
+        stylizers, see Ticker.
+        """
+        return self._replaced_stylizer
+
     def color_nodes_by(self, *args, **kwargs):
         """
         Creates an instance of GraphNodeColorizer used by this graph
         """
-        self._stylizers["node_colors"] = GraphNodeColorizer.build(*args, **kwargs)
+        stylizer = GraphNodeColorizer.build(*args, **kwargs)
+        stylizer.use_codes(self._value_codes["node_colors"])
 
-        self._engine_tick()
+        self._set_stylizer("node_colors", stylizer)
 
     def shape_nodes_by(self, *args, **kwargs):
         """
         Creates an instance of GraphNodeShaper used by this graph
         """
-        self._stylizers["node_shapes"] = GraphNodeShaper.build(*args, **kwargs)
+        stylizer = GraphNodeShaper.build(*args, **kwargs)
+        stylizer.use_codes(self._value_codes["node_shapes"])
 
-        self._engine_tick()
+        self._set_stylizer("node_shapes", stylizer)
 
     def scale_nodes_by(self, *args, **kwargs):
         """
@@ -148,25 +446,25 @@ class BaseGraph(Visualizer):
         """
         Creates an instance of GraphNodeLabeler used by this graph
         """
-        self._stylizers["node_labels"] = GraphNodeLabeler.build(*args, **kwargs)
-
-        self._engine_tick()
+        self._set_stylizer("node_labels", GraphNodeLabeler.build(*args, **kwargs))
 
     def color_edges_by(self, *args, **kwargs):
         """
         Creates an instance of GraphEdgeColorizer used by this graph
         """
-        self._stylizers["edge_colors"] = GraphEdgeColorizer.build(*args, **kwargs)
+        stylizer = GraphEdgeColorizer.build(*args, **kwargs)
+        stylizer.use_codes(self._value_codes["edge_colors"])
 
-        self._engine_tick()
+        self._set_stylizer("edge_colors", stylizer)
 
     def shape_edges_by(self, *args, **kwargs):
         """
         Creates an instance of GraphEdgeShaper used by this graph
         """
-        self._stylizers["edge_shapes"] = GraphEdgeShaper.build(*args, **kwargs)
+        stylizer = GraphEdgeShaper.build(*args, **kwargs)
+        stylizer.use_codes(self._value_codes["edge_shapes"])
 
-        self._engine_tick()
+        self._set_stylizer("edge_shapes", stylizer)
 
     def scale_edges_by(self, *args, **kwargs):
         """
@@ -177,21 +475,34 @@ class BaseGraph(Visualizer):
         """
         Creates an instance of GraphEdgeLabeler used by this graph
         """
-        self._stylizers["edge_labels"] = GraphEdgeLabeler.build(*args, **kwargs)
-
-        self._engine_tick()
+        self._set_stylizer("edge_labels", GraphEdgeLabeler.build(*args, **kwargs))
 
     def _default_stylizers(self):
         """
         Creates and saves the default stylizers.
         """
+        # The stylizers set by the algorithm, see _set_stylizer
+        # pylint: disable=attribute-defined-outside-init
+        self._custom_stylizers = set()
+        self._replaced_stylizer = False
         self._stylizers = {  # pylint: disable=attribute-defined-outside-init
-            "node_colors": GraphNodeColorizer.build(lambda u, G: None),
-            "node_shapes": GraphNodeShaper.build(lambda u, G: None),
+            "node_colors": GraphNodeColorizer.build(lambda u, G: None, depends=None),
+            "node_shapes": GraphNodeShaper.build(lambda u, G: None, depends=None),
             "node_scales": None,
-            "node_labels": GraphNodeLabeler.build(lambda u, G: None),
-            "edge_colors": GraphEdgeColorizer.build(lambda u, v, G: None),
-            "edge_shapes": GraphEdgeShaper.build(lambda u, v, G: None),
+            "node_labels": GraphNodeLabeler.build(lambda u, G: None, depends=None),
+            "edge_colors": GraphEdgeColorizer.build(lambda u, v, G: None, depends=None),
+            "edge_shapes": GraphEdgeShaper.build(lambda u, v, G: None, depends=None),
             "edge_scales": None,
-            "edge_labels": GraphEdgeLabeler.build(lambda u, v, G: None),
+            "edge_labels": GraphEdgeLabeler.build(lambda u, v, G: None, depends=None),
         }
+
+        # The values transformed by the colorizers and shapers are stored as codes.
+        # The codes are shared by all the stylizers of a property, so that the
+        # states transformed by a replaced stylizer can still be decoded.
+        self._value_codes = {  # pylint: disable=attribute-defined-outside-init
+            name: ValueCodes()
+            for name in self.CODED_NODE_PROPERTIES + self.CODED_EDGE_PROPERTIES
+        }
+
+        for name, codes in self._value_codes.items():
+            self._stylizers[name].use_codes(codes)
@@ -25,6 +25,8 @@ class DiGraph(networkx.DiGraph, BaseGraph):
         Creates a new instance of DiGraph. A new instance MUST be creating by calling
         engine.DiGraph(), which calls this constructor and forwards the arguments
         """
+        self._init_mutation_tracking()
+
         super().__init__(incoming_graph_data=incoming_graph_data, **attr)
 
         self._engine = attr["_engine"] if "_engine" in attr else None
@@ -25,6 +25,8 @@ class Graph(networkx.Graph, BaseGraph):
         Creates a new instance of Graph. A new instance MUST be creating by calling
         engine.Graph(), which calls this constructor and forwards the arguments
         """
+        self._init_mutation_tracking()
+
         super().__init__(incoming_graph_data=incoming_graph_data, **attr)
 
         self._engine = attr["_engine"] if "_engine" in attr else None
@@ -4,13 +4,15 @@ The GraphColorizer module
 
 import types
 from collections.abc import Iterable
-import seaborn as sns
 from engine.color import Color
+from engine.palettes import DISCRETE_PALETTES, CONTINUOUS_PALETTES
 from exceptions import (
     GraphColorizerException,
     GraphNodeColorizerException,
     GraphEdgeColorizerException,
 )
+from .stylizer_dependencies import StylizerDependencies
+from .unique_values import UniqueValues, ValueCodes
 
 
 class GraphColorizer:
@@ -32,10 +34,9 @@ class GraphColorizer:
     DEFAULT_FALSE_COLOR = None
     DEFAULT_TRUE_COLOR = "DeepSkyBlue"
 
-    DEFAULT_DISCRETE_PALETTE = "hls"  # sns.color_palette("hls", 8)
-    DEFAULT_CONTINUOUS_PALETTE = (
-        "Spectral"  # sns.color_palette("Spectral", as_cmap=True)
-    )
+    # See the palettes module
+    DEFAULT_DISCRETE_PALETTE = "hls"
+    DEFAULT_CONTINUOUS_PALETTE = "Spectral"
 
     def _binary_interpretation(self, true=None, false=None):
         """
@@ -53,8 +54,10 @@ class GraphColorizer:
           - true (color): the color of true values (must be a valid argument of Color)
           - false (color): the color of false values (must be a valid argument of Color)
         """
-        true_color = Color(true) if true is not None else self.DEFAULT_TRUE_COLOR
-        false_color = Color(false) if false is not None else self.DEFAULT_FALSE_COLOR
+        true_color = Color.create(true) if true is not None else self.DEFAULT_TRUE_COLOR
+        false_color = (
+            Color.create(false) if false is not None else self.DEFAULT_FALSE_COLOR
+        )
 
         self._colors = (false_color, true_color)
         self._interpretation = self.BINARY_INTERPRETATION
@@ -81,16 +84,17 @@ class GraphColorizer:
           - colors (int|list|dict): the colors of the groups
         """
         self._interpretation = self.GROUP_INTERPRETATION
+        self._typed_groups = False
 
         if isinstance(colors, int):
-            palette = sns.color_palette(self.DEFAULT_DISCRETE_PALETTE, colors)
-            self._colors = [Color(color) for color in palette]
+            palette = DISCRETE_PALETTES[self.DEFAULT_DISCRETE_PALETTE](colors)
+            self._colors = [Color.create(color) for color in palette]
 
         elif isinstance(colors, list):
-            self._colors = [Color(color) for color in colors]
+            self._colors = [Color.create(color) for color in colors]
 
         elif isinstance(colors, dict):
-            self._colors = {key: Color(color) for key, color in colors.items()}
+            self._colors = {key: Color.create(color) for key, color in colors.items()}
 
         # If _colors is a list, it will be turned into a dict if possible. It may
         # not be possible if there are more unique items than the number of colors
@@ -108,7 +112,10 @@ class GraphColorizer:
                         f"Too few colors: found {len(uniq)} unique values"
                     )
             else:
-                self._colors = dict(zip(sorted(uniq), self._colors[: len(uniq)]))
+                # The values are told apart by their types too, see ValueCodes
+                keys = [ValueCodes.key(value) for value in sorted(uniq)]
+                self._colors = dict(zip(keys, self._colors[: len(uniq)]))
+                self._typed_groups = True
 
     def _identity_interpretation(self):
         """
@@ -130,10 +137,11 @@ class GraphColorizer:
 
         if self._range is None:
             uniq = self._unique_values
-            lower = float("-inf") if uniq else min(uniq)
-            upper = float("+inf") if uniq else max(uniq)
 
-        self._range = (lower, upper)
+            if uniq.lower is None:
+                self._range = (float("-inf"), float("+inf"))
+            else:
+                self._range = (uniq.lower, uniq.upper)
 
     def _guess_interpretation(self):
         """
@@ -146,10 +154,10 @@ class GraphColorizer:
         """
         uniq = self._unique_values
 
-        if uniq in ({True, False}, {True}, {False}, set()):
+        if set(uniq) in ({True, False}, {True}, {False}, set()):
             self._binary_interpretation()
 
-        elif {type(x) for x in uniq} in ({float}, {int, float}):
+        elif uniq.types in ({float}, {int, float}):
             self._spectral_interpretation()
 
         elif Color.are_colors(uniq):
@@ -169,7 +177,10 @@ class GraphColorizer:
             raise Exception(f"Invalid value for graph colorization: {transformed}")
 
         if transformed is not None:
-            self._unique_values.add(transformed)
+            code = self._unique_values.add(transformed)
+
+            if self._use_codes:
+                return code
 
         return transformed
 
@@ -211,6 +222,9 @@ class GraphColorizer:
           - IDENTITY_INTERPRETATION --> None
           - SPECTRAL_INTERPRETATION --> tuple (lower, upper)
         """
+        if self.has_interpretation():
+            return  # Already interpreted when the stylizer was created
+
         if self._colors is not None:
             if isinstance(self._colors, int):
                 if self._colors == 1:
@@ -248,10 +262,16 @@ class GraphColorizer:
         if value is None:
             return None
 
+        if self._use_codes:
+            value = self._unique_values.decode(value)
+
         if self._interpretation == self.BINARY_INTERPRETATION:
             return self._colors[int(bool(value))]
 
         if self._interpretation == self.GROUP_INTERPRETATION:
+            if self._typed_groups:
+                value = ValueCodes.key(value)
+
             return (
                 self._colors[value]
                 if value in self._colors
@@ -259,18 +279,78 @@ class GraphColorizer:
             )
 
         if self._interpretation == self.SPECTRAL_INTERPRETATION:
-            if not isinstance(value, (int, float)):
-                # Do not raise an exception here, instead the node will have no color
-                return self.DEFAULT_FALSE_COLOR
-            lower, upper = self._range
-            point = min(1, max(0, (value - lower) / (upper - lower)))
-            return "color-" + str(point)  # todo: use actual palette
+            return self._spectral_colors([value])[0]
 
         if self._interpretation == self.IDENTITY_INTERPRETATION:
             return value
 
         raise GraphColorizerException("Unknown interpretation type")
 
+    def _spectral_colors(self, values):
+        """
+        Computes the spectral colors of many values at once. All the values are
+        mapped to the points of the continuous palette by a single NumPy call and
+        the colors are looked up in the sampled palette (see the palettes module).
+
+        Values which are not numbers get the DEFAULT_FALSE_COLOR - do not raise an
+        exception here, instead the item will have no color. None stays None.
+
+        parameters:
+          - values (list): The transformed values (not codes)
+
+        returns:
+          - colors (list): The color of every value
+        """
+        # NumPy is imported on the first use only - most runs have no spectral colors
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        lut = CONTINUOUS_PALETTES[self.DEFAULT_CONTINUOUS_PALETTE]
+        numeric = [isinstance(value, (int, float)) for value in values]
+        numbers = np.array(
+            [float(value) if num else 0.0 for value, num in zip(values, numeric)]
+        )
+
+        lower, upper = self._range
+        span = upper - lower
+
+        if np.isfinite(span) and span > 0:
+            points = np.clip((numbers - lower) / span, 0, 1)
+        else:
+            points = np.full(len(values), 0.5)  # Only one value - use the middle
+
+        indices = np.rint(np.nan_to_num(points) * (len(lut) - 1)).astype(int)
+
+        return [
+            None if value is None else lut[i] if num else self.DEFAULT_FALSE_COLOR
+            for value, num, i in zip(values, numeric, indices.tolist())
+        ]
+
+    def compute_many(self, values):
+        """
+        Computes the colors for many values at once. The result is the same as
+        calling compute_single for every value, but the spectral colors are
+        computed in a batch. If the codes are used, the color of every code is
+        computed only once.
+
+        parameters:
+          - values (iterable): The transformed values (or codes)
+
+        returns:
+          - colors (list): The color of every value
+        """
+        if self._interpretation != self.SPECTRAL_INTERPRETATION:
+            return [self.compute_single(value) for value in values]
+
+        if not self._use_codes:
+            return self._spectral_colors(list(values))
+
+        codes = self._unique_values.codes
+
+        if self._code_colors is None or len(self._code_colors) != len(codes):
+            self._code_colors = self._spectral_colors(list(codes))
+
+        return [None if code is None else self._code_colors[code] for code in values]
+
     def compute(self, transformed_state):
         """
         Computes the styles for every item in the transformed_style dict
@@ -285,6 +365,52 @@ class GraphColorizer:
         """
         raise NotImplementedError()
 
+    def _has_fixed_interpretation(self):
+        """
+        Returns True if the interpretation is fully determined by the color(s)
+        argument and does not depend on the unique values. This is the case for
+          - a single color (or a list with one color) --> BINARY_INTERPRETATION
+          - a dict value to color --> GROUP_INTERPRETATION
+
+        The number of colors or a list of colors is associated with the sorted unique
+        values, therefore such interpretation is known only after the run.
+        """
+        if self._colors is None:
+            return False
+
+        if isinstance(self._colors, int):
+            return self._colors == 1
+
+        if Color.is_color(self._colors):
+            return True
+
+        if isinstance(self._colors, list):
+            return len(self._colors) == 1
+
+        return isinstance(self._colors, dict)
+
+    def can_compute(self):
+        """
+        Returns True if the style can be computed before the execution of the
+        visualized algorithm has ended. This is the case if the interpretation is
+        already known or if all the transformed values have been None so far -
+        None has no style in any interpretation.
+        """
+        return self.has_interpretation() or not self._unique_values
+
+    def use_codes(self, codes):
+        """
+        States that the transformed states will hold the codes of the values
+        instead of the values themselves. The codes are turned back into the
+        values when the colors are computed. This method MUST be called before the
+        first transformation.
+
+        parameters:
+          - codes (ValueCodes): The codes shared by the stylizers of the property
+        """
+        self._unique_values = UniqueValues(codes)
+        self._use_codes = True
+
     def has_interpretation(self):
         """
         Returns True if an interpretation has been specified
@@ -430,8 +556,11 @@ class GraphColorizer:
 
         self._transform = transform
 
-        self._unique_values = set()
+        self._unique_values = UniqueValues()
+        self._use_codes = False
+        self._code_colors = None
         self._interpretation = None
+        self._typed_groups = False
 
         self._colors = None
         self._palette = None
@@ -469,10 +598,21 @@ class GraphColorizer:
                 f"Invalid value for parameter range: {self._range}"
             )
 
+        if not StylizerDependencies.validate(kwargs):
+            raise GraphColorizerException(
+                f"Invalid value for parameter depends: {kwargs['depends']}"
+            )
+
+        self.dependencies = StylizerDependencies(kwargs)
+
         self._prepare_colors()
         self._prepare_palette()
         self._prepare_range()
 
+        # The style can be computed during the run if the interpretation is known
+        if self._has_fixed_interpretation():
+            self.interpret()
+
 
 class GraphNodeColorizer(GraphColorizer):
     """
@@ -512,9 +652,9 @@ class GraphNodeColorizer(GraphColorizer):
         if transformed_state is None:
             return None
 
-        return {
-            key: self.compute_single(value) for key, value in transformed_state.items()
-        }
+        colors = self.compute_many(transformed_state.values())
+
+        return dict(zip(transformed_state.keys(), colors))
 
     @staticmethod
     def build(*args, **kwargs):
@@ -526,6 +666,7 @@ class GraphNodeColorizer(GraphColorizer):
 
         if len(args) == 1:
             if isinstance(args[0], Iterable):
+                StylizerDependencies.default_collection(kwargs, args[0])
                 return GraphNodeColorizer.build(lambda v, g: v in args[0], **kwargs)
 
             if isinstance(args[0], types.FunctionType):
@@ -539,6 +680,7 @@ class GraphNodeColorizer(GraphColorizer):
             raise GraphNodeColorizerException("Source not specified")
 
         prop = kwargs["prop"]
+        StylizerDependencies.default_graph_only(kwargs)
         transform = lambda v, G: None if prop not in G.nodes[v] else G.nodes[v][prop]
         return GraphNodeColorizer.build(transform, **kwargs)
 
@@ -584,16 +726,18 @@ class GraphEdgeColorizer(GraphColorizer):
         if transformed_state is None:
             return None
 
-        res = {}
-
-        for u in transformed_state.keys():
-            if u not in res:
-                res[u] = {}
-
-            for v in transformed_state[u].keys():
-                res[u][v] = self.compute_single(transformed_state[u][v])
+        colors = iter(
+            self.compute_many(
+                value
+                for values in transformed_state.values()
+                for value in values.values()
+            )
+        )
 
-        return res
+        return {
+            u: {v: next(colors) for v in values}
+            for u, values in transformed_state.items()
+        }
 
     @staticmethod
     def build(*args, **kwargs):
@@ -605,6 +749,7 @@ class GraphEdgeColorizer(GraphColorizer):
 
         if len(args) == 1:
             if isinstance(args[0], Iterable):
+                StylizerDependencies.default_collection(kwargs, args[0])
                 transform = lambda u, v, G: (u, v) in args[0] or (v, u) in args[0]
                 return GraphEdgeColorizer.build(transform, **kwargs)
 
@@ -619,6 +764,7 @@ class GraphEdgeColorizer(GraphColorizer):
             raise GraphEdgeColorizerException("Source not specified")
 
         prop = kwargs["prop"]
+        StylizerDependencies.default_graph_only(kwargs)
         transform = lambda u, v, G: (
             None if prop not in G.edges[u, v] else G.edges[u, v][prop]
         )
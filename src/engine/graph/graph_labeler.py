@@ -9,6 +9,7 @@ from exceptions import (
     GraphEdgeLabelerException,
     GraphNodeLabelerException,
 )
+from .stylizer_dependencies import StylizerDependencies
 
 
 class GraphLabeler:
@@ -64,6 +65,14 @@ class GraphLabeler:
         therefore this method is empty.
         """
 
+    def can_compute(self):
+        """
+        Returns True if the style can be computed before the execution of the
+        visualized algorithm has ended. The labels do not depend on the
+        interpretation, therefore this is always the case.
+        """
+        return True
+
     def compute_single(self, value):
         """
         Computes the label for the single specified value.
@@ -120,6 +129,13 @@ class GraphLabeler:
         if self._format is None and self._separator is None:
             self._separator = ", "
 
+        if not StylizerDependencies.validate(kwargs):
+            raise GraphLabelerException(
+                f"Invalid value for parameter depends: {kwargs['depends']}"
+            )
+
+        self.dependencies = StylizerDependencies(kwargs)
+
         # todo: implement
         # if not GraphLabeler.validate_format(self._format):
         #   raise GraphLabelerException(f'Invalid value for parameter format: {self._format}')
@@ -200,6 +216,7 @@ class GraphNodeLabeler(GraphLabeler):
             raise GraphNodeLabelerException("Source not specified")
 
         props = list(props) if isinstance(props, Iterable) else [props]
+        StylizerDependencies.default_graph_only(kwargs)
 
         transform = lambda v, G: (
             "" if prop not in G.nodes[v] else G.nodes[v][prop] for prop in props
@@ -289,6 +306,7 @@ class GraphEdgeLabeler(GraphLabeler):
             raise GraphEdgeLabelerException("Source not specified")
 
         props = list(props) if isinstance(props, Iterable) else [props]
+        StylizerDependencies.default_graph_only(kwargs)
 
         transform = lambda u, v, G: (
             "" if prop not in G.edges[u, v] else G.edges[u, v][prop] for prop in props
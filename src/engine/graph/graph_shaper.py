@@ -11,6 +11,8 @@ from exceptions import (
     GraphNodeShaperException,
     GraphEdgeShaperException,
 )
+from .stylizer_dependencies import StylizerDependencies
+from .unique_values import UniqueValues, ValueCodes
 
 
 class GraphShaper:
@@ -82,6 +84,7 @@ class GraphShaper:
           - shapes (int|list|dict): the shapes of the groups
         """
         self._interpretation = self.GROUP_INTERPRETATION
+        self._typed_groups = False
 
         if isinstance(shapes, int):
             max_shapes = len(self.available_shapes) - 1
@@ -120,7 +123,10 @@ class GraphShaper:
                         f"Too few shapes: found {len(uniq)} unique values"
                     )
             else:
-                self._shapes = dict(zip(sorted(uniq), self._shapes[: len(uniq)]))
+                # The values are told apart by their types too, see ValueCodes
+                keys = [ValueCodes.key(value) for value in sorted(uniq)]
+                self._shapes = dict(zip(keys, self._shapes[: len(uniq)]))
+                self._typed_groups = True
 
     def _identity_interpretation(self):
         """
@@ -138,7 +144,7 @@ class GraphShaper:
         """
         uniq = self._unique_values
 
-        if uniq in ({True, False}, {True}, {False}, set()):
+        if set(uniq) in ({True, False}, {True}, {False}, set()):
             self._binary_interpretation()
 
         elif self.Shape.are_shapes(uniq):
@@ -157,7 +163,10 @@ class GraphShaper:
             raise GraphShaperException(f"Invalid value for graph shape: {transformed}")
 
         if transformed is not None:
-            self._unique_values.add(transformed)
+            code = self._unique_values.add(transformed)
+
+            if self._use_codes:
+                return code
 
         return transformed
 
@@ -192,6 +201,9 @@ class GraphShaper:
           - GROUP_INTERPRETATION    --> dict value to shape
           - IDENTITY_INTERPRETATION --> None
         """
+        if self.has_interpretation():
+            return  # Already interpreted when the stylizer was created
+
         if self._shapes is not None:
             if isinstance(self._shapes, int):
                 if self._shapes == 1:
@@ -227,10 +239,16 @@ class GraphShaper:
         if value is None:
             return None
 
+        if self._use_codes:
+            value = self._unique_values.decode(value)
+
         if self._interpretation == self.BINARY_INTERPRETATION:
             return self._shapes[int(bool(value))]
 
         if self._interpretation == self.GROUP_INTERPRETATION:
+            if self._typed_groups:
+                value = ValueCodes.key(value)
+
             return (
                 self._shapes[value]
                 if value in self._shapes
@@ -256,6 +274,52 @@ class GraphShaper:
         """
         raise NotImplementedError()
 
+    def _has_fixed_interpretation(self):
+        """
+        Returns True if the interpretation is fully determined by the shape(s)
+        argument and does not depend on the unique values. This is the case for
+          - a single shape (or a list with one shape) --> BINARY_INTERPRETATION
+          - a dict value to shape --> GROUP_INTERPRETATION
+
+        The number of shapes or a list of shapes is associated with the sorted unique
+        values, therefore such interpretation is known only after the run.
+        """
+        if self._shapes is None:
+            return False
+
+        if isinstance(self._shapes, int):
+            return self._shapes == 1
+
+        if self.Shape.is_shape(self._shapes):
+            return True
+
+        if isinstance(self._shapes, list):
+            return len(self._shapes) == 1
+
+        return isinstance(self._shapes, dict)
+
+    def can_compute(self):
+        """
+        Returns True if the style can be computed before the execution of the
+        visualized algorithm has ended. This is the case if the interpretation is
+        already known or if all the transformed values have been None so far -
+        None has no style in any interpretation.
+        """
+        return self.has_interpretation() or not self._unique_values
+
+    def use_codes(self, codes):
+        """
+        States that the transformed states will hold the codes of the values
+        instead of the values themselves. The codes are turned back into the
+        values when the shapes are computed. This method MUST be called before the
+        first transformation.
+
+        parameters:
+          - codes (ValueCodes): The codes shared by the stylizers of the property
+        """
+        self._unique_values = UniqueValues(codes)
+        self._use_codes = True
+
     def has_interpretation(self):
         """
         Returns True if an interpretation has been specified
@@ -329,8 +393,10 @@ class GraphShaper:
 
         self._transform = transform
 
-        self._unique_values = set()
+        self._unique_values = UniqueValues()
+        self._use_codes = False
         self._interpretation = None
+        self._typed_groups = False
 
         self._shapes = None
 
@@ -345,8 +411,19 @@ class GraphShaper:
                 f"Invalid value for parameter shape(s): {self._shapes}"
             )
 
+        if not StylizerDependencies.validate(kwargs):
+            raise GraphShaperException(
+                f"Invalid value for parameter depends: {kwargs['depends']}"
+            )
+
+        self.dependencies = StylizerDependencies(kwargs)
+
         self._prepare_shapes()
 
+        # The style can be computed during the run if the interpretation is known
+        if self._has_fixed_interpretation():
+            self.interpret()
+
 
 class GraphNodeShaper(GraphShaper):
     """
@@ -406,6 +483,7 @@ class GraphNodeShaper(GraphShaper):
 
         if len(args) == 1:
             if isinstance(args[0], Iterable):
+                StylizerDependencies.default_collection(kwargs, args[0])
                 return GraphNodeShaper.build(lambda v, g: v in args[0], **kwargs)
 
             if isinstance(args[0], types.FunctionType):
@@ -419,6 +497,7 @@ class GraphNodeShaper(GraphShaper):
             raise GraphNodeShaperException("Source not specified")
 
         prop = kwargs["prop"]
+        StylizerDependencies.default_graph_only(kwargs)
         transform = lambda v, G: None if prop not in G.nodes[v] else G.nodes[v][prop]
         return GraphNodeShaper.build(transform, **kwargs)
 
@@ -491,6 +570,7 @@ class GraphEdgeShaper(GraphShaper):
 
         if len(args) == 1:
             if isinstance(args[0], Iterable):
+                StylizerDependencies.default_collection(kwargs, args[0])
                 return GraphEdgeShaper.build(
                     lambda u, v, G: (u, v) in args[0], **kwargs
                 )
@@ -506,6 +586,7 @@ class GraphEdgeShaper(GraphShaper):
             raise GraphEdgeShaperException("Source not specified")
 
         prop = kwargs["prop"]
+        StylizerDependencies.default_graph_only(kwargs)
         transform = lambda u, v, G: (
             None if prop not in G.edges[u, v] else G.edges[u, v][prop]
         )
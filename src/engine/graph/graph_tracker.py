@@ -0,0 +1,139 @@
+"""
+The graph mutation tracking module
+"""
+
+# The types of the values which cannot be mutated in place
+IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, range)
+
+
+def is_immutable(value):
+    """
+    Returns True if the value cannot be mutated in place - it is of an immutable
+    type or it is a tuple or a frozenset of such values.
+    """
+    if isinstance(value, IMMUTABLE_TYPES):
+        return True
+
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_immutable(item) for item in value)
+
+    return False
+
+
+class MutationCounter:
+    """
+    A simple counter which is incremented every time a tracked graph is mutated.
+    Comparing the version of the counter is enough to find out whether a graph
+    has changed since some point in time.
+
+    The in-place mutations of the stored values (eg. G.nodes[v]["dist"].append(x))
+    cannot be counted. Once a mutable value has been stored in the graph, the
+    graph is `volatile` - the version cannot tell whether it has changed.
+    """
+
+    def touch(self):
+        """
+        Marks the graph as mutated.
+        """
+        self.version += 1
+
+    def __init__(self):
+        """
+        Creates a new instance of MutationCounter.
+        """
+        self.version = 0
+        self.volatile = False
+
+
+class TrackedDict(dict):
+    """
+    A dict which increments a MutationCounter on every write. All the dicts of
+    a graph (adjacency, node attributes, edge attributes, ...) are instances of
+    this class - see BaseGraph._init_mutation_tracking. This means that all the
+    following mutations are tracked:
+      - adding and removing nodes and edges
+      - writes via G.nodes[v][...], G.edges[u, v][...] and G.graph[...]
+
+    The values written are checked - a mutable value (other than another tracked
+    dict) makes the graph volatile, see MutationCounter. The values of the private
+    keys (starting with an underscore, eg. the reference to the engine) are not
+    checked.
+
+    Only the writes are overridden, reads have the same speed as a plain dict.
+    """
+
+    # Not set while the dict is being unpickled - the items are restored before
+    # the instance attributes
+    _counter = None
+
+    def _touch(self):
+        """
+        Increments the counter if there is one.
+        """
+        if self._counter is not None:
+            self._counter.touch()
+
+    def _check(self, items):
+        """
+        Marks the graph as volatile if any of the values of the items is mutable.
+        """
+        counter = self._counter
+
+        if counter is None or counter.volatile:
+            return
+
+        for key, value in items:
+            if isinstance(key, str) and key.startswith("_"):
+                continue
+
+            if not isinstance(value, TrackedDict) and not is_immutable(value):
+                counter.volatile = True
+                return
+
+    def __setitem__(self, key, value):
+        self._touch()
+        self._check(((key, value),))
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._touch()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._touch()
+        self._check(other.items())
+        return super().__ior__(other)
+
+    def clear(self):
+        self._touch()
+        super().clear()
+
+    def pop(self, *args):
+        self._touch()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._touch()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._touch()
+        self._check(((key, default),))
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        self._touch()
+        other = dict(*args, **kwargs)
+        self._check(other.items())
+        super().update(other)
+
+    def __init__(self, *args, counter=None, **kwargs):
+        """
+        Creates a new instance of TrackedDict.
+
+        parameters:
+          - counter (MutationCounter): the counter to increment on every write
+        """
+        super().__init__(*args, **kwargs)
+        self._counter = counter
+        self._check(self.items())
@@ -0,0 +1,119 @@
+"""
+The stylizer dependencies module
+"""
+
+import copy
+from collections.abc import Collection
+
+
+class CollectionSnapshot:
+    """
+    The dependencies of a stylizer built from a collection - the transformation
+    only tests the membership in the collection. The snapshot is a frozenset of
+    the items, which needs no deep copy. Collections of unhashable items are
+    deep copied as a tuple.
+    """
+
+    def __call__(self):
+        try:
+            return frozenset(self._source)
+        except TypeError:
+            return copy.deepcopy(tuple(self._source))
+
+    def __init__(self, source):
+        """
+        Creates a new instance of CollectionSnapshot.
+
+        parameters:
+          - source (Collection): The source of the stylizer
+        """
+        self._source = source
+
+
+class StylizerDependencies:
+    """
+    Describes the state which the transformation of a stylizer depends on. The
+    transformation is always allowed to read the graph. Whether it reads anything
+    else is specified by the `depends` argument of the stylizer:
+      - omitted: the transformation may read anything, it is never cached
+      - None: the transformation only reads the graph
+      - callable: the transformation reads the graph and the state returned by
+        the callable (eg. `depends=lambda: observing`)
+
+    The value returned by the callable is copied and compared with the value
+    returned during the previous transformation. If the values are equal and the
+    graph has not been mutated, the previous transformed state is reused.
+    """
+
+    @staticmethod
+    def validate(kwargs):
+        """
+        Validates the value of the `depends` argument.
+
+        parameters:
+          - kwargs (dict): The arguments of the stylizer
+
+        returns:
+          - validity (bool): True if valid False otherwise
+        """
+        if "depends" not in kwargs:
+            return True
+
+        return kwargs["depends"] is None or callable(kwargs["depends"])
+
+    @staticmethod
+    def default_graph_only(kwargs):
+        """
+        States that the transformation only reads the graph unless the `depends`
+        argument was specified. Used by the stylizers which are built from a
+        property name.
+
+        parameters:
+          - kwargs (dict): The arguments of the stylizer, modified in place
+        """
+        kwargs.setdefault("depends", None)
+
+    @staticmethod
+    def default_collection(kwargs, source):
+        """
+        States that the transformation reads the graph and the specified source
+        collection unless the `depends` argument was specified. Used by the
+        stylizers which are built from a collection of items. Iterators cannot be
+        read twice - the transformation is never cached for them.
+
+        parameters:
+          - kwargs (dict): The arguments of the stylizer, modified in place
+          - source (iterable): The source of the stylizer
+        """
+        if isinstance(source, Collection):
+            kwargs.setdefault("depends", CollectionSnapshot(source))
+
+    def is_known(self):
+        """
+        Returns True if the dependencies were declared and the transformation can
+        be cached.
+        """
+        return self._known
+
+    def snapshot(self):
+        """
+        Returns a copy of the current value of the dependencies. None is returned
+        if the transformation only reads the graph.
+        """
+        if self._depends is None:
+            return None
+
+        if isinstance(self._depends, CollectionSnapshot):
+            return self._depends()
+
+        return copy.deepcopy(self._depends())
+
+    def __init__(self, kwargs):
+        """
+        Creates a new instance of StylizerDependencies.
+
+        parameters:
+          - kwargs (dict): The arguments of the stylizer
+        """
+        self._known = "depends" in kwargs
+        self._depends = kwargs["depends"] if self._known else None
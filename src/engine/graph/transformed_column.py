@@ -0,0 +1,106 @@
+"""
+The transformed column module
+"""
+
+from array import array
+
+
+class TransformedColumn:
+    """
+    Columnar storage of the transformed values of a stylizer which uses codes
+    (see ValueCodes). Instead of a dict item to value, the transformed state of
+    such stylizer is a single array of the codes - one code for every item:
+      - nodes: the codes are in the order of the nodes of the transformed state
+      - edges: the codes are in the order of the edges of the transformed state
+
+    The list of the nodes (edges) of the transformed state is the index of the
+    column - the columns of all stylizers share it. None is stored as NONE.
+
+    Every code takes a few bytes only and two columns are compared as buffers.
+    """
+
+    NONE = -1
+    TYPECODE = "i"
+
+    @staticmethod
+    def _encode(code):
+        """
+        Returns the code to store in a column
+        """
+        return TransformedColumn.NONE if code is None else code
+
+    @staticmethod
+    def _decode(code):
+        """
+        Returns the code stored in a column as the transformed value
+        """
+        return None if code == TransformedColumn.NONE else code
+
+    @staticmethod
+    def from_nodes(transformed):
+        """
+        Creates a column from the transformed state of a node stylizer.
+
+        parameters:
+          - transformed (dict): node to code, in the order of the nodes
+
+        returns:
+          - column (array<int>): the codes
+        """
+        return array(
+            TransformedColumn.TYPECODE,
+            [TransformedColumn._encode(code) for code in transformed.values()],
+        )
+
+    @staticmethod
+    def from_edges(transformed, edges):
+        """
+        Creates a column from the transformed state of an edge stylizer.
+
+        parameters:
+          - transformed (dict): u to v to code
+          - edges (iterable): the edges of the graph
+
+        returns:
+          - column (array<int>): the codes, in the order of the edges
+        """
+        return array(
+            TransformedColumn.TYPECODE,
+            [TransformedColumn._encode(transformed[u][v]) for u, v in edges],
+        )
+
+    @staticmethod
+    def to_nodes(column, nodes):
+        """
+        Turns a column back into the transformed state of a node stylizer.
+
+        parameters:
+          - column (array<int>): the codes
+          - nodes (list): the nodes of the transformed state
+
+        returns:
+          - transformed (dict): node to code
+        """
+        return {v: TransformedColumn._decode(code) for v, code in zip(nodes, column)}
+
+    @staticmethod
+    def to_edges(column, edges):
+        """
+        Turns a column back into the transformed state of an edge stylizer.
+
+        parameters:
+          - column (array<int>): the codes
+          - edges (list): the edges of the transformed state
+
+        returns:
+          - transformed (dict): u to v to code
+        """
+        res = {}
+
+        for (u, v), code in zip(edges, column):
+            if u not in res:
+                res[u] = {}
+
+            res[u][v] = TransformedColumn._decode(code)
+
+        return res
@@ -0,0 +1,161 @@
+"""
+The unique values module
+"""
+
+
+class ValueCodes:
+    """
+    Assigns a small integer code to every distinct transformed value. The codes
+    can be stored in the transformed states instead of the values themselves -
+    equal values then share one code object no matter how many ticks retain
+    them.
+
+    The codes are shared by all the stylizers of a graph property, so that the
+    states transformed by a replaced stylizer can still be decoded.
+
+    The values are told apart by their types too - 1, 1.0 and True are equal, but
+    they are different styles (labels, colors), so they get different codes.
+    """
+
+    @staticmethod
+    def key(value):
+        """
+        Returns the key which tells the value apart from the equal values of other
+        types
+        """
+        return type(value), value
+
+    def encode(self, value):
+        """
+        Returns the code of the value. A new code is assigned to a new value.
+
+        parameters:
+          - value (hashable): The transformed value
+
+        returns:
+          - code (int): The code of the value
+        """
+        key = self.key(value)
+        code = self._codes.get(key)
+
+        if code is None:
+            code = len(self._values)
+
+            self._codes[key] = code
+            self._values.append(value)
+
+        return code
+
+    def decode(self, code):
+        """
+        Returns the value with the specified code.
+
+        parameters:
+          - code (int): The code returned by the method `encode`
+
+        returns:
+          - value (hashable): The transformed value
+        """
+        return self._values[code]
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __init__(self):
+        """
+        Creates a new instance of ValueCodes
+        """
+        self._codes = {}
+        self._values = []
+
+
+class UniqueValues:
+    """
+    Collects the unique values transformed by a stylizer while the visualized
+    algorithm runs. Besides the values themselves, the following running
+    aggregates are kept, so that the interpretation does not have to go through
+    the values again:
+      - types: the set of the types of the unique values
+      - lower: the lowest numeric value (None if there are no numeric values)
+      - upper: the highest numeric value (None if there are no numeric values)
+
+    The instances behave like a set of the unique values - they can be iterated,
+    sorted and measured by len.
+
+    At most MAX_VALUES unique values are kept. Once the limit is reached, the flag
+    `overflow` is set and the new values only update the aggregates above (the
+    codes still keep every value, the transformed states refer to them).
+    """
+
+    MAX_VALUES = 10000
+
+    def add(self, value):
+        """
+        Adds the value to the unique values unless an equal value of the same type
+        has been added.
+
+        parameters:
+          - value (hashable): The transformed value
+
+        returns:
+          - code (int): The code of the value, see ValueCodes
+        """
+        key = ValueCodes.key(value)
+        code = self._seen.get(key)
+
+        if code is not None:
+            return code
+
+        code = self.codes.encode(value)
+
+        if len(self._seen) < self.MAX_VALUES:
+            self._seen[key] = code
+            self._values.append(value)
+        else:
+            self.overflow = True
+
+        self.types.add(type(value))
+
+        if isinstance(value, (int, float)):
+            self.lower = value if self.lower is None else min(self.lower, value)
+            self.upper = value if self.upper is None else max(self.upper, value)
+
+        return code
+
+    def decode(self, code):
+        """
+        Returns the value with the specified code. The value may have been added
+        to another instance sharing the same codes.
+
+        parameters:
+          - code (int): The code returned by the method `add`
+
+        returns:
+          - value (hashable): The transformed value
+        """
+        return self.codes.decode(code)
+
+    def __len__(self):
+        return len(self._seen)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __init__(self, codes=None):
+        """
+        Creates a new instance of UniqueValues
+
+        parameters:
+          - codes (ValueCodes): The codes to use, new codes are created if omitted
+        """
+        self._seen = {}
+        self._values = []
+
+        self.codes = ValueCodes() if codes is None else codes
+        self.types = set()
+        self.lower = None
+        self.upper = None
+        self.overflow = False
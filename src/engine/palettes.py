@@ -0,0 +1,84 @@
+"""
+The palettes module
+
+The palettes used by the colorizers are defined here, so that computing the
+colors never calls into seaborn or matplotlib at runtime.
+"""
+
+import colorsys
+
+# The continuous Spectral palette sampled at 256 evenly spaced inner points (the
+# ends are excluded like seaborn does), as RGBA hex colors. Generated by:
+#   [Color(tuple(rgb)).to_hex() for rgb in seaborn.color_palette("Spectral", 256)]
+# which is the same as sampling the colormap at numpy.linspace(0, 1, 258)[1:-1]
+# fmt: off
+SPECTRAL_LUT = (
+    "#9e0142ff", "#a00343ff", "#a20643ff", "#a40844ff", "#a70b44ff", "#a90d45ff", "#ab0f45ff",
+    "#ad1246ff", "#af1446ff", "#b11747ff", "#b41947ff", "#b61b48ff", "#b81e48ff", "#ba2049ff",
+    "#bc2249ff", "#be254aff", "#c1274aff", "#c32a4bff", "#c52c4bff", "#c72e4cff", "#c9314cff",
+    "#cb334dff", "#cd364dff", "#d0384eff", "#d23a4eff", "#d43d4fff", "#d63f4fff", "#d7414eff",
+    "#d8434eff", "#d9444dff", "#da464dff", "#dc484cff", "#dd4a4cff", "#de4c4bff", "#df4e4bff",
+    "#e1504bff", "#e2514aff", "#e3534aff", "#e45549ff", "#e55749ff", "#e75948ff", "#e85b48ff",
+    "#e95c47ff", "#ea5e47ff", "#eb6046ff", "#ed6246ff", "#ee6445ff", "#ef6645ff", "#f06744ff",
+    "#f26944ff", "#f36b43ff", "#f46d43ff", "#f47044ff", "#f57245ff", "#f57547ff", "#f57748ff",
+    "#f67a49ff", "#f67c4aff", "#f67f4bff", "#f7814cff", "#f7844eff", "#f8864fff", "#f88950ff",
+    "#f88c51ff", "#f98e52ff", "#f99153ff", "#f99355ff", "#fa9656ff", "#fa9857ff", "#fa9b58ff",
+    "#fb9d59ff", "#fba05bff", "#fba35cff", "#fca55dff", "#fca85eff", "#fcaa5fff", "#fdad60ff",
+    "#fdaf62ff", "#fdb163ff", "#fdb365ff", "#fdb567ff", "#fdb768ff", "#fdb96aff", "#fdbb6cff",
+    "#fdbd6dff", "#fdbf6fff", "#fdc171ff", "#fdc372ff", "#fdc574ff", "#fdc776ff", "#fec877ff",
+    "#feca79ff", "#fecc7bff", "#fece7cff", "#fed07eff", "#fed27fff", "#fed481ff", "#fed683ff",
+    "#fed884ff", "#feda86ff", "#fedc88ff", "#fede89ff", "#fee08bff", "#fee18dff", "#fee28fff",
+    "#fee491ff", "#fee593ff", "#fee695ff", "#fee797ff", "#fee999ff", "#feea9bff", "#feeb9dff",
+    "#feec9fff", "#feeda1ff", "#feefa3ff", "#fff0a6ff", "#fff1a8ff", "#fff2aaff", "#fff3acff",
+    "#fff5aeff", "#fff6b0ff", "#fff7b2ff", "#fff8b4ff", "#fffab6ff", "#fffbb8ff", "#fffcbaff",
+    "#fffdbcff", "#fffebeff", "#ffffbeff", "#fefebdff", "#fdfebbff", "#fcfebaff", "#fbfdb8ff",
+    "#fafdb7ff", "#f9fcb5ff", "#f8fcb4ff", "#f7fcb2ff", "#f6fbb0ff", "#f5fbafff", "#f4faadff",
+    "#f3faacff", "#f2faaaff", "#f1f9a9ff", "#f0f9a7ff", "#eff9a6ff", "#eef8a4ff", "#edf8a3ff",
+    "#ecf7a1ff", "#ebf7a0ff", "#eaf79eff", "#e9f69dff", "#e8f69bff", "#e7f59aff", "#e6f598ff",
+    "#e4f498ff", "#e1f399ff", "#dff299ff", "#ddf19aff", "#daf09aff", "#d8ef9bff", "#d6ee9bff",
+    "#d3ed9cff", "#d1ed9cff", "#cfec9dff", "#cdeb9dff", "#caea9eff", "#c8e99eff", "#c6e89fff",
+    "#c3e79fff", "#c1e6a0ff", "#bfe5a0ff", "#bce4a0ff", "#bae3a1ff", "#b8e2a1ff", "#b5e1a2ff",
+    "#b3e0a2ff", "#b1dfa3ff", "#aedea3ff", "#acdda4ff", "#aadca4ff", "#a7dba4ff", "#a4daa4ff",
+    "#a2d9a4ff", "#9fd8a4ff", "#9cd7a4ff", "#99d6a4ff", "#97d5a4ff", "#94d4a4ff", "#91d3a4ff",
+    "#8fd2a4ff", "#8cd1a4ff", "#89d0a4ff", "#86cfa5ff", "#84cea5ff", "#81cda5ff", "#7ecca5ff",
+    "#7ccaa5ff", "#79c9a5ff", "#76c8a5ff", "#74c7a5ff", "#71c6a5ff", "#6ec5a5ff", "#6bc4a5ff",
+    "#69c3a5ff", "#66c2a5ff", "#64c0a6ff", "#62bda7ff", "#60bba8ff", "#5eb9a9ff", "#5cb7aaff",
+    "#5ab4abff", "#58b2acff", "#56b0adff", "#54aeadff", "#52abaeff", "#50a9afff", "#4ea7b0ff",
+    "#4ba4b1ff", "#49a2b2ff", "#47a0b3ff", "#459eb4ff", "#439bb5ff", "#4199b6ff", "#3f97b7ff",
+    "#3d95b8ff", "#3b92b9ff", "#3990baff", "#378ebbff", "#358bbcff", "#3389bdff", "#3387bcff",
+    "#3585bbff", "#3682baff", "#3880b9ff", "#3a7eb8ff", "#3b7cb7ff", "#3d79b6ff", "#3f77b5ff",
+    "#4175b4ff", "#4273b3ff", "#4471b2ff", "#466eb1ff", "#486cb0ff", "#496aafff", "#4b68aeff",
+    "#4d65adff", "#4e63acff", "#5061aaff", "#525fa9ff", "#545ca8ff", "#555aa7ff", "#5758a6ff",
+    "#5956a5ff", "#5b53a4ff", "#5c51a3ff", "#5e4fa2ff",
+)
+# fmt: on
+
+
+def hls_palette(n_colors, h=0.01, l=0.6, s=0.65):  # pylint: disable=invalid-name
+    """
+    Returns n_colors evenly spaced hues in the HLS color space. The colors are the
+    same as the colors of seaborn.color_palette("hls", n_colors).
+
+    parameters:
+      - n_colors (int): the number of colors
+      - h (float): the first hue
+      - l (float): the lightness
+      - s (float): the saturation
+
+    returns:
+      - palette (list<tuple>): the colors as RGB tuples of floats
+    """
+    hues = [(h + i / n_colors) % 1 for i in range(n_colors)]
+
+    return [colorsys.hls_to_rgb(hue, l, s) for hue in hues]
+
+
+# The discrete palettes by name - a function of the number of colors
+DISCRETE_PALETTES = {
+    "hls": hls_palette,
+}
+
+# The continuous palettes by name - a sampled palette
+CONTINUOUS_PALETTES = {
+    "Spectral": SPECTRAL_LUT,
+}
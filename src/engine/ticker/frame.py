@@ -2,6 +2,8 @@
 The frame module
 """
 
+from engine.fingerprint import fingerprint
+
 
 class Frame:
     """
@@ -55,15 +57,33 @@ class Frame:
         components are equal.
 
         Frame defines the __eq__ method to compare the neighbouring frames. If two
-        neighbouring frames are identical, they will be merged.
+        neighbouring frames are identical, they will be merged. The fingerprints
+        are compared first, the components only if the fingerprints are equal.
         """
         if not isinstance(value, Frame):
             return False
 
         # todo: think more about the comparison.
 
+        if self.get_fingerprint() != value.get_fingerprint():
+            return False
+
         return self.components == value.components
 
+    def get_fingerprint(self):
+        """
+        Returns the fingerprint of the components (see the fingerprint module).
+        The fingerprint is computed on the first call unless it was passed to the
+        constructor.
+
+        returns:
+          - fingerprint (int): the fingerprint of the components
+        """
+        if self._fingerprint is None:
+            self._fingerprint = hash(tuple(map(fingerprint, self.components)))
+
+        return self._fingerprint
+
     def merge_with(self, frame):
         """
         Merges this frame with the specified frame.
@@ -80,7 +100,7 @@ class Frame:
 
         return self
 
-    def __init__(self, lineno, console_logs, components):
+    def __init__(self, lineno, console_logs, components, frame_fingerprint=None):
         """
         Creates a new instance of Frame.
 
@@ -89,7 +109,11 @@ class Frame:
           - console_logs (string): The text printed by the overloaded print method
           - components (list): The list of component's styles. Result of the
             compute_style method. See Tick.to_frame method.
+          - frame_fingerprint (int): The fingerprint of the components if known,
+            see Visualizer.get_style_fingerprint
         """
         self.lineno = lineno
         self.console_logs = console_logs
         self.components = components
+
+        self._fingerprint = frame_fingerprint
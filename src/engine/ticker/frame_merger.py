@@ -0,0 +1,69 @@
+"""
+The frame merger module
+"""
+
+
+class FrameMerger:
+    """
+    Merges the frames one by one as they are created. The result is the same as
+    if all frames were merged at once:
+
+      Phase 1 - assume the first frame is important. Use this frame for
+      comparison. Skip the following frames until a frame differs or has some
+      console logs. When this happens, use this frame for comparison.
+
+      Phase 2 - neighbouring frames which are equal and both have console logs
+      are merged into one.
+
+    Falsy frames are ignored. See Frame.__bool__ for more information about the
+    definition of truthyness.
+    """
+
+    def push(self, frame):
+        """
+        Merges the specified frame with the frames pushed so far.
+
+        parameters:
+          - frame (Frame): The next frame
+        """
+        if not frame:
+            return
+
+        # Phase 1
+        prev = self._last
+        self._last = frame
+
+        if prev is not None and prev == frame and not frame.console_logs:
+            return
+
+        # Phase 2
+        if self.frames:
+            last = self.frames[-1]
+
+            if last == frame and bool(last.console_logs) and bool(frame.console_logs):
+                self.frames[-1] = frame.merge_with(last)
+                return
+
+        self.frames.append(frame)
+
+    def copy(self):
+        """
+        Returns a copy of this merger. Pushing frames to the copy does not change
+        the frames of this merger.
+
+        returns:
+          - merger (FrameMerger): The copy
+        """
+        merger = FrameMerger()
+        merger.frames = list(self.frames)
+        merger._last = self._last  # pylint: disable=protected-access
+
+        return merger
+
+    def __init__(self):
+        """
+        Creates a new instance of FrameMerger
+        """
+        self._last = None
+
+        self.frames = []
@@ -0,0 +1,273 @@
+"""
+The state delta module
+"""
+
+# Marks a missing key - None cannot be used, it is a valid transformed value
+_MISSING = object()
+
+
+def _same(x, y):
+    """
+    Compares two values the same way the builtin containers do - identity first
+    and then equality.
+    """
+    return x is y or x == y
+
+
+class StateDelta:
+    """
+    A state delta stores the difference between two transformed states of a
+    component (see Visualizer.get_transformed_state). Instead of keeping a full
+    copy of the transformed state for every tick, the ticker keeps a keyframe
+    and then only the deltas. The full states are rebuilt lazily when the frames
+    are being computed.
+
+    A delta is either:
+      - a keyframe: the full state is stored as is
+      - a diff: only the added/removed nodes and edges and the changed
+        transformed values are stored
+
+    The delta is falsy if there is no difference between the two states.
+
+    The transformed state of a graph is a dict with the keys `nodes`, `edges`
+    and `transformed`. The transformed state of any other component is always
+    stored as a keyframe. The transformed values of a stylizer are diffed only
+    if they are a dict, a column of codes is stored whole when it changes.
+    """
+
+    @staticmethod
+    def keyframe(state):
+        """
+        Creates a delta which stores the full state.
+
+        parameters:
+          - state (dict|None): the full transformed state
+
+        returns:
+          - delta (StateDelta)
+        """
+        delta = StateDelta()
+        delta.full = True
+        delta.state = state
+
+        return delta
+
+    @staticmethod
+    def _is_graph_state(state):
+        """
+        Returns True if the state has the structure of a graph transformed state
+        """
+        return isinstance(state, dict) and state.keys() == {
+            "nodes",
+            "edges",
+            "transformed",
+        }
+
+    @staticmethod
+    def _diff_list(prev, curr):
+        """
+        Computes the difference of two lists of unique hashable items (nodes or
+        edges). If the order of the items which are present in both lists has
+        changed, the difference cannot be expressed by added/removed items only.
+
+        returns:
+          - diff (tuple): (full, removed, added) where full is the whole new list
+            if the order has changed and None otherwise
+        """
+        prev_set = set(prev)
+        curr_set = set(curr)
+
+        removed = [item for item in prev if item not in curr_set]
+        added = [item for item in curr if item not in prev_set]
+
+        kept = [item for item in prev if item in curr_set]
+        if kept + added != curr:
+            return (curr, [], [])
+
+        return (None, removed, added)
+
+    @staticmethod
+    def diff(prev, curr):
+        """
+        Computes the delta between the previous and the current state.
+
+        parameters:
+          - prev (dict|None): the previous full transformed state
+          - curr (dict|None): the current full transformed state
+
+        returns:
+          - delta (StateDelta): falsy if the states are equal
+        """
+        if prev is curr:
+            return StateDelta()  # Unchanged component (see BaseGraph)
+
+        if prev is None or curr is None:
+            if prev is None and curr is None:
+                return StateDelta()
+
+            return StateDelta.keyframe(curr)
+
+        if not StateDelta._is_graph_state(prev) or not StateDelta._is_graph_state(curr):
+            return StateDelta() if prev == curr else StateDelta.keyframe(curr)
+
+        delta = StateDelta()
+
+        if prev["nodes"] is not curr["nodes"] and prev["nodes"] != curr["nodes"]:
+            delta.nodes, delta.removed_nodes, delta.added_nodes = StateDelta._diff_list(
+                prev["nodes"], curr["nodes"]
+            )
+
+        if prev["edges"] is not curr["edges"] and prev["edges"] != curr["edges"]:
+            delta.edges, delta.removed_edges, delta.added_edges = StateDelta._diff_list(
+                prev["edges"], curr["edges"]
+            )
+
+        prev_transformed = prev["transformed"]
+        curr_transformed = curr["transformed"]
+
+        for name, values in curr_transformed.items():
+            prev_values = prev_transformed.get(name, _MISSING)
+
+            if prev_values is not _MISSING and (
+                prev_values is values or prev_values == values
+            ):
+                continue
+
+            # Columns (see TransformedColumn) are always replaced as a whole
+            if not isinstance(prev_values, dict) or not isinstance(values, dict):
+                delta.changed[name] = values
+                delta.replaced.add(name)
+                continue
+
+            changed = {
+                key: value
+                for key, value in values.items()
+                if not _same(prev_values.get(key, _MISSING), value)
+            }
+            removed = [key for key in prev_values if key not in values]
+
+            if changed:
+                delta.changed[name] = changed
+            if removed:
+                delta.removed[name] = removed
+
+        delta.dropped = [
+            name for name in prev_transformed if name not in curr_transformed
+        ]
+
+        return delta
+
+    def apply(self, prev):
+        """
+        Applies this delta to the previous full state and returns the current full
+        state. The previous state is NOT modified - the unchanged parts are shared
+        between the previous and the current state.
+
+        parameters:
+          - prev (dict|None): the previous full transformed state
+
+        returns:
+          - state (dict|None): the current full transformed state
+        """
+        if self.full:
+            return self.state
+
+        if not self:
+            return prev
+
+        nodes = self._apply_list(
+            prev["nodes"], self.nodes, self.removed_nodes, self.added_nodes
+        )
+        edges = self._apply_list(
+            prev["edges"], self.edges, self.removed_edges, self.added_edges
+        )
+
+        return {
+            "nodes": nodes,
+            "edges": edges,
+            "transformed": self._apply_transformed(prev["transformed"]),
+        }
+
+    @staticmethod
+    def _apply_list(prev, full, removed, added):
+        """
+        Applies the difference of the lists of nodes or edges (see _diff_list) to
+        the previous list. The previous list is returned if nothing changed.
+        """
+        if full is not None:
+            return full
+
+        if not removed and not added:
+            return prev
+
+        removed = set(removed)
+
+        return [item for item in prev if item not in removed] + added
+
+    def _apply_transformed(self, prev_transformed):
+        """
+        Applies the changes of the transformed values to the previous transformed
+        values. The unchanged values are shared.
+        """
+        transformed = {}
+
+        for name, values in prev_transformed.items():
+            if name in self.dropped:
+                continue
+
+            if name in self.replaced:
+                values = self.changed[name]
+
+            elif name in self.changed or name in self.removed:
+                values = dict(values)
+
+                for key in self.removed.get(name, []):
+                    del values[key]
+
+                values.update(self.changed.get(name, {}))
+
+            transformed[name] = values
+
+        for name in self.replaced:
+            if name not in transformed:
+                transformed[name] = self.changed[name]
+
+        return transformed
+
+    def __bool__(self):
+        """
+        A delta is truthy if there is any difference between the two states.
+        """
+        return (
+            self.full
+            or self.nodes is not None
+            or self.edges is not None
+            or bool(self.removed_nodes)
+            or bool(self.added_nodes)
+            or bool(self.removed_edges)
+            or bool(self.added_edges)
+            or bool(self.changed)
+            or bool(self.removed)
+            or bool(self.dropped)
+        )
+
+    def __init__(self):
+        """
+        Creates a new (empty) instance of StateDelta. Use StateDelta.diff or
+        StateDelta.keyframe instead of the constructor.
+        """
+        self.full = False
+        self.state = None
+
+        self.nodes = None
+        self.removed_nodes = []
+        self.added_nodes = []
+
+        self.edges = None
+        self.removed_edges = []
+        self.added_edges = []
+
+        self.changed = {}
+        self.removed = {}
+        self.replaced = set()
+        self.dropped = []
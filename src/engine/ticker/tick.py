@@ -15,11 +15,45 @@ class Tick:
       - console_logs: The current stdout output forwarded here
       - components: A list of tuple (component object, transformed state)
 
+    The ticks stored by the Ticker hold a StateDelta instead of the transformed
+    state of every component. Such tick must be restored (see Tick.restore)
+    before it can be turned into a frame.
+
     Tick defines the __eq__ method for comparing two ticks. If two neighbouring
     ticks are equal, the latter will be ignored by the Ticker - there is no need
     to store identical ticks in a row.
     """
 
+    def restore(self, states):
+        """
+        Restores the full transformed states of a tick which holds state deltas.
+        The list of the previous states is updated in place.
+
+        parameters:
+          - states (list): The full transformed states of the previous tick, one
+            for every component
+
+        returns:
+          - tick (Tick): A new tick with the full transformed states
+        """
+        components = []
+
+        for i, (comp, delta) in enumerate(self.components):
+            if i < len(states):
+                states[i] = delta.apply(states[i])
+            else:
+                states.append(delta.apply(None))
+
+            components.append((comp, states[i]))
+
+        return Tick(
+            tick_id=self.tick_id,
+            source=self.source,
+            lineno=self.lineno,
+            console_logs=self.console_logs,
+            components=components,
+        )
+
     def to_frame(self):
         """
         Turns this Tick into a Frame by computing the style of all components.
@@ -29,11 +63,18 @@ class Tick:
         """
         lineno = [self.lineno]
         console_logs = self.console_logs
-        components = list(
-            filter(None, [comp.compute_style(state) for comp, state in self.components])
-        )
 
-        return Frame(lineno=lineno, console_logs=console_logs, components=components)
+        styles = [(comp, comp.compute_style(state)) for comp, state in self.components]
+        styles = [(comp, style) for comp, style in styles if style]
+
+        return Frame(
+            lineno=lineno,
+            console_logs=console_logs,
+            components=[style for _, style in styles],
+            frame_fingerprint=hash(
+                tuple(comp.get_style_fingerprint(style) for comp, style in styles)
+            ),
+        )
 
     def __iter__(self):
         """
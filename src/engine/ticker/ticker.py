@@ -3,6 +3,8 @@ The ticker module
 """
 
 from .tick import Tick
+from .state_delta import StateDelta
+from .frame_merger import FrameMerger
 
 
 class Ticker:
@@ -10,9 +12,28 @@ class Ticker:
     Used to store the ticks an keep track of their IDs
     """
 
+    # The number of ticks between two keyframes (ticks with the full states)
+    KEYFRAME_INTERVAL = 100
+
     def tick(self, source, lineno, console_logs, components):
         """
-        Creates and saves a new tick
+        Creates and saves a new tick. Only the difference between the transformed
+        states of this tick and the previous tick is stored (see StateDelta). A
+        keyframe with the full states is stored every KEYFRAME_INTERVAL ticks.
+
+        If the ticks do not have to be kept and the style of every component can
+        be computed right away, the tick is turned into a frame and merged with
+        the previous frames immediately - such tick is not stored at all. Once a
+        component cannot compute its style or a stylizer set by the algorithm is
+        replaced (see Visualizer.has_replaced_stylizer), all following ticks are
+        stored.
+
+        The frames made from the stored ticks after the run have the style of the
+        last stylizers, so the frames do not depend on whether the ticks are kept
+        as long as the stylizers set by the algorithm are not replaced (replacing
+        a default stylizer does not change the style of the states transformed by
+        it). The frames made right away before a stylizer set by the algorithm is
+        replaced keep its style - their states are not stored.
 
         parameters:
           - source (int): The code of the tick source (see Engine)
@@ -27,77 +48,112 @@ class Ticker:
         ):
             return  # All transformed states are None - this tick is useless
 
+        prev_states = self._last_states
+        deltas = [
+            StateDelta.diff(prev_states[i], state) if i < len(prev_states) else None
+            for i, (_, state) in enumerate(components)
+        ]
+
+        if (
+            not has_console_logs
+            and self.next_tick_id > 0
+            and self._last_source == source
+            and not any(delta for delta in deltas if delta is not None)
+        ):
+            return  # Same data - skip this tick
+
+        self._last_source = source
+        self._last_states = [state for _, state in components]
+
+        if any(comp.has_replaced_stylizer() for comp, _ in components):
+            self._online = False
+
+        if self._online and all(comp.can_compute_style() for comp, _ in components):
+            tick = Tick(
+                tick_id=self.next_tick_id,
+                source=source,
+                lineno=lineno,
+                console_logs=console_logs,
+                components=components,
+            )
+
+            self.next_tick_id += 1
+            self._merger.push(tick.to_frame())
+            return
+
+        self._online = False
+
+        # The first stored tick is always a keyframe - there is nothing to restore
+        # the states from
+        is_keyframe = not self.ticks or self.next_tick_id % self.KEYFRAME_INTERVAL == 0
+
         tick = Tick(
             tick_id=self.next_tick_id,
             source=source,
             lineno=lineno,
             console_logs=console_logs,
-            components=components,
+            components=[
+                (
+                    comp,
+                    (
+                        StateDelta.keyframe(state)
+                        if is_keyframe or delta is None
+                        else delta
+                    ),
+                )
+                for (comp, state), delta in zip(components, deltas)
+            ],
         )
 
-        if not has_console_logs and len(self.ticks) > 0 and self.ticks[-1] == tick:
-            return  # Same data - skip this tick
-
         self.next_tick_id += 1
         self.ticks.append(tick)
 
-    def to_frames(self):
+    def restore_ticks(self):
         """
-        Turns the ticks into frames and returns them. The megring algorithm is
-        executed here.
+        Restores the full transformed states of the stored ticks. Returns a
+        generator - the full ticks are created lazily one by one.
 
         returns:
-          - frames (list<Frame>): The frames
+          - ticks (generator<Tick>): The ticks with the full transformed states
         """
-        # Create frames from the ticks and take only the truthy ones. See
-        # Frame.__bool__ for more information about the definition of truthyness.
-        frames = filter(None, [tick.to_frame() for tick in self.ticks])
-
-        # Merge the frames
+        states = []
 
-        # Phase 1 - assume the first frame is important. Use this frame for
-        # comparison. Keep iterating until a frame differs or has some console
-        # logs. When this happens, store this frame for comparison and continue
-        # the process until the end of the iterator.
-        merged_frames = []
+        for tick in self.ticks:
+            yield tick.restore(states)
 
-        try:
-            iterator = iter(frames)
-            curr = next(iterator)
-
-            merged_frames.append(curr)
-
-            while True:
-                frame = next(iterator)
-                if curr != frame or bool(frame.console_logs):
-                    merged_frames.append(frame)
-                curr = frame
+    def iter_frames(self):
+        """
+        Turns the ticks into frames and yields them one by one. A frame is yielded
+        as soon as it is final - the last frame may still be merged with the next
+        one, see FrameMerger.
 
-        except StopIteration:
-            pass  # This is ok
+        returns:
+          - frames (generator<Frame>): The frames
+        """
+        # The frames made during the run are already merged. Continue with the
+        # frames made from the stored ticks. The merger is copied, so that the
+        # frames can be made more than once.
+        merger = self._merger.copy()
+        done = 0
 
-        except Exception as e:
-            raise e  # Anything else is not okay
+        for tick in self.restore_ticks():
+            merger.push(tick.to_frame())
 
-        # Phase 2
-        if len(merged_frames) >= 2:
-            for left, right in zip(
-                range(len(merged_frames) - 1), range(1, len(merged_frames))
-            ):
-                l_frame = merged_frames[left]
-                r_frame = merged_frames[right]
+            while done < len(merger.frames) - 1:
+                yield merger.frames[done]
+                done += 1
 
-                if (
-                    l_frame == r_frame
-                    and bool(l_frame.console_logs)
-                    and bool(r_frame.console_logs)
-                ):
-                    r_frame.merge_with(l_frame)
-                    merged_frames[left] = None
+        yield from merger.frames[done:]
 
-            merged_frames = list(filter(lambda frame: frame is not None, merged_frames))
+    def to_frames(self):
+        """
+        Turns the ticks into frames and returns them. The megring algorithm is
+        executed here, see FrameMerger.
 
-        return merged_frames
+        returns:
+          - frames (list<Frame>): The frames
+        """
+        return list(self.iter_frames())
 
     def set_logger(self, logger):
         """
@@ -109,11 +165,21 @@ class Ticker:
         """
         self._logger = logger
 
-    def __init__(self):
+    def __init__(self, keep_ticks=True):
         """
         Creates a new instance of Ticker
+
+        parameters:
+          - keep_ticks (bool): Whether all ticks must be stored. If False, the
+            ticks are turned into frames during the run whenever possible
         """
         self._logger = None
 
         self.next_tick_id = 0
         self.ticks = []
+
+        self._last_source = None
+        self._last_states = []
+
+        self._online = not keep_ticks
+        self._merger = FrameMerger()
@@ -2,6 +2,8 @@
 The Visualizer class
 """
 
+from engine.fingerprint import fingerprint
+
 
 class Visualizer:
     """
@@ -23,8 +25,46 @@ class Visualizer:
         """
         raise NotImplementedError()
 
+    def can_compute_style(self):
+        """
+        Returns True if the style of the current transformed state can be computed
+        before the execution of the visualized algorithm has ended
+        """
+        raise NotImplementedError()
+
+    def has_replaced_stylizer(self):
+        """
+        Returns True if a stylizer set by the visualized algorithm has been
+        replaced - the style of the states transformed before then depends on the
+        last stylizer (see Ticker). Visualizers without stylizers keep the default.
+        """
+        return False
+
     def compute_style(self, state):
         """
         Computes the style from the transformed state
         """
         raise NotImplementedError()
+
+    def get_style_fingerprint(self, style):
+        """
+        Returns the fingerprint of the style computed by `compute_style` (see the
+        fingerprint module). Visualizers which can compute the fingerprint without
+        going through the whole style should override this method.
+        """
+        return fingerprint(style)
+
+    def get_version(self):
+        """
+        Returns the version of the visualizer - a value which changes every time
+        the visualizer is mutated
+        """
+        raise NotImplementedError()
+
+    def has_visible_changes(self):
+        """
+        Returns True if the transformed state may differ from the one returned by
+        the last call of `get_transformed_state`. Visualizers which cannot tell
+        should keep the default - the state is then always considered changed.
+        """
+        return True
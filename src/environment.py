@@ -4,7 +4,6 @@ The environment variables
 
 import os
 
-
 # The secret password is required in order for some admin-level parameters to
 # be considered (otherwise they are ignored).
 SECRET_PASSWORD = (
@@ -19,4 +18,109 @@ API_BASE = os.environ["API_BASE"] if "API_BASE" in os.environ else "/api"
 # Whether to run in debug mode
 DEBUG_MODE = "DEBUG_MODE" in os.environ and os.environ["DEBUG_MODE"] == "yes"
 
+# The line tracer backend - `auto`, `hunter` or `monitoring` (Python 3.12+)
+TRACER_BACKEND = (
+    os.environ["TRACER_BACKEND"] if "TRACER_BACKEND" in os.environ else "auto"
+)
+
+# Where the loader puts the modules of the algorithms - `memory` (compiled and
+# imported from memory) or `disk` (written to src/__algs)
+LOADER_MODE = os.environ["LOADER_MODE"] if "LOADER_MODE" in os.environ else "memory"
+
+# The number of the prepared algorithms cached by every process, see CodeCache
+CODE_CACHE_SIZE = (
+    int(os.environ["CODE_CACHE_SIZE"]) if "CODE_CACHE_SIZE" in os.environ else 256
+)
+
+# The length (in characters) of the longest code which is compiled by the server
+# before it is sent to a worker, a longer code is compiled by the worker (see
+# Loader.precompile)
+PRECOMPILE_MAX_SIZE = (
+    int(os.environ["PRECOMPILE_MAX_SIZE"])
+    if "PRECOMPILE_MAX_SIZE" in os.environ
+    else 256 * 1024
+)
+
+# The directory of the cached responses of the deterministic runs. The result
+# cache is opt-in - it is disabled unless the directory is set (see ResultCache)
+# and only used by the requests with the `cache` query parameter (see WorkerPool)
+RESULT_CACHE_DIR = (
+    os.environ["RESULT_CACHE_DIR"] if "RESULT_CACHE_DIR" in os.environ else None
+)
+
+# The maximum size of the cached responses in MB
+RESULT_CACHE_MAX_MB = (
+    int(os.environ["RESULT_CACHE_MAX_MB"])
+    if "RESULT_CACHE_MAX_MB" in os.environ
+    else 256
+)
+
+# The number of pre-forked workers which run the algorithms
+WORKER_POOL_SIZE = (
+    int(os.environ["WORKER_POOL_SIZE"])
+    if "WORKER_POOL_SIZE" in os.environ
+    else os.cpu_count() or 1
+)
+
+# The number of algorithms a worker runs before it is replaced by a fresh one.
+# The algorithms run by the same worker can affect each other (see WorkerPool),
+# so only a trusted deployment should reuse the workers.
+WORKER_MAX_RUNS = (
+    int(os.environ["WORKER_MAX_RUNS"]) if "WORKER_MAX_RUNS" in os.environ else 1
+)
+
+# The budgets of a run - the highest limits a config can ask for. A run which
+# reaches a budget is truncated (see BudgetException):
+#   - MAX_TICKS: the number of ticks recorded by the engine
+#   - MAX_FRAMES: the number of frames sent
+#   - MAX_BYTES: the size of the encoded frames sent in bytes
+MAX_TICKS = int(os.environ["MAX_TICKS"]) if "MAX_TICKS" in os.environ else 100000
+MAX_FRAMES = int(os.environ["MAX_FRAMES"]) if "MAX_FRAMES" in os.environ else 10000
+MAX_BYTES = (
+    int(os.environ["MAX_BYTES"]) if "MAX_BYTES" in os.environ else 64 * 1024 * 1024
+)
+
+# How main.py serves the app - `development` (the Flask development server) or
+# `production` (the waitress WSGI server)
+SERVER_MODE = (
+    os.environ["SERVER_MODE"] if "SERVER_MODE" in os.environ else "development"
+)
+
+# The number of the requests which run the algorithms at the same time and the
+# number of the requests which wait for them, see Admission
+SERVER_CONCURRENCY = (
+    int(os.environ["SERVER_CONCURRENCY"])
+    if "SERVER_CONCURRENCY" in os.environ
+    else WORKER_POOL_SIZE
+)
+SERVER_QUEUE_SIZE = (
+    int(os.environ["SERVER_QUEUE_SIZE"])
+    if "SERVER_QUEUE_SIZE" in os.environ
+    else 2 * SERVER_CONCURRENCY
+)
+
+# The asynchronous runs, see JobStore:
+#   - JOB_STORE_SIZE: the number of the finished jobs whose responses are kept
+#   - JOB_QUEUE_SIZE: the number of the unfinished jobs, more jobs are rejected
+#   - JOB_CONCURRENCY: the number of the jobs run at the same time - by the
+#     workers of their own, not by the workers of the synchronous runs
+#   - JOB_MAX_EXECUTION_TIME: the time limit of a job in seconds (the time limit
+#     of the synchronous runs if not set)
+JOB_STORE_SIZE = (
+    int(os.environ["JOB_STORE_SIZE"]) if "JOB_STORE_SIZE" in os.environ else 100
+)
+JOB_QUEUE_SIZE = (
+    int(os.environ["JOB_QUEUE_SIZE"]) if "JOB_QUEUE_SIZE" in os.environ else 32
+)
+JOB_CONCURRENCY = (
+    int(os.environ["JOB_CONCURRENCY"])
+    if "JOB_CONCURRENCY" in os.environ
+    else max(1, WORKER_POOL_SIZE // 2)
+)
+JOB_MAX_EXECUTION_TIME = (
+    float(os.environ["JOB_MAX_EXECUTION_TIME"])
+    if "JOB_MAX_EXECUTION_TIME" in os.environ
+    else None
+)
+
 # todo: do this better
@@ -31,6 +31,21 @@ class AlgorithmException(AppException):
     """
 
 
+class BudgetException(AppException):
+    """
+    An exception which describes why the visualization was truncated - the run
+    reached one of its budgets (ticks, frames or bytes). It is not raised, the
+    partial visualization is sent with this exception as a mixed response.
+    """
+
+
+class PoolBusyException(AppException):
+    """
+    An exception which should be raised when no worker is available to run the
+    algorithm in time - the request should be retried later
+    """
+
+
 class ColorException(AlgorithmException):
     """
     An exception which should be raised when there is a color problem
@@ -1,10 +1,30 @@
-import resource
-from flask import Flask, request, jsonify
-from multiprocess import Process, Manager
+import atexit
 import traceback
-from environment import DEBUG_MODE
-from components import Loader, Runner, Sender, logger
-from exceptions import AlgorithmException
+from flask import Flask, Response, request, jsonify
+from environment import (
+    DEBUG_MODE,
+    WORKER_POOL_SIZE,
+    WORKER_MAX_RUNS,
+    RESULT_CACHE_DIR,
+    RESULT_CACHE_MAX_MB,
+    SERVER_MODE,
+    SERVER_CONCURRENCY,
+    SERVER_QUEUE_SIZE,
+    JOB_STORE_SIZE,
+    JOB_QUEUE_SIZE,
+    JOB_CONCURRENCY,
+    JOB_MAX_EXECUTION_TIME,
+)
+from components import (
+    Admission,
+    CompactLayout,
+    JobStore,
+    ResultCache,
+    Sender,
+    WorkerPool,
+    logger,
+)
+from exceptions import PoolBusyException
 from utils import format_code
 
 app = Flask(__name__)
@@ -14,25 +34,96 @@ MAX_MEMORY_MB = 1024
 MAX_EXECUTION_TIME_SECOND = 4
 
 
-def algorithm_worker(namespace, config):
-    resource.setrlimit(
-        resource.RLIMIT_AS, (MAX_MEMORY_MB * 1024 * 1024, MAX_MEMORY_MB * 1024 * 1024)
-    )
-    loader = Loader()
-    runner = Runner(loader)
+def _preload():
+    """
+    Imports the modules which are imported lazily - numpy, colour and webcolors
+    (and the color names built from them) and black. The fork server imports
+    this module (see WorkerPool), so every worker forked from it starts with
+    them instead of importing them on the first use. The CLI and the tests keep
+    the lazy imports.
+    """
+    # pylint: disable=import-outside-toplevel,unused-import
+    import numpy
+    import black
+    from engine.color import COLOR_NAMES
 
-    try:
-        loader.set_input(config)
 
-        # Prepare the module
-        loader.load()
+if SERVER_MODE == "production":
+    _preload()
 
-        # Run the module
-        runner.run()
+# The pool of pre-forked workers, see get_worker_pool
+_WORKER_POOL = None
 
-        namespace.runner = runner
-    except Exception as e:
-        namespace.exception = e
+# The store of the asynchronous runs, see get_job_store
+_JOB_STORE = None
+
+# The admission of the requests which run the algorithms
+_ADMISSION = Admission(
+    concurrency=SERVER_CONCURRENCY,
+    queue_size=SERVER_QUEUE_SIZE,
+    timeout=MAX_EXECUTION_TIME_SECOND,
+    run_time=MAX_EXECUTION_TIME_SECOND,
+)
+
+
+def get_worker_pool():
+    """
+    Returns the pool of workers which run the algorithms. The pool is created on
+    the first call - call this function before serving the first request so that
+    the workers are forked in advance.
+    """
+    global _WORKER_POOL  # pylint: disable=global-statement
+
+    if _WORKER_POOL is None:
+        # The result cache is opt-in, see ResultCache
+        result_cache = None
+        if RESULT_CACHE_DIR:
+            result_cache = ResultCache(
+                RESULT_CACHE_DIR, RESULT_CACHE_MAX_MB * 1024 * 1024
+            )
+
+        _WORKER_POOL = WorkerPool(
+            size=WORKER_POOL_SIZE,
+            max_runs=WORKER_MAX_RUNS,
+            max_memory_mb=MAX_MEMORY_MB,
+            max_execution_time=MAX_EXECUTION_TIME_SECOND,
+            result_cache=result_cache,
+            wait_timeout=MAX_EXECUTION_TIME_SECOND,
+        )
+
+    return _WORKER_POOL
+
+
+def get_job_store():
+    """
+    Returns the store of the asynchronous runs (jobs). The store is created on
+    the first call - call this function before serving the first request so that
+    the workers are forked in advance.
+
+    The jobs have a worker pool of their own - a worker for every thread of the
+    store - so that the long jobs never take the workers of the synchronous
+    runs. The stored responses are removed when the server exits.
+    """
+    global _JOB_STORE  # pylint: disable=global-statement
+
+    if _JOB_STORE is None:
+        pool = WorkerPool(
+            size=JOB_CONCURRENCY,
+            max_runs=WORKER_MAX_RUNS,
+            max_memory_mb=MAX_MEMORY_MB,
+            max_execution_time=JOB_MAX_EXECUTION_TIME or MAX_EXECUTION_TIME_SECOND,
+            wait_timeout=MAX_EXECUTION_TIME_SECOND,
+        )
+
+        _JOB_STORE = JobStore(
+            pool,
+            max_jobs=JOB_STORE_SIZE,
+            max_pending=JOB_QUEUE_SIZE,
+            threads=JOB_CONCURRENCY,
+        )
+        atexit.register(_JOB_STORE.close)
+
+    return _JOB_STORE
 
 
 @app.route("/v1/run", methods=["POST"])
@@ -40,54 +131,210 @@ def run_algorithm():
     if DEBUG_MODE:
         logger.info("Running in debug mode")
 
-    sender = Sender(None)
+    release = _ADMISSION.acquire()
+
+    if release is None:
+        return _reject()
+
     try:
         logger.info("start")
 
         config = request.get_json(force=True)
+        options = _get_options()
+        mimetype = _get_mimetype(options)
 
-        runner = None
-        with Manager() as manager:
-            namespace = manager.Namespace()
-            namespace.runner = Runner(None)
-            namespace.exception = None
-
-            p = Process(target=algorithm_worker, args=(namespace, config))
-            p.start()
-            p.join(timeout=MAX_EXECUTION_TIME_SECOND)
-
-            if p.is_alive():
-                p.terminate()
-                raise Exception(
-                    "Your code exceeded the allowed time limit to execute.\
-                    You have probably have some infinite loop or similar."
-                )
-            elif p.exitcode < 0:
-                raise Exception(
-                    "Your code execution was terminated midway.\
-                    You most likely exceeded the memory limit."
-                )
-            elif namespace.exception is not None:
-                # Exception from loader and runner
-                raise namespace.exception
-
-            runner = namespace.runner
-        if runner is None:
-            raise Exception("Runner is None. Something horrible went wrong.")
-        else:
-            sender._runner = runner
-        logger.info("result: OK")
-        return sender.send_success()
-
-    except AlgorithmException as e:
-        logger.error(
-            "result: AlgorithmException", {"exception": traceback.format_exc()}
-        )
-        return sender.send_error(e)
+        # Opt-in result cache, see WorkerPool
+        cache = _is_enabled("cache")
+
+        # Opt-in streaming of the frames, see Sender.stream_success. The slot is
+        # freed at the end of the stream or when the response is closed.
+        if _is_enabled("stream"):
+            chunks = get_worker_pool().stream(config, options, cache=cache)
+            first = next(chunks)
+
+            response = Response(
+                stream_algorithm(first, chunks, release),
+                mimetype=mimetype or "application/json",
+            )
+            response.call_on_close(release)
+
+            return response
+
+        try:
+            response = get_worker_pool().run(config, options, cache=cache)
+        finally:
+            release()
+
+        return Response(response, mimetype=mimetype)
+
+    except PoolBusyException:
+        release()
+        return _reject()
 
     except Exception as e:  # pylint: disable=broad-except
         logger.error("result: Exception", {"exception": traceback.format_exc()})
-        return sender.send_error(e)
+        release()
+        return Sender(None).send_error(e)
+
+
+@app.route("/v1/jobs", methods=["POST"])
+def submit_job():
+    """
+    Submits the asynchronous run of the algorithm (a job), see JobStore. The
+    options are the same as of /v1/run (except streaming) and apply to the result
+    of the job.
+    """
+    try:
+        config = request.get_json(force=True)
+        job = get_job_store().submit(config, _get_options())
+
+    except Exception as e:  # pylint: disable=broad-except
+        logger.error("job: Exception", {"exception": traceback.format_exc()})
+        return Sender(None).send_error(e)
+
+    if job is None:
+        return _reject()
+
+    logger.info("Job submitted", {"job_id": job["job_id"]})
+
+    return jsonify(job), 202
+
+
+@app.route("/v1/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    """
+    Returns the status of the job (404 if the job does not exist or has been
+    removed)
+    """
+    job = get_job_store().get(job_id)
+
+    if job is None:
+        return _not_found(job_id)
+
+    return jsonify(job)
+
+
+@app.route("/v1/jobs/<job_id>/result", methods=["GET"])
+def get_job_result(job_id):
+    """
+    Returns the response of the finished job - the same response /v1/run would
+    send. The query parameters `start` and `stop` select a range of the frames
+    (with delta encoding, the range should start at a keyframe). 409 Conflict is
+    sent if the job is not finished yet.
+    """
+    store = get_job_store()
+    job = store.get(job_id)
+
+    if job is None:
+        return _not_found(job_id)
+
+    if job["status"] != JobStore.STATUS_FINISHED:
+        return (
+            Sender(None).send_error(
+                Exception("The job {} is {}.".format(job_id, job["status"]))
+            ),
+            409,
+        )
+
+    start = request.args.get("start", type=_frame_index)
+    stop = request.args.get("stop", type=_frame_index)
+    options = store.get_options(job_id)
+    response = store.get_result(job_id, start, stop)
+
+    if response is None:
+        return _not_found(job_id)
+
+    return Response(response, mimetype=_get_mimetype(options))
+
+
+def _frame_index(value):
+    """
+    Parses the index of a frame - the non-negative query parameter
+    """
+    index = int(value)
+
+    if index < 0:
+        raise ValueError("negative frame index")
+
+    return index
+
+
+def _not_found(job_id):
+    """
+    Returns the response to the request for a missing job - 404 Not Found
+    """
+    return (
+        Sender(None).send_error(Exception("The job {} does not exist.".format(job_id))),
+        404,
+    )
+
+
+def _reject():
+    """
+    Returns the response to the request which was not admitted - 429 Too Many
+    Requests with the Retry-After header
+    """
+    logger.info("Too many requests - rejecting")
+
+    response = Response(
+        Sender(None).send_error(
+            Exception("The server is busy. Please try again later.")
+        ),
+        status=429,
+        mimetype="application/json",
+    )
+    response.headers["Retry-After"] = str(_ADMISSION.get_retry_after())
+
+    return response
+
+
+def _get_options():
+    """
+    Returns the options of the response (see Sender) requested by the request
+    """
+    # The compact layout of the frames is negotiated by the Accept header
+    compact = (
+        request.accept_mimetypes.best_match(
+            ["application/json", CompactLayout.MIMETYPE]
+        )
+        == CompactLayout.MIMETYPE
+    )
+
+    # Opt-in delta encoding of the frames, see FrameDelta
+    return {"compact": compact, "delta": _is_enabled("delta")}
+
+
+def _get_mimetype(options):
+    """
+    Returns the mimetype of the response with the options (None if the default)
+    """
+    return CompactLayout.MIMETYPE if options["compact"] else None
+
+
+def _is_enabled(name):
+    """
+    Returns True if the opt-in feature is enabled by the query parameter
+    """
+    return request.args.get(name) in ("1", "true", "yes")
+
+
+def stream_algorithm(first, chunks, release):
+    """
+    Yields the chunks of the streamed response - the first chunk (taken before
+    the response is started, so that the errors of the run can still be sent
+    as a whole response) and the rest of the chunks. The admission slot is freed
+    by `release` once the chunks run out.
+    """
+    try:
+        yield first
+        yield from chunks
+
+    except Exception:  # pylint: disable=broad-except
+        logger.error("result: Exception", {"exception": traceback.format_exc()})
+
+    finally:
+        chunks.close()
+        release()
 
 
 @app.route("/v1/format", methods=["POST"])
@@ -103,4 +350,19 @@ def format():
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000)
+    get_worker_pool()
+    get_job_store()
+
+    if SERVER_MODE == "production":
+        from waitress import serve
+
+        # Enough threads for the running and the queued requests, the other
+        # requests are rejected by the admission right away
+        serve(
+            app,
+            host="0.0.0.0",
+            port=5000,
+            threads=SERVER_CONCURRENCY + SERVER_QUEUE_SIZE + 1,
+        )
+    else:
+        app.run(host="0.0.0.0", port=5000)
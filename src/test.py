@@ -7,6 +7,24 @@ from tests.test_utils import TestUtils  # pylint: disable=unused-import
 from tests.test_color import TestColor  # pylint: disable=unused-import
 from tests.test_node_shape import TestNodeShape  # pylint: disable=unused-import
 from tests.test_loader import TestLoader  # pylint: disable=unused-import
+from tests.test_ticker import TestTicker  # pylint: disable=unused-import
+from tests.test_graph_tracker import TestGraphTracker  # pylint: disable=unused-import
+from tests.test_tracer import TestTracer  # pylint: disable=unused-import
+from tests.test_engine import TestEngine  # pylint: disable=unused-import
+from tests.test_transformed_column import (  # pylint: disable=unused-import
+    TestTransformedColumn,
+)
+from tests.test_code_cache import TestCodeCache  # pylint: disable=unused-import
+from tests.test_encoder import TestEncoder  # pylint: disable=unused-import
+from tests.test_result_cache import TestResultCache  # pylint: disable=unused-import
+from tests.test_admission import TestAdmission  # pylint: disable=unused-import
+from tests.test_job_store import TestJobStore  # pylint: disable=unused-import
+from tests.test_worker_pool import TestWorkerPool  # pylint: disable=unused-import
+from tests.test_frame_delta import TestFrameDelta  # pylint: disable=unused-import
+from tests.test_palettes import TestPalettes  # pylint: disable=unused-import
+from tests.test_compact_layout import (  # pylint: disable=unused-import
+    TestCompactLayout,
+)
 from tests.test_graph_node_colorizer import (
     TestGraphNodeColorizer,
 )  # pylint: disable=unused-import
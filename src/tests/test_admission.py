@@ -0,0 +1,75 @@
+"""
+Tests for src/components/admission.py
+"""
+
+import math
+import random
+import threading
+import time
+import unittest
+from components.admission import Admission
+
+
+class TestAdmission(unittest.TestCase):
+    """
+    Tests for src/components/admission.py
+    """
+
+    def test_limits(self):
+        """
+        Tests the concurrency limit and the queue limit
+
+        conditions:
+          - at most `concurrency` requests are admitted at the same time
+          - the requests over the queue limit are rejected right away
+          - the queued request is admitted once a slot is released
+          - a slot is released only once
+          - the queued request is rejected if the wait times out
+        """
+        concurrency = random.randint(1, 5)
+        admission = Admission(concurrency, 1, timeout=5, run_time=4)
+
+        releases = [admission.acquire() for _ in range(concurrency)]
+        self.assertNotIn(None, releases)
+
+        queued = []
+        thread = threading.Thread(target=lambda: queued.append(admission.acquire()))
+        thread.start()
+
+        # Wait until the request is queued
+        deadline = time.monotonic() + 5
+        while admission.get_retry_after() == 4:
+            if time.monotonic() > deadline:
+                self.fail("The request was not queued")
+            time.sleep(0.001)
+
+        self.assertIsNone(admission.acquire())
+
+        releases[0]()
+        thread.join()
+        self.assertIsNotNone(queued[0])
+
+        single = Admission(1, 0, timeout=1, run_time=4)
+        release = single.acquire()
+        release()
+        release()
+        self.assertIsNotNone(single.acquire())
+        self.assertIsNone(single.acquire(), "The slot cannot be freed twice")
+
+        timed_out = Admission(1, 1, timeout=0.01, run_time=4)
+        self.assertIsNotNone(timed_out.acquire())
+        self.assertIsNone(timed_out.acquire())
+
+    def test_retry_after(self):
+        """
+        Tests the Retry-After estimate
+
+        conditions:
+          - it is at least one second
+          - it is the time of a run if nothing is queued
+        """
+        run_time = random.uniform(1, 10)
+        admission = Admission(random.randint(1, 5), 1, timeout=1, run_time=run_time)
+
+        self.assertEqual(admission.get_retry_after(), math.ceil(run_time))
+        self.assertGreaterEqual(Admission(1, 1, 1, run_time=0.1).get_retry_after(), 1)
@@ -0,0 +1,102 @@
+"""
+Tests for src/components/code_cache.py
+"""
+
+import unittest
+import random
+import sys
+import threading
+from components.code_cache import CodeCache
+from utils.code import get_sample_code
+
+
+class TestCodeCache(unittest.TestCase):
+    """
+    Tests for src/components/code_cache.py
+    """
+
+    def test_eviction(self):
+        """
+        Tests whether the least recently used entries are evicted
+
+        conditions:
+          - the cache never holds more entries than its size
+          - the recently used entries are kept
+        """
+        size = random.randint(5, 20)
+        cache = CodeCache(size)
+
+        for i in range(size):
+            cache.put(str(i), str(i))
+
+        cache.get("0")
+
+        for i in range(size, 2 * size - 1):
+            cache.put(str(i), str(i))
+
+        self.assertEqual(len(cache), size)
+        self.assertIsNotNone(cache.get("0"))
+        self.assertIsNone(cache.get("1"))
+
+    def test_dump_and_load(self):
+        """
+        Tests whether an entry can be moved to another cache
+
+        conditions:
+          - entries which are not compiled are not dumped
+          - the loaded code is equal to the dumped one
+        """
+        code = get_sample_code(random.randint(1, 5) * 2)
+        key = CodeCache.key(code)
+
+        cache = CodeCache(10)
+        cache.put(key, code)
+        self.assertIsNone(cache.dump(key))
+
+        compiled = compile(code, "<test>", "exec")
+        cache.put(key, code, compiled)
+
+        other = CodeCache(10)
+        other.load(cache.dump(key))
+
+        self.assertEqual(other.get(key), (code, compiled))
+        self.assertEqual(CodeCache.key(code), key)
+
+    def test_threads(self):
+        """
+        Tests whether the cache can be shared by many threads
+
+        conditions:
+          - the concurrent puts, gets and dumps raise no exception
+          - the cache never holds more entries than its size
+        """
+        code = get_sample_code(2)
+        compiled = compile(code, "<test>", "exec")
+        cache = CodeCache(5)
+        errors = []
+
+        def run():
+            try:
+                for _ in range(5000):
+                    key = str(random.randint(0, 10))
+                    cache.put(key, code, compiled)
+                    cache.get(str(random.randint(0, 10)))
+                    cache.dump(str(random.randint(0, 10)))
+            except Exception as e:  # pylint: disable=broad-except
+                errors.append(e)
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # Switch the threads as often as possible
+
+        try:
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(cache), 5)
@@ -5,6 +5,7 @@ Tests for src/engine/color.py
 import unittest
 from random import random, randrange, randint, choice, shuffle
 from engine.color import Color, COLOR_NAMES
+from exceptions import ColorException
 from utils.random_utils import random_name, random_chunk, random_whitespace_pad
 
 
@@ -313,3 +314,57 @@ class TestColor(unittest.TestCase):
                 conversion,
                 f"Original: {hex_color} != Coverted: {conversion}",
             )
+
+    def test_create(self):
+        """
+        Tests the create method
+
+        conditions:
+          - the same instance is returned for the same color string
+          - the instance is equal to the color created by the constructor
+          - instances of Color are returned as they are
+          - an invalid color string raises ColorException every time
+          - int and float rgba tuples are not confused
+        """
+        for _ in range(500):
+            hex_color = "#{}".format(random_name(4))
+            color = Color.create(hex_color)
+
+            self.assertIs(color, Color.create(hex_color))
+            self.assertIs(color, Color.create(color))
+            self.assertEqual(color, Color(hex_color))
+            self.assertEqual(color.to_hex(), Color(hex_color).to_hex())
+
+        for _ in range(2):
+            with self.assertRaises(ColorException):
+                Color.create("not a color")
+
+        self.assertNotEqual(Color.create((1, 0, 0)), Color.create((1.0, 0.0, 0.0)))
+
+    def test_pack(self):
+        """
+        Tests the packed representation
+
+        conditions:
+          - the packed color is 0xRRGGBBAA of the hex color
+          - the rgba parts are within one step of 1/255 from the normalized rgba
+          - equal colors have equal hashes
+          - the rgba parts cannot be modified
+        """
+        for _ in range(500):
+            rgba = tuple(randint(0, 255) for _ in range(4))
+            hex_color = "#" + "".join("%02x" % part for part in rgba)
+            color = Color(hex_color)
+
+            self.assertEqual(color.packed, int(hex_color[1:], 16))
+            self.assertEqual(color, Color(color.rgba))
+            self.assertEqual(hash(color), hash(Color(hex_color.upper())))
+
+            for actual, expected in zip(color, Color.normalize_hex(hex_color)):
+                self.assertAlmostEqual(actual, expected, delta=1 / 255)
+
+        with self.assertRaises(AttributeError):
+            Color("red").rgba = (0, 0, 0, 1)
+
+        self.assertIsNone(Color(None).packed)
+        self.assertEqual(Color(None), "default")
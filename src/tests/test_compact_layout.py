@@ -0,0 +1,99 @@
+"""
+Tests for src/components/compact_layout.py
+"""
+
+import json
+import unittest
+import random
+from components.compact_layout import CompactLayout
+from components.encoder import Encoder
+from engine.graph import Graph
+from engine.graph.di_graph import DiGraph
+from engine.ticker.frame import Frame
+
+
+class TestCompactLayout(unittest.TestCase):
+    """
+    Tests for src/components/compact_layout.py
+    """
+
+    def _random_frames(self, G):
+        """
+        Generates the frames of a randomly mutated graph with styled nodes and
+        edges
+        """
+        G.color_nodes_by(prop="value", colors={0: "red", 1: "blue", 2: (0, 255, 0)})
+        G.color_edges_by(lambda u, v, G: "#abc" if u < v else "orange")
+        G.shape_nodes_by(lambda u, G: u % 2 == 0, shape="square")
+        G.label_edges_by(lambda u, v, G: u + v)
+
+        states = []
+
+        for _ in range(random.randint(20, 50)):
+            if random.random() < 0.5 or len(G.nodes) < 2:
+                G.add_node(random.randint(0, 30), value=random.randint(0, 3))
+            else:
+                G.add_edge(*random.sample(list(G.nodes), 2))
+
+            states.append(G.get_transformed_state())
+
+        G.interpret_transformed_state()
+
+        return [
+            Frame([i], "", [G.compute_style(state)]) for i, state in enumerate(states)
+        ]
+
+    @staticmethod
+    def _expand(frame, tables):
+        """
+        Turns the compact layout of the frame back into the regular layout
+        """
+        ids, edges, colors = tables["ids"], tables["edges"], tables["colors"]
+
+        for comp in frame["components"]:
+            nodes = [ids[i] for i in comp["nodes"]]
+            pairs = [(ids[edges[i][0]], ids[edges[i][1]]) for i in comp["edges"]]
+
+            style = {}
+
+            for name, values in comp["style"].items():
+                if name.endswith("_colors"):
+                    values = [None if i is None else colors[i] for i in values]
+
+                if name.startswith("node_"):
+                    style[name] = dict(zip(nodes, values))
+                else:
+                    style[name] = {}
+                    for (u, v), value in zip(pairs, values):
+                        style[name].setdefault(u, {})[v] = value
+
+            comp.update(nodes=nodes, edges=pairs, style=style)
+
+        return frame
+
+    def test_round_trip(self):
+        """
+        Tests that the frames in the compact layout carry the same information
+
+        conditions:
+          - the frames expanded from the compact layout are the same as the frames
+            encoded in the regular layout
+          - every node identifier, edge and color is stored once in the tables
+        """
+        for G in (Graph(), DiGraph()):
+            frames = self._random_frames(G)
+            layout = CompactLayout()
+
+            compact = json.loads(
+                Encoder.encode([layout.add_frame(frame) for frame in frames])
+            )
+            tables = json.loads(Encoder.encode(layout.get_tables()))
+
+            expanded = [self._expand(frame, tables) for frame in compact]
+
+            self.assertEqual(
+                json.loads(Encoder.encode(expanded)), json.loads(Encoder.encode(frames))
+            )
+
+            for table in tables.values():
+                self.assertEqual(len(set(map(json.dumps, table))), len(table))
@@ -0,0 +1,135 @@
+"""
+Tests for src/components/encoder.py
+"""
+
+import json
+import unittest
+from unittest import mock
+from array import array
+from random import randint, choice
+from components import encoder
+from components.encoder import Encoder
+from engine.color import Color
+from engine.node_shape import NodeShape, NODE_SHAPES
+from engine.ticker.frame import Frame
+
+
+class TestEncoder(unittest.TestCase):
+    """
+    Tests for src/components/encoder.py
+    """
+
+    def _random_frames(self):
+        """
+        Generates random frames with colors, shapes and columns
+        """
+        frames = []
+
+        for i in range(randint(1, 20)):
+            n = randint(0, 30)
+            style = {
+                "node_colors": [
+                    Color("#%06x" % randint(0, 0xFFFFFF)) if randint(0, 3) else None
+                    for _ in range(n)
+                ],
+                "node_shapes": [NodeShape(choice(list(NODE_SHAPES))) for _ in range(n)],
+                "codes": array("i", [randint(-1, 100) for _ in range(n)]),
+            }
+            components = [{"nodes": list(range(n)), "style": style, "by_id": {i: n}}]
+            frames.append(Frame([i], "log" if randint(0, 1) else "", components))
+
+        return frames
+
+    @staticmethod
+    def _expected(frames):
+        """
+        Converts the frames the way the encoder should
+        """
+        return [
+            {
+                "lineno": frame.lineno,
+                "console_logs": frame.console_logs,
+                "components": [
+                    {
+                        "nodes": comp["nodes"],
+                        "style": {
+                            "node_colors": [
+                                None if c is None else c.to_hex()
+                                for c in comp["style"]["node_colors"]
+                            ],
+                            "node_shapes": [
+                                s.shape for s in comp["style"]["node_shapes"]
+                            ],
+                            "codes": comp["style"]["codes"].tolist(),
+                        },
+                        "by_id": {str(k): v for k, v in comp["by_id"].items()},
+                    }
+                    for comp in frame.components
+                ],
+            }
+            for frame in frames
+        ]
+
+    def test_encode(self):
+        """
+        Tests the encoding of the frames
+
+        conditions:
+          - colors are encoded as long hex, shapes as names, columns as lists
+          - the result is the same with and without orjson
+          - the frames are not modified
+        """
+        for _ in range(20):
+            frames = self._random_frames()
+            expected = self._expected(frames)
+
+            self.assertEqual(json.loads(Encoder.encode(frames)), expected)
+
+            with mock.patch.object(encoder, "orjson", None):
+                self.assertEqual(json.loads(Encoder.encode(frames)), expected)
+
+            self.assertIsInstance(frames[0].components[0]["style"]["codes"], array)
+
+        with self.assertRaises(TypeError):
+            Encoder.encode([object()])
+
+    def test_encode_non_finite(self):
+        """
+        Tests the encoding of NaN and the infinities
+
+        conditions:
+          - NaN and the infinities are encoded as null
+          - the result is the same with and without orjson
+        """
+        obj = {
+            "values": [float("nan"), float("inf"), -float("inf"), randint(0, 9) / 10],
+            "label": "é",
+            "frame": Frame(
+                lineno=[1], console_logs="", components=[{"value": float("nan")}]
+            ),
+        }
+
+        encoded = Encoder.encode(obj)
+        self.assertEqual(json.loads(encoded)["values"][:3], [None, None, None])
+
+        with mock.patch.object(encoder, "orjson", None):
+            self.assertEqual(Encoder.encode(obj), encoded)
+
+    def test_encode_dict(self):
+        """
+        Tests the encoding of a dict with members encoded already
+
+        conditions:
+          - the result is the same as encoding the whole dict
+          - empty dicts are handled
+        """
+        frames = self._random_frames()
+        obj = {"res": "success", "err": None, "time": 0.5}
+        encoded = {"frames": Encoder.encode(frames), "ticks": "null"}
+
+        self.assertEqual(
+            json.loads(Encoder.encode_dict(obj, encoded)),
+            {**obj, "frames": self._expected(frames), "ticks": None},
+        )
+        self.assertEqual(json.loads(Encoder.encode_dict({}, encoded))["ticks"], None)
+        self.assertEqual(json.loads(Encoder.encode_dict(obj, {})), obj)
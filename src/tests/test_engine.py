@@ -0,0 +1,240 @@
+"""
+Tests for src/engine/engine.py
+"""
+
+import unittest
+import random
+from types import SimpleNamespace
+import networkx
+from engine.engine import Engine
+
+
+class TestEngine(unittest.TestCase):
+    """
+    Tests for src/engine/engine.py
+    """
+
+    def _get_engine(self, policy, budget=None):
+        """
+        Returns an engine with the specified tick sampling policy and the list to
+        which the sources of its line ticks are appended
+        """
+        engine = Engine()
+        engine.set_sampling(policy, budget)
+
+        ticks = []
+        tick = engine.tick
+
+        def tracked_tick(source=None):
+            if source == Engine.TICK_SOURCE_LINE:
+                ticks.append(source)
+
+            tick(source)
+
+        engine.tick = tracked_tick
+
+        return engine, ticks
+
+    def _line(self, engine):
+        """
+        Simulates a 'line' event of the tracer
+        """
+        engine.line_callback(SimpleNamespace(lineno=random.randint(1, 100)))
+
+    def test_sampling_line_and_user(self):
+        """
+        Tests the line and the user sampling policies
+
+        conditions:
+          - the line policy ticks for every line
+          - the user policy never ticks for a line
+        """
+        count = random.randint(10, 50)
+
+        for policy, expected in (
+            (Engine.SAMPLING_LINE, count),
+            (Engine.SAMPLING_USER, 0),
+        ):
+            engine, ticks = self._get_engine(policy)
+            G = engine.Graph()
+            G.add_node(0)
+
+            for _ in range(count):
+                self._line(engine)
+
+            self.assertEqual(len(ticks), expected)
+
+    def test_sampling_mutation(self):
+        """
+        Tests the mutation sampling policy
+
+        conditions:
+          - a line without a mutation does not tick
+          - a line after a mutation ticks exactly once
+          - a line after printing ticks
+        """
+        engine, ticks = self._get_engine(Engine.SAMPLING_MUTATION)
+        G = engine.Graph()
+
+        for i in range(random.randint(5, 10)):
+            G.add_node(i)
+            self._line(engine)
+            self._line(engine)
+            self.assertEqual(len(ticks), i + 1)
+
+        engine.print("text")
+        self._line(engine)
+        self.assertEqual(len(ticks), i + 2)
+
+    def test_sampling_style(self):
+        """
+        Tests the style sampling policy
+
+        conditions:
+          - a line which changes neither the graph nor the stylizer dependencies
+            does not tick
+          - a change of the dependencies ticks exactly once
+          - a mutation ticks
+          - a stylizer without declared dependencies ticks for every line
+        """
+        engine, ticks = self._get_engine(Engine.SAMPLING_STYLE)
+        G = engine.Graph()
+        G.add_edges_from([(i, i + 1) for i in range(10)])
+
+        observed = [0]
+        G.color_nodes_by(lambda v, G: v == observed[0], depends=lambda: observed[0])
+
+        self._line(engine)
+        count = len(ticks)
+
+        self._line(engine)
+        self.assertEqual(len(ticks), count)
+
+        observed[0] = random.randint(1, 10)
+        self._line(engine)
+        self._line(engine)
+        self.assertEqual(len(ticks), count + 1)
+
+        G.add_node(20)
+        self._line(engine)
+        self.assertEqual(len(ticks), count + 2)
+
+        G.label_nodes_by(lambda v, G: v)
+        count = len(ticks)
+
+        for _ in range(5):
+            self._line(engine)
+
+        self.assertEqual(len(ticks), count + 5)
+
+    def test_sampling_budget(self):
+        """
+        Tests the budget sampling policy
+
+        conditions:
+          - the number of line ticks never exceeds the budget
+          - the beginning of the algorithm is sampled line by line
+          - the end of a long algorithm is still sampled
+          - a budget lower than 1 is rejected
+        """
+        budget = random.randint(10, 100)
+        engine, ticks = self._get_engine(Engine.SAMPLING_BUDGET, budget)
+        G = engine.Graph()
+        G.add_node(0)
+
+        for _ in range(budget // 2):
+            self._line(engine)
+
+        self.assertEqual(len(ticks), budget // 2)
+
+        for _ in range(100 * budget):
+            self._line(engine)
+
+        self.assertLessEqual(len(ticks), budget)
+        self.assertGreater(len(ticks), budget // 2 + 2)
+
+        for budget in (0, -1):
+            with self.assertRaises(ValueError):
+                Engine().set_sampling(Engine.SAMPLING_BUDGET, budget)
+
+    def test_max_ticks(self):
+        """
+        Tests the tick budget
+
+        conditions:
+          - the engine records at most `max_ticks` ticks
+          - the truncation is reported once the budget is reached
+          - no truncation is reported within the budget
+        """
+        max_ticks = random.randint(5, 20)
+        engine, ticks = self._get_engine(Engine.SAMPLING_LINE)
+        engine.set_max_ticks(max_ticks)
+        G = engine.Graph()
+
+        for i in range(max_ticks - 1):
+            G.add_node(i)
+            self._line(engine)
+
+        self.assertIsNone(engine.get_truncation())
+
+        for i in range(max_ticks, 3 * max_ticks):
+            G.add_node(i)
+            self._line(engine)
+            engine.tick()
+
+        self.assertIsNotNone(engine.get_truncation())
+        self.assertEqual(len(ticks), max_ticks)
+        self.assertEqual(
+            engine._ticker.next_tick_id, max_ticks  # pylint: disable=protected-access
+        )
+
+    def test_nondeterminism(self):
+        """
+        Tests the detection of the nondeterministic behavior
+
+        conditions:
+          - a run is deterministic unless something nondeterministic is detected
+          - the import of a nondeterministic module (or a name from it), the
+            call of `id` and `hash` and a class hashed by the identity are
+            detected
+          - the import of other modules and the other classes are not detected
+          - the use of the global random generators is detected, however they
+            are reached
+        """
+        cases = [
+            ("import networkx", True),
+            ("from networkx import Graph", True),
+            ("import random", False),
+            ("from os import path", False),
+            ("from numpy import random", False),
+            ("import time as t", False),
+            ("import importlib", False),
+            ("import sys", False),
+            ("x = id(1)", False),
+            ("x = hash('a')", False),
+            ("class A: pass", False),
+            ("class A:\n  def __hash__(self): return 1", True),
+            ("class A(tuple): pass", True),
+            ("class A:\n  def __eq__(self, other): return True", True),
+            ("x = __import__('networkx').gnp_random_graph(5, 0.5)", True),
+        ]
+
+        for code, deterministic in random.sample(cases, len(cases)):
+            engine = Engine()
+            self.assertTrue(engine.is_deterministic())
+
+            # pylint: disable-next=exec-used
+            exec(code, {"__builtins__": engine.get_builtins()})
+            self.assertEqual(engine.is_deterministic(), deterministic, code)
+
+        for code, deterministic in [
+            ("x = nx.gnp_random_graph(5, 0.5, seed=1)", True),
+            ("x = nx.gnp_random_graph(5, 0.5)", False),
+            ("x = nx.random_layout(nx.path_graph(5))", False),
+        ]:
+            engine = Engine()
+            engine.watch_random_state()
+
+            # pylint: disable-next=exec-used
+            exec(code, {"__builtins__": engine.get_builtins(), "nx": networkx})
+            self.assertEqual(engine.is_deterministic(), deterministic, code)
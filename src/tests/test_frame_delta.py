@@ -0,0 +1,120 @@
+"""
+Tests for src/components/frame_delta.py
+"""
+
+import json
+import unittest
+import random
+from components.compact_layout import CompactLayout
+from components.encoder import Encoder
+from components.frame_delta import FrameDelta
+from engine.graph import Graph
+from engine.graph.di_graph import DiGraph
+from engine.ticker.frame import Frame
+
+
+class TestFrameDelta(unittest.TestCase):
+    """
+    Tests for src/components/frame_delta.py
+    """
+
+    def _random_frames(self, G):
+        """
+        Generates the frames of a randomly mutated graph with styled nodes and
+        edges
+        """
+        G.color_nodes_by(prop="value", colors={0: "red", 1: "blue", 2: "green"})
+        G.color_edges_by(lambda u, v, G: u < v)
+        G.label_nodes_by(props=["value"])
+
+        states = []
+
+        for _ in range(random.randint(100, 200)):
+            nodes = list(G.nodes)
+            opt = random.random()
+
+            if opt < 0.2 or len(nodes) < 2:
+                G.add_node(random.randint(0, 30))
+            elif opt < 0.3:
+                G.remove_node(random.choice(nodes))
+            elif opt < 0.5:
+                G.add_edge(*random.sample(nodes, 2))
+            else:
+                G.nodes[random.choice(nodes)]["value"] = random.randint(0, 3)
+
+            states.append(G.get_transformed_state())
+
+        G.interpret_transformed_state()
+
+        return [
+            Frame([i], "", [G.compute_style(state)]) for i, state in enumerate(states)
+        ]
+
+    @staticmethod
+    def _apply(components, delta):
+        """
+        Applies the decoded JSON delta to the decoded JSON components the way the
+        frontend does
+        """
+        components = json.loads(json.dumps(components))  # deep copy
+
+        def parent(path):
+            target = components
+
+            for key in path[:-1]:
+                target = target[key if isinstance(target, list) else str(key)]
+
+            key = path[-1]
+            return target, key if isinstance(target, list) else str(key)
+
+        for path, value in delta["set"]:
+            target, key = parent(path)
+            target[key] = value
+
+        for path in delta["unset"]:
+            target, key = parent(path)
+            del target[key]
+
+        return components
+
+    def test_round_trip(self):
+        """
+        Tests that the frames can be rebuilt from the keyframes and the deltas
+
+        conditions:
+          - the first frame and every KEYFRAME_INTERVAL-th frame is a keyframe
+          - applying the deltas gives the same components as the regular frames,
+            in the regular as well as in the compact layout
+          - the deltas are smaller than the frames
+        """
+        for G in (Graph(), DiGraph()):
+            frames = self._random_frames(G)
+
+            for layout in (None, CompactLayout()):
+                encoded = [
+                    frame if layout is None else layout.add_frame(frame)
+                    for frame in frames
+                ]
+                expected = json.loads(Encoder.encode(encoded))
+
+                delta = FrameDelta()
+                deltas = json.loads(
+                    Encoder.encode([delta.add_frame(frame) for frame in encoded])
+                )
+
+                components = None
+
+                for i, (frame, actual) in enumerate(zip(expected, deltas)):
+                    self.assertEqual(
+                        actual["keyframe"], i % FrameDelta.KEYFRAME_INTERVAL == 0
+                    )
+
+                    if actual["keyframe"]:
+                        components = actual["components"]
+                    else:
+                        components = self._apply(components, actual)
+
+                    self.assertEqual(components, frame["components"])
+                    self.assertEqual(actual["lineno"], frame["lineno"])
+
+                self.assertLess(len(json.dumps(deltas)), len(json.dumps(expected)))
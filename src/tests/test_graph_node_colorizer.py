@@ -9,6 +9,8 @@ import seaborn as sns
 from engine.color import Color
 from engine.graph import Graph
 from engine.graph.graph_colorizer import GraphNodeColorizer
+from engine.graph.unique_values import ValueCodes
+from engine.palettes import CONTINUOUS_PALETTES
 from utils.random_utils import random_name
 from utils.random_colors import random_color
 from exceptions import GraphColorizerException
@@ -273,6 +275,114 @@ class TestGraphNodeColorizer(unittest.TestCase):
             colorizer.transform(G), expected, "Lambda transformation using node ids"
         )
 
+    def test_coded_transformation(self):
+        """
+        Tests the transformation which stores the codes of the values
+
+        conditions:
+          - the codes must be decoded to the transformed values
+          - equal values must have equal codes
+          - the running aggregates must match the unique values
+          - the codes must be shared with another colorizer using the same codes
+        """
+        G = Graph()
+        prop = random_name()
+        codes = ValueCodes()
+        colorizer = GraphNodeColorizer.build(prop=prop)
+        colorizer.use_codes(codes)
+
+        props = {}
+        for i in range(random.randrange(500, 1000)):
+            if random.random() > 0.75:
+                props[i] = random.choice([random.randint(1, 100), random.random()])
+                G.add_node(i)
+                G.nodes[i][prop] = props[i]
+
+        transformed = colorizer.transform(G)
+
+        self.assertEqual(
+            {key: codes.decode(code) for key, code in transformed.items()}, props
+        )
+
+        for u, v in itertools.combinations(list(props)[:50], 2):
+            self.assertEqual(transformed[u] == transformed[v], props[u] == props[v])
+
+        uniq = set(props.values())
+        values = colorizer._unique_values  # pylint: disable=protected-access
+
+        self.assertEqual(set(values), uniq)
+        self.assertEqual(values.types, {type(x) for x in uniq})
+        self.assertEqual((values.lower, values.upper), (min(uniq), max(uniq)))
+
+        other = GraphNodeColorizer.build(prop=prop)
+        other.use_codes(codes)
+
+        self.assertEqual(other.transform(G), transformed)
+
+    def test_unique_values_limit(self):
+        """
+        Tests the transformation of more unique values than the limit
+
+        conditions:
+          - only the first MAX_VALUES unique values are kept, overflow is set
+          - the types and bounds include the values over the limit
+          - the codes of the values over the limit are still decoded
+        """
+        G = Graph()
+        prop = random_name()
+        codes = ValueCodes()
+        colorizer = GraphNodeColorizer.build(prop=prop)
+        colorizer.use_codes(codes)
+
+        values = colorizer._unique_values  # pylint: disable=protected-access
+        values.MAX_VALUES = 10
+
+        for i in range(50):
+            G.add_node(i)
+            G.nodes[i][prop] = float(i) if i < 40 else str(i)
+
+        transformed = colorizer.transform(G)
+
+        self.assertEqual(len(values), values.MAX_VALUES)
+        self.assertTrue(values.overflow)
+        self.assertEqual(values.types, {float, str})
+        self.assertEqual((values.lower, values.upper), (0.0, 39.0))
+        self.assertEqual(codes.decode(transformed[45]), "45")
+
+    def test_codes_of_equal_values(self):
+        """
+        Tests the codes of the values which are equal, but of different types
+
+        conditions:
+          - True, 1 and 1.0 have different codes
+          - the codes are decoded to the values of the original types
+          - the groups of such values have different colors
+        """
+        G = Graph()
+        prop = random_name()
+        values = [True, 1, 1.0, 2]
+        random.shuffle(values)
+
+        for v, value in enumerate(values):
+            G.add_node(v)
+            G.nodes[v][prop] = value
+
+        codes = ValueCodes()
+        colorizer = GraphNodeColorizer.build(
+            prop=prop, colors=["red", "green", "blue", "black"]
+        )
+        colorizer.use_codes(codes)
+
+        transformed = colorizer.transform(G)
+        self.assertEqual(len(set(transformed.values())), len(values))
+
+        for v, code in transformed.items():
+            self.assertIs(type(codes.decode(code)), type(values[v]))
+
+        colorizer.interpret()
+        colors = colorizer.compute(transformed)
+        self.assertEqual(len(set(colors.values())), len(values))
+
     #
     # Interpretation specified | ANCHOR
     #
@@ -782,5 +892,47 @@ class TestGraphNodeColorizer(unittest.TestCase):
 
     def test_compute_spectral_interpretation(self):
         """
-        todo: implement this test
+        Tests the computation of the colors when spectral interpretation is used
+
+        conditions:
+          - the lowest and the highest value get the ends of the palette
+          - the colors computed at once equal the colors computed one by one
+          - the colors are the same if the codes of the values are used
+          - None has no color, values which are not numbers have the false color
         """
+        G = Graph()
+        prop = random_name()
+
+        for i in range(random.randrange(50, 100)):
+            G.add_node(i)
+            G.nodes[i][prop] = random.choice([None, random.random() * 100])
+
+        G.nodes[0][prop], G.nodes[1][prop] = -1.5, 200.0
+
+        colorizer = GraphNodeColorizer.build(prop=prop)
+        coded = GraphNodeColorizer.build(prop=prop)
+        coded.use_codes(ValueCodes())
+
+        transformed = colorizer.transform(G)
+        transformed_codes = coded.transform(G)
+
+        colorizer.interpret()
+        coded.interpret()
+        self.assertTrue(colorizer.has_spectral_interpretation())
+
+        colors = colorizer.compute(transformed)
+        lut = CONTINUOUS_PALETTES[GraphNodeColorizer.DEFAULT_CONTINUOUS_PALETTE]
+
+        self.assertEqual((colors[0], colors[1]), (lut[0], lut[-1]))
+        self.assertEqual(
+            colors, {v: colorizer.compute_single(x) for v, x in transformed.items()}
+        )
+        self.assertEqual(coded.compute(transformed_codes), colors)
+
+        for v, value in transformed.items():
+            if value is None:
+                self.assertIsNone(colors[v])
+
+        self.assertEqual(
+            colorizer.compute_single("text"), GraphNodeColorizer.DEFAULT_FALSE_COLOR
+        )
@@ -0,0 +1,134 @@
+"""
+Tests for src/engine/graph/graph_tracker.py
+"""
+
+import unittest
+import random
+from engine.graph import Graph
+from engine.graph.di_graph import DiGraph
+
+
+class TestGraphTracker(unittest.TestCase):
+    """
+    Tests for src/engine/graph/graph_tracker.py
+    """
+
+    def test_mutations_are_tracked(self):
+        """
+        Tests that every kind of graph mutation increments the mutation counter
+
+        conditions:
+          - adding/removing nodes and edges is tracked
+          - writes via G.nodes[v][...], G.edges[u, v][...] and G.graph[...] are
+            tracked
+          - reads are not tracked
+        """
+        for cls in (Graph, DiGraph):
+            G = cls()
+            mutations = [
+                lambda G: G.add_node(1),
+                lambda G: G.add_edge(1, 2),
+                lambda G: G.add_edges_from([(2, 3), (3, 4)]),
+                lambda G: G.nodes[1].update({"x": 1}),
+                lambda G: G.nodes[2].__setitem__("x", 2),
+                lambda G: G.edges[1, 2].__setitem__("w", 1),
+                lambda G: G.edges[1, 2].pop("w"),
+                lambda G: G.graph.__setitem__("name", "G"),
+                lambda G: G.remove_edge(2, 3),
+                lambda G: G.remove_node(4),
+            ]
+
+            for mutate in mutations:
+                version = G._mutations.version  # pylint: disable=protected-access
+                mutate(G)
+                self.assertGreater(
+                    G._mutations.version, version  # pylint: disable=protected-access
+                )
+
+            version = G._mutations.version  # pylint: disable=protected-access
+            _ = [G.nodes[v].get("x") for v in G.nodes]
+            _ = list(G.edges(data=True))
+            self.assertEqual(
+                G._mutations.version, version  # pylint: disable=protected-access
+            )
+
+    def test_unchanged_state_is_reused(self):
+        """
+        Tests that the transformed state is reused if the graph and the declared
+        dependencies have not changed
+
+        conditions:
+          - the same state object is returned if nothing changed
+          - a new state is returned after a mutation or a change of dependencies
+          - the state is never reused if the dependencies were not declared
+        """
+        G = Graph()
+        G.add_edges_from([(i, i + 1) for i in range(20)])
+
+        observed = [0]
+        G.color_nodes_by(lambda v, G: v == observed[0], depends=lambda: observed[0])
+        G.label_nodes_by(props=["label"])
+
+        state = G.get_transformed_state()
+        self.assertIs(G.get_transformed_state(), state)
+
+        observed[0] = random.randint(1, 20)
+        changed = G.get_transformed_state()
+        self.assertIsNot(changed, state)
+        nodes = changed["nodes"]
+        colors = changed["transformed"]["node_colors"]
+        self.assertNotEqual(colors[nodes.index(observed[0])], colors[nodes.index(0)])
+
+        G.nodes[0]["label"] = "zero"
+        labeled = G.get_transformed_state()
+        self.assertIsNot(labeled, changed)
+        self.assertEqual(labeled["transformed"]["node_labels"][0], ["zero"])
+
+        G.color_nodes_by(lambda v, G: v == observed[0])
+        self.assertIsNot(G.get_transformed_state(), G.get_transformed_state())
+
+    def test_in_place_mutations(self):
+        """
+        Tests that the in-place mutations of the stored values and of the source
+        collections are not missed
+
+        conditions:
+          - a graph storing only immutable values is not volatile
+          - storing a mutable value makes the graph volatile
+          - the transformed state of a volatile graph is never reused
+          - the state follows an in-place mutation of a node attribute
+          - the state follows an in-place mutation of a source collection
+        """
+        G = Graph()
+        n = random.randint(2, 20)
+        G.add_nodes_from(range(n), dist=0, name=("a", 1))
+        self.assertFalse(G._mutations.volatile)  # pylint: disable=protected-access
+
+        G.nodes[0]["dist"] = []
+        self.assertTrue(G._mutations.volatile)  # pylint: disable=protected-access
+
+        for v in range(1, n):
+            G.nodes[v]["dist"] = []
+
+        G.color_nodes_by(lambda v, G: len(G.nodes[v]["dist"]) > 0, depends=None)
+        state = G.get_transformed_state()
+        self.assertTrue(G.has_visible_changes())
+
+        v = random.randrange(n)
+        G.nodes[v]["dist"].append(1)
+        changed = G.get_transformed_state()
+        self.assertIsNot(changed, state)
+        self.assertNotEqual(
+            changed["transformed"]["node_colors"],
+            state["transformed"]["node_colors"],
+        )
+
+        graph = Graph()
+        graph.add_nodes_from(range(n))
+        visited = []
+        graph.color_nodes_by(visited)
+        state = graph.get_transformed_state()
+        self.assertIs(graph.get_transformed_state(), state)
+
+        visited.append(v)
+        self.assertIsNot(graph.get_transformed_state(), state)
@@ -0,0 +1,164 @@
+"""
+Tests for src/components/job_store.py
+"""
+
+import os
+import json
+import time
+import random
+import threading
+import unittest
+from components.job_store import JobStore
+from components.encoder import Encoder
+
+
+class FakePool:
+    """
+    The worker pool which sends the specified frames once it is unblocked
+    """
+
+    def run(self, config, options=None, timeout=None):
+        """
+        Waits until the pool is unblocked and sends the frames of the config (or
+        raises if the config asks to fail), see WorkerPool.run
+        """
+        del options, timeout
+        self.event.wait()
+
+        if config.get("fail"):
+            raise Exception("failed")
+
+        return Encoder.encode({"res": "success", "frames": config["frames"]})
+
+    def __init__(self):
+        """
+        Creates a new instance of FakePool, blocked until the event is set
+        """
+        self.event = threading.Event()
+
+
+class TestJobStore(unittest.TestCase):
+    """
+    Tests for src/components/job_store.py
+    """
+
+    def _wait(self, store, job_id):
+        """
+        Waits until the job is finished and returns its status
+        """
+        deadline = time.monotonic() + 10
+
+        while store.get(job_id)["status"] != JobStore.STATUS_FINISHED:
+            if time.monotonic() > deadline:
+                self.fail("The job {} was not finished".format(job_id))
+
+            time.sleep(0.001)
+
+        return store.get(job_id)
+
+    def test_jobs(self):
+        """
+        Tests submitting, polling and fetching the jobs
+
+        conditions:
+          - the job is queued or running until the pool sends the response
+          - the unfinished jobs over the limit are rejected
+          - the whole response and a range of the frames can be fetched
+          - the exception of the pool is stored as the error response
+          - the oldest finished jobs are removed over the limit
+          - a missing job has no status nor result
+          - a job whose response has just been removed has no result
+          - at least one finished job must be kept
+        """
+        pool = FakePool()
+        store = JobStore(pool, max_jobs=2, max_pending=2, threads=1)
+        frames = [{"frame": i} for i in range(random.randint(3, 10))]
+
+        try:
+            job = store.submit({"frames": frames}, {})
+            failed = store.submit({"fail": True}, {})
+
+            self.assertIn(
+                job["status"], (JobStore.STATUS_QUEUED, JobStore.STATUS_RUNNING)
+            )
+            self.assertIsNone(job["frame_count"])
+            self.assertIsNone(store.get_result(job["job_id"]))
+            self.assertIsNone(store.submit({"frames": []}, {}))
+
+            pool.event.set()
+            job = self._wait(store, job["job_id"])
+
+            self.assertEqual(job["res"], "success")
+            self.assertEqual(job["frame_count"], len(frames))
+
+            result = json.loads(store.get_result(job["job_id"]))
+            self.assertEqual(result, {"res": "success", "frames": frames})
+
+            start = random.randint(0, len(frames) - 1)
+            result = json.loads(store.get_result(job["job_id"], start=start))
+            self.assertEqual(result["frames"], frames[start:])
+            self.assertEqual(result["frame_range"], [start, len(frames)])
+            self.assertEqual(result["frame_count"], len(frames))
+
+            result = json.loads(store.get_result(job["job_id"], stop=2))
+            self.assertEqual(result["frames"], frames[:2])
+
+            failed = self._wait(store, failed["job_id"])
+            self.assertEqual(failed["res"], "error")
+            self.assertEqual(failed["frame_count"], 0)
+
+            last = store.submit({"frames": []}, {})
+            self._wait(store, last["job_id"])
+            self.assertIsNotNone(store.get(failed["job_id"]))
+
+            self.assertIsNone(store.get(job["job_id"]))
+            self.assertIsNone(store.get_result(job["job_id"]))
+            self.assertIsNone(store.get("missing"))
+            self.assertIsNone(store.get_options("missing"))
+
+            # pylint: disable-next=protected-access
+            for path in store._paths(last["job_id"]):
+                os.remove(path)
+
+            self.assertIsNotNone(store.get(last["job_id"]))
+            self.assertIsNone(store.get_result(last["job_id"]))
+
+        finally:
+            pool.event.set()
+            store.close()
+
+        self.assertRaises(ValueError, JobStore, pool, 0, 1, 1)
+
+    def test_store_failure(self):
+        """
+        Tests the jobs whose responses cannot be stored
+
+        conditions:
+          - the job is finished as an error without a result
+          - the job is no longer pending, another job can be submitted
+          - the job can be removed over the limit of the finished jobs
+        """
+        pool = FakePool()
+        pool.event.set()
+        store = JobStore(pool, max_jobs=1, max_pending=1, threads=1)
+        store_response = store._store  # pylint: disable=protected-access
+
+        def fail(job_id, response):
+            raise OSError("No space left on device")
+
+        try:
+            store._store = fail  # pylint: disable=protected-access
+            job = self._wait(store, store.submit({"frames": [{}]}, {})["job_id"])
+
+            self.assertEqual(job["res"], "error")
+            self.assertEqual(job["frame_count"], 0)
+            self.assertIsNone(store.get_result(job["job_id"]))
+
+            store._store = store_response  # pylint: disable=protected-access
+            last = self._wait(store, store.submit({"frames": [{}]}, {})["job_id"])
+
+            self.assertEqual(last["res"], "success")
+            self.assertIsNone(store.get(job["job_id"]))
+
+        finally:
+            store.close()
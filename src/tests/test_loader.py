@@ -5,10 +5,21 @@ Tests for src/components/loader.py
 import unittest
 import random
 import os
+import importlib
+import linecache
 from components import Loader
+from components.code_cache import CodeCache
 from utils.path import resolve_url, path_from_root
 from utils.code import detect_indentation, get_sample_code
 from utils.random_utils import random_name
+from exceptions import LoaderException
+from environment import (
+    LOADER_MODE,
+    PRECOMPILE_MAX_SIZE,
+    MAX_TICKS,
+    MAX_FRAMES,
+    MAX_BYTES,
+)
 
 
 class TestLoader(unittest.TestCase):
@@ -47,15 +58,16 @@ class TestLoader(unittest.TestCase):
 
         return cfg
 
-    def _get_loader(self, uid=None):
+    def _get_loader(self, uid=None, mode=None):
         """
         Returns a loader with valid config. A unique ID can be specified but will
         be ignored by the Loader, because the secret was not specified
 
         parameters:
           - uid (str): the unique ID of the module
+          - mode (str): the mode of the loader, see Loader
         """
-        return Loader().set_input(self._get_cfg(uid))
+        return Loader(mode).set_input(self._get_cfg(uid))
 
     def _get_admin_loader(self, uid=None):
         """
@@ -120,6 +132,72 @@ class TestLoader(unittest.TestCase):
             self._get_loader(random_name(random.randint(10, 20))).parse_cfg()
             self._get_admin_loader(random_name(random.randint(10, 20))).parse_cfg()
 
+    def test_parse_cfg_sampling(self):
+        """
+        Tests the tick sampling properties of the config
+
+        conditions:
+          - the valid policy and budget are stored by the loader
+          - an unknown policy raises LoaderException
+          - a budget which is not a positive integer raises LoaderException
+        """
+        policies = ["line", "mutation", "style", "user", "budget"]
+
+        for _ in range(20):
+            cfg = self._get_cfg(None)
+            cfg["sampling"] = random.choice(policies)
+            cfg["sampling_budget"] = random.randint(1, 5000)
+
+            loader = Loader().set_input(cfg).parse_cfg()
+            self.assertEqual(loader.sampling, cfg["sampling"])
+            self.assertEqual(loader.sampling_budget, cfg["sampling_budget"])
+
+            for key, value in (
+                ("sampling", random_name(random.randint(5, 10))),
+                ("sampling_budget", random.choice([0, -1, 1.5, "100", True])),
+            ):
+                invalid = {**cfg, key: value}
+
+                with self.assertRaises(LoaderException):
+                    Loader().set_input(invalid).parse_cfg()
+
+    def test_parse_cfg_budgets(self):
+        """
+        Tests the budgets of the config
+
+        conditions:
+          - the budgets default to the limits of the environment
+          - a budget can be lowered but not raised above the limit
+          - a budget which is not a positive integer raises LoaderException
+        """
+        names = ["max_ticks", "max_frames", "max_bytes"]
+        limits = {
+            "max_ticks": MAX_TICKS,
+            "max_frames": MAX_FRAMES,
+            "max_bytes": MAX_BYTES,
+        }
+
+        for _ in range(20):
+            loader = self._get_loader().parse_cfg()
+
+            for name in names:
+                self.assertEqual(getattr(loader, name), limits[name])
+
+            name = random.choice(names)
+            value = random.randint(1, limits[name])
+            cfg = {**self._get_cfg(None), name: value}
+            self.assertEqual(getattr(Loader().set_input(cfg).parse_cfg(), name), value)
+
+            cfg[name] = limits[name] + random.randint(1, 100)
+            self.assertEqual(
+                getattr(Loader().set_input(cfg).parse_cfg(), name), limits[name]
+            )
+
+            cfg[name] = random.choice([0, -1, 1.5, "100", None])
+
+            with self.assertRaises(LoaderException):
+                Loader().set_input(cfg).parse_cfg()
+
     def test_prepare_code(self):
         """
         Tests whether the first line of the code is a wrapper functions definition
@@ -146,7 +224,7 @@ class TestLoader(unittest.TestCase):
 
             self.assertEqual(
                 lines[0],
-                "def {}(engine, print):".format(loader.unique_id),
+                "def {}(engine, print):".format(Loader.WRAPPER_NAME),
                 "The first line of the file should be a function definition",
             )
 
@@ -156,7 +234,7 @@ class TestLoader(unittest.TestCase):
 
     def test_create_module(self):
         """
-        Tests whether the crete_module method creates the module
+        Tests whether the crete_module method creates the module in the disk mode
 
         conditions:
           - module is in project root directory
@@ -164,7 +242,7 @@ class TestLoader(unittest.TestCase):
           - contents of the module file are correct
         """
         for _ in range(20):
-            loader = self._get_loader()
+            loader = self._get_loader(mode=Loader.MODE_DISK)
 
             loader.parse_cfg()
             loader.generate_name()
@@ -183,3 +261,108 @@ class TestLoader(unittest.TestCase):
             with open(loader.module_path, "r", encoding="utf8") as f:
                 code = loader._code  # pylint: disable=protected-access
                 self.assertEqual(f.read(), code, "File contents should be correct")
+
+            os.remove(loader.module_path)
+
+    def test_create_module_in_memory(self):
+        """
+        Tests whether the crete_module method creates the module in the memory
+        mode
+
+        conditions:
+          - no file is created
+          - the module can be imported and defines the wrapper function
+          - the lines of the module can be read by linecache
+          - the module cannot be imported once unloaded
+        """
+        for _ in range(20):
+            loader = self._get_loader(mode=Loader.MODE_MEMORY)
+            loader.load()
+
+            self.assertFalse(os.path.exists(loader.module_path))
+
+            module = importlib.import_module(loader.module_name)
+            fun = getattr(module, Loader.WRAPPER_NAME)
+            self.assertEqual(fun.__code__.co_filename, loader.module_path)
+
+            code = loader._code  # pylint: disable=protected-access
+            self.assertEqual(
+                linecache.getline(loader.module_path, 1), code.splitlines(True)[0]
+            )
+
+            loader.unload()
+
+            with self.assertRaises(ImportError):
+                importlib.import_module(loader.module_name)
+
+    def test_code_cache(self):
+        """
+        Tests whether the prepared code is reused for the same submitted code
+
+        conditions:
+          - the same code is compiled only once
+          - the modules of the same code are distinct
+        """
+        for _ in range(20):
+            cfg = self._get_cfg(None)
+            cfg["code"] += "\n# {}".format(random_name())  # Not cached yet
+
+            first = Loader(Loader.MODE_MEMORY).set_input(cfg).load()
+            second = Loader(Loader.MODE_MEMORY).set_input(dict(cfg)).load()
+
+            # pylint: disable=protected-access
+            self.assertIs(second._compiled, first._compiled)
+
+            self.assertNotEqual(first.module_name, second.module_name)
+            self.assertIsNot(
+                importlib.import_module(first.module_name),
+                importlib.import_module(second.module_name),
+            )
+
+            first.unload()
+            second.unload()
+
+    def test_precompile(self):
+        """
+        Tests whether the code compiled by the server can be loaded by a worker
+
+        conditions:
+          - the code is keyed by the hash of the submitted code
+          - the loader uses the loaded code instead of compiling it again
+          - nothing is compiled for an invalid code or config
+          - nothing is compiled for a code longer than PRECOMPILE_MAX_SIZE
+        """
+        for _ in range(20):
+            cfg = self._get_cfg(None)
+            cfg["code"] += "\n# {}".format(random_name())  # Not cached yet
+
+            dumped = Loader.precompile(cfg)
+
+            if LOADER_MODE != Loader.MODE_MEMORY:
+                self.assertIsNone(dumped)
+                continue
+
+            key, source, _ = dumped
+            self.assertEqual(key, CodeCache.key(cfg["code"]))
+
+            worker_cache = CodeCache(10)
+            worker_cache.load(dumped)
+            compiled = worker_cache.get(key)[1]
+            Loader.code_cache.load(dumped)
+
+            loader = Loader(Loader.MODE_MEMORY).set_input(cfg).load()
+            code = loader._code  # pylint: disable=protected-access
+            self.assertEqual(code, source)
+            self.assertEqual(
+                loader._compiled, compiled  # pylint: disable=protected-access
+            )
+            self.assertEqual(loader.module_path, compiled.co_filename)
+
+            loader.unload()
+
+        for cfg in ({"code": "x = (1"}, {"code": 1}, {"code": ""}, {}, None):
+            self.assertIsNone(Loader.precompile(cfg))
+
+        cfg = self._get_cfg(None)
+        cfg["code"] += "\n#" + "x" * PRECOMPILE_MAX_SIZE
+        self.assertIsNone(Loader.precompile(cfg))
@@ -0,0 +1,48 @@
+"""
+Tests for src/engine/palettes.py
+"""
+
+import unittest
+import random
+import seaborn as sns
+from engine.color import Color
+from engine.palettes import SPECTRAL_LUT, hls_palette
+
+
+class TestPalettes(unittest.TestCase):
+    """
+    Tests for src/engine/palettes.py
+    """
+
+    def test_spectral_lut(self):
+        """
+        Tests the sampled Spectral palette
+
+        conditions:
+          - the palette is the same as the Spectral palette of seaborn with 256
+            colors
+        """
+        palette = sns.color_palette("Spectral", len(SPECTRAL_LUT))
+
+        self.assertEqual(len(SPECTRAL_LUT), 256)
+        self.assertEqual(
+            list(SPECTRAL_LUT), [Color(tuple(color)).to_hex() for color in palette]
+        )
+
+    def test_hls_palette(self):
+        """
+        Tests the palette of evenly spaced hues
+
+        conditions:
+          - the palette is the same as the hls palette of seaborn for any number
+            of colors
+        """
+        for n in [1, 2, 5, 8, 13] + random.sample(range(14, 100), 5):
+            palette = hls_palette(n)
+            expected = sns.hls_palette(n)
+
+            self.assertEqual(len(palette), n)
+
+            for color, expected_color in zip(palette, expected):
+                for channel, expected_channel in zip(color, expected_color):
+                    self.assertAlmostEqual(channel, expected_channel, 7)
@@ -0,0 +1,79 @@
+"""
+Tests for src/components/result_cache.py
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from components.result_cache import ResultCache
+from utils.code import get_sample_code
+
+
+class TestResultCache(unittest.TestCase):
+    """
+    Tests for src/components/result_cache.py
+    """
+
+    def test_key(self):
+        """
+        Tests the keys of the responses
+
+        conditions:
+          - the same config and options have the same key
+          - a different config or different options have a different key
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(directory, 1024)
+            config = {"code": get_sample_code(random.randint(1, 5) * 2)}
+            options = {"compact": False, "delta": False}
+
+            key = cache.key(config, options)
+
+            self.assertEqual(cache.key(dict(config), dict(options)), key)
+            self.assertNotEqual(cache.key({**config, "max_ticks": 10}, options), key)
+            self.assertNotEqual(cache.key(config, {**options, "delta": True}), key)
+
+    def test_get_and_put(self):
+        """
+        Tests caching of the responses
+
+        conditions:
+          - a missing response is None
+          - a cached response is returned as it was put
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(directory, 1024)
+            response = os.urandom(random.randint(1, 100))
+
+            self.assertIsNone(cache.get("key"))
+
+            cache.put("key", response)
+            self.assertEqual(cache.get("key"), response)
+
+    def test_eviction(self):
+        """
+        Tests the eviction of the least recently used responses
+
+        conditions:
+          - the size of the cached responses never exceeds the limit
+          - the recently used responses are kept
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            size = random.randint(5, 10)
+            cache = ResultCache(directory, 100 * size)
+
+            for i in range(size):
+                cache.put(str(i), bytes(100))
+                os.utime(os.path.join(directory, "{}.json".format(i)), (i, i))
+
+            cache.get("0")
+            cache.put("new", bytes(100))
+
+            self.assertIsNotNone(cache.get("0"))
+            self.assertIsNone(cache.get("1"))
+            self.assertIsNotNone(cache.get("new"))
+            self.assertLessEqual(
+                sum(entry.stat().st_size for entry in os.scandir(directory)),
+                100 * size,
+            )
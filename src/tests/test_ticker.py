@@ -0,0 +1,222 @@
+"""
+Tests for src/engine/ticker/ticker.py
+"""
+
+import unittest
+import random
+from engine.graph import Graph
+from engine.ticker import Ticker
+from engine.ticker.state_delta import StateDelta
+from engine.ticker.frame import Frame
+from engine.ticker.tick import Tick
+
+
+class TestTicker(unittest.TestCase):
+    """
+    Tests for src/engine/ticker/ticker.py
+    """
+
+    def _random_step(self, G):
+        """
+        Randomly mutates the specified graph - adds or removes a node or an edge
+        or changes the value of a node property
+        """
+        nodes = list(G.nodes)
+        opt = random.random()
+
+        if opt < 0.2 or len(nodes) < 2:
+            G.add_node(random.randint(0, 50))
+
+        elif opt < 0.3:
+            G.remove_node(random.choice(nodes))
+
+        elif opt < 0.5:
+            G.add_edge(*random.sample(nodes, 2))
+
+        elif opt < 0.6 and G.edges:
+            G.remove_edge(*random.choice(list(G.edges)))
+
+        else:
+            G.nodes[random.choice(nodes)]["value"] = random.randint(0, 3)
+
+    def test_state_delta(self):
+        """
+        Tests StateDelta by applying the delta of two random states
+
+        conditions:
+          - applying the delta to the previous state results in the current state
+          - the delta is falsy if and only if the states are equal
+        """
+        G = Graph()
+        G.color_nodes_by(prop="value")
+        G.label_edges_by(lambda u, v, G: u + v)
+
+        prev = None
+
+        for _ in range(500):
+            self._random_step(G)
+            curr = G.get_transformed_state()
+            delta = StateDelta.diff(prev, curr)
+
+            self.assertEqual(delta.apply(prev), curr)
+            self.assertEqual(bool(delta), prev != curr)
+
+            prev = curr
+
+    def test_restore_ticks(self):
+        """
+        Tests that the ticks stored by the ticker can be restored
+
+        conditions:
+          - the restored ticks have the same states as the ticks which were stored
+          - neighbouring ticks with the same states are not stored
+          - ticks with no states (empty graph) are not stored
+        """
+        G = Graph()
+        G.color_nodes_by(prop="value")
+
+        ticker = Ticker()
+        expected = []
+
+        for i in range(2 * Ticker.KEYFRAME_INTERVAL + 50):
+            if random.random() > 0.5:
+                self._random_step(G)
+
+            state = G.get_transformed_state()
+
+            if state is not None and (not expected or expected[-1] != state):
+                expected.append(state)
+
+            ticker.tick(source=0, lineno=i, console_logs="", components=[(G, state)])
+
+        restored = [tick.components[0][1] for tick in ticker.restore_ticks()]
+
+        self.assertEqual(restored, expected)
+
+    def test_online_frames(self):
+        """
+        Tests that the frames made during the run are the same as the frames made
+        from the stored ticks
+
+        conditions:
+          - the frames are equal, incl. the merged line numbers and console logs
+          - no ticks are stored while the style can be computed right away
+          - the ticks are stored once a stylizer has to be interpreted at the end
+          - the frames yielded one by one are final (not merged afterwards)
+        """
+        G = Graph()
+        G.color_nodes_by(prop="value", colors={0: "red", 1: "blue", 2: "green"})
+        G.shape_edges_by(lambda u, v, G: u < v, shape="dotted")
+        G.label_nodes_by(props=["value"])
+
+        online = Ticker(keep_ticks=False)
+        stored = Ticker()
+
+        for i in range(300):
+            if i == 150:
+                G.color_edges_by(lambda u, v, G: u + v)
+                self.assertEqual(online.ticks, [])
+
+            if random.random() > 0.5:
+                self._random_step(G)
+
+            console_logs = "log" if random.random() > 0.8 else ""
+            components = [(G, G.get_transformed_state())]
+
+            online.tick(0, i, console_logs, components)
+            stored.tick(0, i, console_logs, components)
+
+        G.interpret_transformed_state()
+
+        self.assertGreater(len(online.ticks), 0)
+        self.assertLess(len(online.ticks), len(stored.ticks))
+        self.assertEqual(
+            [dict(frame) for frame in online.to_frames()],
+            [dict(frame) for frame in stored.to_frames()],
+        )
+        self.assertEqual(
+            [dict(frame) for frame in online.iter_frames()],
+            [dict(frame) for frame in stored.to_frames()],
+        )
+
+    def test_online_stylizer_change(self):
+        """
+        Tests the style of the frames made during the run when a stylizer is
+        replaced
+
+        conditions:
+          - replacing a default stylizer does not change the frames - they are
+            the same whether the ticks are kept or not
+          - the ticks are stored once a stylizer set by the algorithm is replaced
+          - the frames made from the stored ticks all have the style of the last
+            stylizers (and so they are merged)
+        """
+
+        def colors(ticker):
+            return [
+                {
+                    color and color.to_hex()
+                    for color in frame.components[0]["style"]["node_colors"].values()
+                }
+                for frame in ticker.to_frames()
+            ]
+
+        G = Graph()
+        G.add_nodes_from(range(random.randint(1, 10)))
+
+        online = Ticker(keep_ticks=False)
+        stored = Ticker()
+
+        for i, color in enumerate((None, "red", "blue", "green")):
+            if color is not None:
+                G.color_nodes_by(lambda v, G: True, color=color)
+
+            components = [(G, G.get_transformed_state())]
+
+            online.tick(0, i, "log", components)
+            stored.tick(0, i, "log", components)
+
+            if i == 1:
+                self.assertEqual(online.ticks, [])
+                self.assertEqual(colors(online), colors(stored))
+
+        G.interpret_transformed_state()
+        self.assertEqual(len(online.ticks), 2)
+
+        self.assertEqual(colors(online), [{None}, {"#ff0000ff"}, {"#008000ff"}])
+        self.assertEqual(colors(stored), [{None}, {"#008000ff"}])
+
+    def test_frame_fingerprint(self):
+        """
+        Tests the fingerprints of the frames made from the ticks
+
+        conditions:
+          - the fingerprint is the same as the one computed from the components
+          - equal frames have equal fingerprints
+          - frames with different fingerprints are not equal
+        """
+        G = Graph()
+        G.color_nodes_by(prop="value", colors={0: "red", 1: "blue", 2: "green"})
+        G.shape_edges_by(lambda u, v, G: u < v, shape="dotted")
+        G.label_nodes_by(props=["value"])
+
+        prev = None
+
+        for i in range(300):
+            if random.random() > 0.5:
+                self._random_step(G)
+
+            tick = Tick(i, 0, i, "", [(G, G.get_transformed_state())])
+            frame = tick.to_frame()
+            fresh = Frame(frame.lineno, "", frame.components)
+
+            self.assertEqual(frame.get_fingerprint(), fresh.get_fingerprint())
+
+            if prev is not None:
+                equal = [dict(c) for c in prev.components] == frame.components
+                self.assertEqual(prev == frame, equal)
+
+                if equal:
+                    self.assertEqual(prev.get_fingerprint(), frame.get_fingerprint())
+
+            prev = frame
@@ -0,0 +1,77 @@
+"""
+Tests for src/components/tracer.py
+"""
+
+import unittest
+import inspect
+from components.tracer import Tracer, MonitoringTracer
+
+
+def _traced(n):
+    """
+    A sample function to trace
+    """
+    total = 0
+
+    def add(x):
+        return total + x
+
+    for i in range(n):
+        total = add(i)
+
+    return total
+
+
+class TestTracer(unittest.TestCase):
+    """
+    Tests for src/components/tracer.py
+    """
+
+    def _backends(self):
+        """
+        Returns the backends available in the current interpreter
+        """
+        backends = [Tracer.BACKEND_HUNTER]
+
+        if MonitoringTracer.is_available():
+            backends.append(Tracer.BACKEND_MONITORING)
+
+        return backends
+
+    def test_traced_lines(self):
+        """
+        Tests that all backends report the same lines
+
+        conditions:
+          - the lines of the function and the nested functions are reported
+          - no lines are reported after the tracer was stopped
+        """
+        first_line = _traced.__code__.co_firstlineno
+        length = len(inspect.getsourcelines(_traced)[0])
+        results = []
+
+        for backend in self._backends():
+            lines = []
+            tracer = Tracer.create(
+                lambda event, lines=lines: lines.append(event.lineno), backend
+            )
+
+            tracer.start(_traced)
+            _traced(3)
+            tracer.stop()
+            _traced(3)
+
+            # Hunter traces the whole module - ignore the lines of this test
+            lines = [line - first_line for line in lines]
+            results.append([line for line in lines if 0 <= line < length])
+
+        for lines in results:
+            self.assertEqual(lines, results[0])
+            self.assertIn(7, lines)  # the body of the nested function
+
+    def test_unknown_backend(self):
+        """
+        Tests that an unknown backend is refused
+        """
+        with self.assertRaises(Exception):
+            Tracer.create(lambda event: None, "unknown")
@@ -0,0 +1,50 @@
+"""
+Tests for src/engine/graph/transformed_column.py
+"""
+
+import unittest
+import random
+from engine.graph import Graph
+from engine.graph.di_graph import DiGraph
+from engine.graph.transformed_column import TransformedColumn
+
+
+class TestTransformedColumn(unittest.TestCase):
+    """
+    Tests for src/engine/graph/transformed_column.py
+    """
+
+    def test_round_trip(self):
+        """
+        Tests that the transformed states of the node and edge stylizers can be
+        turned into columns and back
+
+        conditions:
+          - the node state is the same after the round trip, incl. the order
+          - the edge state is the same after the round trip, incl. the order
+          - None values are preserved
+        """
+        for G in (Graph(), DiGraph()):
+            for _ in range(random.randint(50, 200)):
+                G.add_edge(random.randint(0, 50), random.randint(0, 50))
+
+            nodes = list(G.nodes)
+            edges = list(G.edges)
+
+            node_state = {
+                v: random.choice([None, random.randint(0, 100)]) for v in nodes
+            }
+            edge_state = {}
+            for u, v in edges:
+                edge_state.setdefault(u, {})[v] = random.choice([None, 1, 2])
+
+            column = TransformedColumn.from_nodes(node_state)
+            restored = TransformedColumn.to_nodes(column, nodes)
+            self.assertEqual(list(restored.items()), list(node_state.items()))
+
+            column = TransformedColumn.from_edges(edge_state, G.edges)
+            restored = TransformedColumn.to_edges(column, edges)
+            self.assertEqual(
+                [(u, list(vs.items())) for u, vs in restored.items()],
+                [(u, list(vs.items())) for u, vs in edge_state.items()],
+            )
@@ -0,0 +1,137 @@
+"""
+Tests for src/components/worker_pool.py
+"""
+
+import os
+import json
+import random
+import tempfile
+import time
+import unittest
+from components.result_cache import ResultCache
+from components.worker_pool import TIME_LIMIT_MESSAGE, Worker, WorkerPool
+from exceptions import PoolBusyException
+from utils.code import get_sample_code
+
+
+class SlowConnection:
+    """
+    The parent end of the pipe of a worker which sends a chunk every 50 ms
+    """
+
+    def poll(self, timeout):
+        """
+        Waits for the next chunk, see Connection.poll
+        """
+        time.sleep(min(timeout, 0.05))
+        return timeout >= 0.05
+
+    def recv_bytes(self):
+        """
+        Returns the next chunk, see Connection.recv_bytes
+        """
+        return b"chunk"
+
+
+class TestWorkerPool(unittest.TestCase):
+    """
+    Tests for src/components/worker_pool.py
+    """
+
+    def test_run_and_recycle(self):
+        """
+        Tests running the algorithms in the pool
+
+        conditions:
+          - the algorithm is run by a worker and the response is returned
+          - a worker which has run `max_runs` algorithms is replaced
+          - a run which waits for a worker too long is rejected
+        """
+        pool = WorkerPool(
+            size=1,
+            max_runs=1,
+            max_memory_mb=1024,
+            max_execution_time=10,
+            wait_timeout=10,
+            preload=("components",),
+        )
+        config = {"code": get_sample_code(random.randint(1, 5) * 2)}
+
+        response = json.loads(pool.run(config))
+        self.assertEqual(response["res"], "success")
+
+        worker = pool._take()  # pylint: disable=protected-access
+        self.assertEqual(worker.runs, 0)
+
+        pool._wait_timeout = 0.1  # pylint: disable=protected-access
+        self.assertRaises(PoolBusyException, pool.run, config)
+
+        worker.stop()
+
+    def test_result_cache(self):
+        """
+        Tests caching of the responses by the pool
+
+        conditions:
+          - the responses of the runs which do not opt in are not cached
+          - the responses of a nondeterministic run or with an address of an
+            object are not cached
+          - the response of a deterministic run is cached if the run opts in
+          - the cached response is sent without taking a worker
+          - only the first run of a worker is cached
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            pool = WorkerPool(
+                size=1,
+                max_runs=1,
+                max_memory_mb=1024,
+                max_execution_time=10,
+                result_cache=ResultCache(directory, 1024 * 1024),
+                preload=("components",),
+            )
+            code = get_sample_code(random.randint(1, 5) * 2)
+
+            for config, cache in (
+                ({"code": code + "\n# 1"}, False),
+                ({"code": "import random\nx = random.random()"}, True),
+                ({"code": "x = __import__('networkx').gnp_random_graph(5, 0.5)"}, True),
+                ({"code": "print(object())"}, True),
+            ):
+                pool.run(config, cache=cache)
+                self.assertEqual(os.listdir(directory), [])
+
+            config = {"code": code + "\n# 2"}
+            response = pool.run(config, cache=True)
+            self.assertEqual(len(os.listdir(directory)), 1)
+
+            worker = pool._take()  # pylint: disable=protected-access
+            self.assertEqual(pool.run(config, cache=True), response)
+
+            # pylint: disable=protected-access
+            pool._max_runs = 2
+            pool._release(worker)
+
+            pool.run({"code": code + "\n# 3"}, cache=True)
+            pool.run({"code": code + "\n# 4"}, cache=True)
+            self.assertEqual(len(os.listdir(directory)), 2)
+
+    def test_deadline(self):
+        """
+        Tests the time limit of the whole run
+
+        conditions:
+          - the worker which sends every chunk in time is stopped once the time
+            limit of the run is exceeded
+        """
+        worker = Worker.__new__(Worker)
+        worker._conn = SlowConnection()  # pylint: disable=protected-access
+        worker.stop = lambda: None
+
+        start = time.monotonic()
+        worker._deadline = start + 0.3  # pylint: disable=protected-access
+
+        with self.assertRaises(Exception) as context:
+            list(worker._receive())  # pylint: disable=protected-access
+
+        self.assertEqual(str(context.exception), TIME_LIMIT_MESSAGE)
+        self.assertLess(time.monotonic() - start, 0.45)
@@ -1,7 +1,7 @@
-import black
-
-
 def format_code(code: str) -> str:
+    # Black is imported on the first use only - it is not needed to run the code
+    import black  # pylint: disable=import-outside-toplevel
+
     try:
         # Format with Black
         formatted = black.format_str(code, mode=black.FileMode(line_length=60))